@@ -1,9 +1,11 @@
 # app.py
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 from src.theme import LOGOS_PATH
 from src.theme import inject_streamlit_theme
+import pandas as pd
+from src.ingest import CSV_CHUNKED_MIN_BYTES
+from src.dataset_store import open_dataset
 from ui.header import render_header
 
 # =========================================================
@@ -45,29 +47,76 @@ st.markdown(
     """
 )
 
+# =========================================================
+# LECTURA POR BLOQUES (CSV grandes): preview + progreso en vivo
+# =========================================================
+def csv_chunk_ui(nombre: str):
+    """Devuelve (on_chunk, progreso, preview) para src.dataset_store.open_dataset."""
+    progreso = st.progress(0.0, text=f"Leyendo {nombre}…")
+    preview = st.empty()
+    estado = {"primero": True}
+
+    def on_chunk(chunk: pd.DataFrame, frac: float, filas: int):
+        if estado["primero"]:
+            estado["primero"] = False
+            with preview.container():
+                st.markdown("### 👀 Vista previa (primer bloque)")
+                st.dataframe(chunk.head(50), use_container_width=True)
+                st.dataframe(
+                    pd.DataFrame({
+                        "columna": chunk.columns,
+                        "tipo": chunk.dtypes.astype(str).values,
+                        "% nulos": (chunk.isna().mean() * 100).round(1).values,
+                    }),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+        progreso.progress(frac, text=f"Leyendo {nombre}… {filas:,} filas")
+
+    return on_chunk, progreso, preview
+
+
 archivo = st.file_uploader(
     "Seleccioná un archivo",
     type=["xlsx", "csv", "parquet"],
 )
 
+compactar = st.checkbox(
+    "⚙️ Optimizar memoria (texto repetido → categorías, KPIs → float32)",
+    value=False,   # opcional: los KPIs quedan en float64 salvo que se pida
+    key="ingest_compact",
+)
+
 if archivo is not None:
     try:
-        # ---------- LECTURA ----------
-        if archivo.name.endswith(".xlsx"):
-            df = pd.read_excel(archivo)
-        elif archivo.name.endswith(".csv"):
-            df = pd.read_csv(archivo)
-        elif archivo.name.endswith(".parquet"):
-            df = pd.read_parquet(archivo)
+        # ---------- LECTURA (registro compartido → caché en disco) ----------
+        if archivo.name.lower().endswith(".csv") and archivo.size > CSV_CHUNKED_MIN_BYTES:
+            on_chunk, progreso, preview = csv_chunk_ui(archivo.name)
+            df, df_key, info = open_dataset(archivo, on_chunk=on_chunk, compact=compactar)
+            progreso.empty()
+            preview.empty()
         else:
-            st.error("Formato no soportado.")
-            st.stop()
+            df, df_key, info = open_dataset(archivo, compact=compactar)
 
         # ---------- SESSION STATE ----------
+        # la sesión apunta al frame compartido (solo lectura, sin copia propia)
         st.session_state["df"] = df
         st.session_state["df_name"] = archivo.name
+        st.session_state["df_key"] = df_key
 
         st.success("✅ Base de datos cargada correctamente")
+        if info["compartido"]:
+            st.caption(f"👥 Ya estaba en memoria: compartida por {info['sesiones']} sesiones.")
+        elif info["desde_cache"]:
+            st.caption("⚡ Servida desde la caché local (mismo archivo ya cargado antes).")
+
+        reporte = info["reporte"]
+        if reporte is not None:
+            st.caption(
+                f"⚙️ Memoria optimizada: {reporte['mb_antes']:.1f} MB → {reporte['mb_despues']:.1f} MB "
+                f"({len(reporte['categoricas'])} columnas a categoría, "
+                f"{len(reporte['float32'])} a float32, {len(reporte['enteros'])} enteros reducidos)"
+            )
 
         st.markdown("### 📊 Resumen rápido")
         col1, col2, col3 = st.columns(3)
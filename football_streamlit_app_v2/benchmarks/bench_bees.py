@@ -0,0 +1,137 @@
+# benchmarks/bench_bees.py
+"""
+Benchmark del render de bees: seaborn vs renderer nativo.
+
+Uso (desde football_streamlit_app_v2/):
+    python benchmarks/bench_bees.py
+    python benchmarks/bench_bees.py --rows 2000 10000 --metrics 6 24 --out /tmp/bees
+
+Mide, con datos sintéticos (todo incluye el dibujo: el swarm nativo
+calcula su layout recién al dibujar):
+- strip: stripplot de seaborn vs strip nativo (swarm_max=0), por métrica
+- swarm: swarmplot de seaborn vs swarm nativo (charts/swarm.py) con
+  savefig y la caché de layouts vacía; solo hasta --swarm-rows filas
+  (swarmplot es cuadrático)
+- grilla: beeswarm_grid completo con la config por defecto de cada
+  renderer (SWARM_THRESHOLD / SWARM_MAX_POINTS deciden swarm o strip)
+Con --out guarda un PNG de grilla por renderer para compararlos a ojo.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from charts.bees import DEFAULT_PALETTE, _plot_bees, beeswarm_grid, classify_bands  # noqa: E402
+from charts.swarm import clear_swarm_cache  # noqa: E402
+
+RENDERERS = ("seaborn", "native")
+NO_LIMIT = sys.maxsize
+
+
+def make_population(rows: int, metrics: int, seed: int = 0) -> pd.DataFrame:
+    """Población sintética: KPIs con colas (gamma) y algunos nulos."""
+    rng = np.random.default_rng(seed)
+    data = {"Jugador": [f"Jugador {i}" for i in range(rows)]}
+    for m in range(metrics):
+        v = rng.gamma(shape=2.0 + m % 3, scale=1.0 + m % 5, size=rows)
+        v[rng.random(rows) < 0.02] = np.nan
+        data[f"KPI {m + 1}/90"] = v
+    return pd.DataFrame(data)
+
+
+def _auxs(df: pd.DataFrame):
+    metrics = [c for c in df.columns if c != "Jugador"]
+    bands, _ = classify_bands(df, metrics, set())
+    return [
+        pd.DataFrame({"valor": df[m].to_numpy(), "color": bands[m]}).dropna()
+        for m in metrics
+    ]
+
+
+def time_points(df: pd.DataFrame, renderer: str, repeat: int, swarm: bool) -> float:
+    """
+    Segundos de _plot_bees + savefig, un eje por métrica (mejor de repeat).
+    swarm=False fuerza strip en los dos renderers; swarm=True fuerza swarm.
+    """
+    limit = NO_LIMIT if swarm else 0
+    auxs = _auxs(df)
+
+    best = float("inf")
+    for _ in range(repeat):
+        clear_swarm_cache()
+        t0 = time.perf_counter()
+        for aux in auxs:
+            fig, ax = plt.subplots(figsize=(6, 3.2))
+            _plot_bees(ax, aux, DEFAULT_PALETTE, renderer=renderer, threshold=limit, swarm_max=limit)
+            fig.savefig(io.BytesIO(), format="png", dpi=100)
+            plt.close(fig)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def time_render(df: pd.DataFrame, renderer: str, repeat: int, out: Path | None) -> float:
+    metrics = [c for c in df.columns if c != "Jugador"]
+    best = float("inf")
+    for _ in range(repeat):
+        clear_swarm_cache()
+        t0 = time.perf_counter()
+        fig = beeswarm_grid(df, metrics, player=["Jugador 1", "Jugador 2"], renderer=renderer)
+        target = out / f"bees_{renderer}_{len(df)}x{len(metrics)}.png" if out else io.BytesIO()
+        fig.savefig(target, format="png", dpi=100)
+        best = min(best, time.perf_counter() - t0)
+        plt.close(fig)
+    return best
+
+
+def _cols(t: dict | None) -> str:
+    if t is None:
+        return f"{'-':>10} {'-':>10} {'-':>5}"
+    return f"{t['seaborn']:>10.2f} {t['native']:>10.2f} {t['seaborn'] / t['native']:>5.1f}"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, nargs="+", default=[1000, 5000, 20000])
+    ap.add_argument("--metrics", type=int, nargs="+", default=[6, 24])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--swarm-rows", type=int, default=2000, help="máximo de filas para la columna swarm")
+    ap.add_argument("--out", type=Path, default=None, help="carpeta para guardar los PNG")
+    args = ap.parse_args()
+
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+
+    # swarmplot avisa por cada punto que no entra: no interesa acá
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    head = f"{'seaborn':>10} {'nativo':>10} {'x':>5}"
+    print(f"{'':>8} {'':>9}  {'------ strip (s) ------':>27}  {'------ swarm (s) ------':>27}  {'------ grilla (s) -----':>27}")
+    print(f"{'filas':>8} {'métricas':>9}  {head}  {head}  {head}")
+    for rows in args.rows:
+        for metrics in args.metrics:
+            df = make_population(rows, metrics)
+            s = {r: time_points(df, r, args.repeat, swarm=False) for r in RENDERERS}
+            w = (
+                {r: time_points(df, r, args.repeat, swarm=True) for r in RENDERERS}
+                if rows <= args.swarm_rows else None
+            )
+            g = {r: time_render(df, r, args.repeat, args.out) for r in RENDERERS}
+            print(f"{rows:>8} {metrics:>9}  {_cols(s)}  {_cols(w)}  {_cols(g)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from typing import Sequence, Optional, List, Union, Set
+from typing import Sequence, Optional, List, Tuple, Union, Set
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.colors import to_rgba_array
 from matplotlib.patches import FancyArrowPatch
 from matplotlib.font_manager import FontProperties
 
+from charts.swarm import swarm_scatter
+from src.figures import new_figure, subplots
+from src.player_index import player_index
+from src.stats import population_stats
+from src.theme import BG_DARK, FG_LIGHT, target_bg
+
 # =========================================================
 # ESTILO GLOBAL
 # =========================================================
-BG = "#191919"   # fondo visible en preview / copy-paste
-FG = "white"
+BG = BG_DARK    # fondo visible en preview / copy-paste (render_target="export" → transparente)
+FG = FG_LIGHT
 
 # =========================================================
 # PALETA BASE
@@ -24,6 +30,7 @@ DEFAULT_PALETTE = {
     "verde": "limegreen",
     "gris": "gray",
     "naranja": "#FB8E4B",
+    "verde_claro": "yellowgreen",
 }
 
 DEFAULT_HILITE_COLORS = [
@@ -33,8 +40,51 @@ DEFAULT_HILITE_COLORS = [
     "#e74c3c",  # rojo
 ]
 
+SWARM_THRESHOLD = 150      # 🔧 renderer "seaborn": hasta acá swarmplot, arriba strip
+SWARM_MAX_POINTS = 10_000  # 🔧 renderer "native": hasta acá swarm (charts/swarm.py), arriba strip
+BEES_RENDERER = "native"   # 🔧 "native" (NumPy + un scatter) | "seaborn" (swarmplot/stripplot)
+JITTER_SEED = 0            # 🔧 jitter reproducible (mismo input → misma imagen)
+
 # =========================================================
-# BASE PLOT (stripplot estable)
+# RENDER NATIVO (NumPy + un solo scatter)
+# =========================================================
+def _band_colors(bands: np.ndarray, palette: dict) -> np.ndarray:
+    """Label de banda por punto → RGBA (se resuelve una vez por label)."""
+    labels, codes = np.unique(np.asarray(bands, dtype=object).astype(str), return_inverse=True)
+    return to_rgba_array([palette.get(lb, palette.get("gris", "gray")) for lb in labels])[codes]
+
+
+def _categorical_axis(ax):
+    """Lo que seaborn deja hecho en el eje categórico (una sola categoría)."""
+    ax.yaxis.grid(False)
+    ax.set_ylim(0.5, -0.5)
+
+
+def _strip_native(
+    ax,
+    values: np.ndarray,
+    colors: np.ndarray,
+    size: float,
+    jitter: float,
+    alpha: float = 0.85,
+    seed: Optional[int] = JITTER_SEED,
+):
+    """
+    Mismo dibujo que sns.stripplot(orient="h") con una sola categoría:
+    y = uniforme(-jitter, +jitter) alrededor de 0, markersize = size
+    (s = size²), sin borde. Todos los puntos van en un único PathCollection
+    con un color por punto (mismo orden que seaborn).
+    """
+    n = len(values)
+    rng = np.random.default_rng(seed)
+    y = rng.uniform(-jitter, jitter, size=n) if n > 1 else np.zeros(n)
+
+    ax.scatter(values, y, c=colors, s=size ** 2, alpha=alpha, linewidths=0)
+    _categorical_axis(ax)
+
+
+# =========================================================
+# BASE PLOT (swarm para pocos puntos, strip para muchos)
 # =========================================================
 def _plot_bees(
     ax,
@@ -42,21 +92,54 @@ def _plot_bees(
     palette: dict,
     size: float = 6,        # 🔧 tamaño puntos base
     jitter: float = 0.25,  # 🔧 dispersión horizontal
+    threshold: int = SWARM_THRESHOLD,
+    renderer: Optional[str] = None,
+    swarm_max: int = SWARM_MAX_POINTS,
 ):
-    sns.stripplot(
-        ax=ax,
-        y=[""] * len(aux_df),
-        x="valor",
-        hue="color",
-        data=aux_df,
-        palette=palette,
-        dodge=False,
-        size=size,
-        orient="h",
-        jitter=jitter,
-        alpha=0.85,
-        legend=False,
-    )
+    n = len(aux_df)
+    renderer = renderer or BEES_RENDERER
+
+    if renderer == "native":
+        values = aux_df["valor"].to_numpy(dtype=float)
+        colors = _band_colors(aux_df["color"].to_numpy(), palette)
+        if n <= swarm_max:
+            swarm_scatter(ax, values, colors, size=size)
+            _categorical_axis(ax)
+        else:
+            _strip_native(ax, values, colors, size=size, jitter=jitter)
+
+    elif n <= threshold:
+        sns.swarmplot(
+            ax=ax,
+            y=[""] * n,
+            x="valor",
+            hue="color",
+            data=aux_df,
+            palette=palette,
+            dodge=False,
+            size=size,
+            orient="h",
+            legend=False,
+        )
+    else:
+        sns.stripplot(
+            ax=ax,
+            y=[""] * n,
+            x="valor",
+            hue="color",
+            data=aux_df,
+            palette=palette,
+            dodge=False,
+            size=size,
+            orient="h",
+            jitter=jitter,
+            alpha=0.85,
+            legend=False,
+        )
+
+
+# nombre público (ex src/charts/bees.plot_bees)
+plot_bees = _plot_bees
 
 # =========================================================
 # CALLOUT (línea curva + texto jugador)
@@ -102,24 +185,23 @@ def _add_callout(
 # =========================================================
 def _highlight_players(
     ax,
-    aux_df: pd.DataFrame,
-    players: Sequence[str],
+    points: Sequence[Tuple[str, Optional[float]]],
     colors: Optional[Sequence[str]] = None,
     font: Optional[FontProperties] = None,
     label_y_offsets: Sequence[float] = (0.30, 0.55, 0.80, 1.05),
     curve_rad: float = 0.30,
+    show_labels: bool = True,
 ):
-    if not players:
+    """points: (jugador, valor) en el orden de selección; valor None = no está."""
+    if not points:
         return
 
     colors = colors or DEFAULT_HILITE_COLORS
 
-    for idx, player in enumerate(players[:4]):
-        fila = aux_df[aux_df["Jugador"].str.strip() == str(player).strip()]
-        if fila.empty:
+    for idx, (player, x_val) in enumerate(points[:4]):
+        if x_val is None:
             continue
 
-        x_val = float(fila["valor"].values[0])
         y_val = 0.0
         color = colors[idx % len(colors)]
 
@@ -143,46 +225,179 @@ def _highlight_players(
             zorder=6,
         )
 
-        _add_callout(
-            ax,
-            x_val,
-            y_val,
-            text=str(player),
-            font=font,
-            label_y_offset=label_y_offsets[idx],
-            curve_rad=curve_rad,
-        )
+        if show_labels:
+            _add_callout(
+                ax,
+                x_val,
+                y_val,
+                text=str(player),
+                font=font,
+                label_y_offset=label_y_offsets[idx % len(label_y_offsets)],
+                curve_rad=curve_rad,
+            )
+
+# =========================================================
+# BANDAS DE PERCENTILES (vectorizado)
+# =========================================================
+# esquema = (cuantiles de corte, colores de peor a mejor); N cortes → N+1 bandas
+BAND_SCHEMES = {
+    "terciles": ((0.33, 0.67), ("rojo", "amarillo", "verde")),
+    "cuartiles": ((0.25, 0.50, 0.75), ("rojo", "naranja", "amarillo", "verde")),
+    "quintiles": ((0.20, 0.40, 0.60, 0.80), ("rojo", "naranja", "amarillo", "verde_claro", "verde")),
+}
+
+
+def _resolve_scheme(scheme: Optional[str], p_low: float, p_high: float):
+    """None = terciles con p_low / p_high (comportamiento histórico)."""
+    if scheme is None:
+        return (p_low, p_high), BAND_SCHEMES["terciles"][1]
+    if scheme not in BAND_SCHEMES:
+        raise ValueError(f"Esquema de bandas desconocido: {scheme!r} (opciones: {', '.join(BAND_SCHEMES)})")
+    return BAND_SCHEMES[scheme]
+
+
+def classify_bands(
+    df: pd.DataFrame,
+    metrics: Sequence[str],
+    lower_is_better: Set[str],
+    quantiles: Sequence[float] = (0.33, 0.67),
+    labels: Sequence[str] = ("rojo", "amarillo", "verde"),
+    na_label: str = "gris",
+):
+    """
+    Clasifica TODAS las métricas de la población en una sola pasada.
+
+    Devuelve (bandas, cortes):
+    - bandas: {métrica: array de labels por fila de df} (nulos → na_label)
+    - cortes: {métrica: [valores de corte]}
+
+    Un valor igual al corte queda en la banda de abajo (v <= p1 → peor),
+    igual que el clasificar() original; lower_is_better invierte las bandas.
+    """
+    if len(labels) != len(quantiles) + 1:
+        raise ValueError("Hace falta un label más que cortes.")
+
+    stats = population_stats(df)
+    k = len(quantiles)
+
+    values = np.column_stack([
+        pd.to_numeric(df[m], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        for m in metrics
+    ]) if metrics else np.empty((len(df), 0))
+    cuts = np.array([stats.metric(m).quantile(list(quantiles)) for m in metrics]).reshape(len(metrics), k)
+
+    # banda = cantidad de cortes estrictamente superados (= searchsorted side="left")
+    idx = (values[:, :, None] > cuts[None, :, :]).sum(axis=2)
+    reverse = np.array([m in lower_is_better for m in metrics], dtype=bool)
+    idx = np.where(reverse[None, :], k - idx, idx)
+
+    # -1 → último label (na_label)
+    idx[np.isnan(values)] = -1
+    lut = np.asarray(list(labels) + [na_label], dtype=object)
+    codes = lut[idx]
+
+    bands = {m: codes[:, j] for j, m in enumerate(metrics)}
+    return bands, {m: cuts[j].tolist() for j, m in enumerate(metrics)}
+
 
 # =========================================================
-# AUX DF + PERCENTILES
+# UN EJE = UNA MÉTRICA (lo comparten grid / single / preset)
 # =========================================================
-def _build_aux_df(
+def _draw_metric(
+    ax,
     df: pd.DataFrame,
     metric: str,
     player_col: str,
+    players: Sequence[str],
+    colors: Optional[Sequence[str]],
     lower_is_better: Set[str],
-    p_low: float,
-    p_high: float,
+    bands: np.ndarray,
+    cuts: Sequence[float],
+    font: Optional[FontProperties],
+    point_size: float,
+    title_size: int,
+    show_labels: bool = True,
+    label_y_offsets: Sequence[float] = (0.30, 0.55, 0.80, 1.05),
+    curve_rad: float = 0.30,
+    renderer: Optional[str] = None,
+    bg: str = BG,
 ):
-    s = df[metric]
-    p1 = float(s.quantile(p_low))
-    p2 = float(s.quantile(p_high))
-
-    def clasificar(v):
-        if pd.isna(v):
-            return "gris"
-        if metric in lower_is_better:
-            return "verde" if v <= p1 else "amarillo" if v <= p2 else "rojo"
-        else:
-            return "rojo" if v <= p1 else "amarillo" if v <= p2 else "verde"
+    """bands / cuts: salida de classify_bands para esta métrica (filas de df)."""
+    ax.set_facecolor(bg)
 
+    keep = (df[player_col].notna() & df[metric].notna()).to_numpy()
     aux_df = pd.DataFrame({
-        "Jugador": df[player_col].astype(str),
-        "valor": s.astype(float),
-        "color": s.apply(clasificar),
+        "Jugador": df[player_col][keep].astype(str).to_numpy(),
+        "valor": pd.to_numeric(df[metric][keep], errors="coerce").to_numpy(dtype=float),
+        "color": bands[keep],
     })
 
-    return aux_df, p1, p2
+    _plot_bees(ax, aux_df, DEFAULT_PALETTE, size=point_size, renderer=renderer)
+
+    # cortes: el primero del lado "malo" en rojo, el último del lado "bueno" en verde
+    line_colors = ["gray"] * len(cuts)
+    if cuts:
+        line_colors[0], line_colors[-1] = "red", "green"
+    if metric in lower_is_better:
+        line_colors = line_colors[::-1]
+    for cut, lc in zip(cuts, line_colors):
+        ax.axvline(cut, color=lc, linestyle="--", lw=1, alpha=0.6)
+    if metric in lower_is_better:
+        ax.invert_xaxis()
+
+    # destacados: fila del jugador desde el índice del frame (src/player_index.py),
+    # solo entre las filas con valor; posición en df → posición en aux_df con cumsum
+    pos = player_index(df, player_col).positions(list(players[:4]), mask=keep)
+    aux_pos = np.cumsum(keep) - 1
+    valores = aux_df["valor"].to_numpy()
+    points = [(p, float(valores[aux_pos[i]]) if i >= 0 else None) for p, i in zip(players[:4], pos)]
+
+    _highlight_players(
+        ax,
+        points,
+        colors=colors,
+        font=font,
+        label_y_offsets=label_y_offsets,
+        curve_rad=curve_rad,
+        show_labels=show_labels,
+    )
+
+    # ✅ TÍTULO REAL (escala con el subplot)
+    ax.text(
+        0.0, 1.08,
+        metric,
+        transform=ax.transAxes,
+        ha="left",
+        va="bottom",
+        color=FG,
+        fontproperties=font,
+        fontsize=title_size,
+    )
+
+    ax.set_yticks([])
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["bottom"].set_color(FG)
+    ax.spines["left"].set_color(FG)
+    ax.tick_params(axis="x", colors=FG)
+    ax.set_ylim(-0.5, 1.2)
+
+
+def _as_players(player) -> List[str]:
+    if player is None:
+        return []
+    if isinstance(player, str):
+        return [player]
+    return list(player)
+
+
+def _numeric_metrics(df: pd.DataFrame, metrics: Sequence[str]) -> List[str]:
+    return [
+        m for m in metrics
+        if m in df.columns and pd.api.types.is_numeric_dtype(df[m])
+    ]
 
 # =========================================================
 # BEES – GRID
@@ -200,86 +415,107 @@ def beeswarm_grid(
     ncols: int = 3,
     point_size: float = 5,    # 🔧 puntos base
     title_size: int = 18,     # 🔧 tamaño título (REAL, escala con el subplot)
+    show_player_label: bool = True,
+    scheme: Optional[str] = None,   # None = terciles p_low/p_high; ver BAND_SCHEMES
+    renderer: Optional[str] = None, # None = BEES_RENDERER
+    render_target: str = "preview", # "export" = lienzo transparente (src/theme.py)
 ):
     lower_is_better = lower_is_better or set()
-
-    metrics = [
-        m for m in metrics
-        if m in df.columns and np.issubdtype(df[m].dtype, np.number)
-    ]
+    metrics = _numeric_metrics(df, metrics)
+    bg = target_bg(render_target)
 
     if not metrics:
-        fig = plt.figure(figsize=(8, 3), facecolor=BG)
+        fig = new_figure(figsize=(8, 3), facecolor=bg)
         return fig
 
-    players = (
-        [player] if isinstance(player, str)
-        else list(player) if isinstance(player, list)
-        else []
-    )
+    players = _as_players(player)
 
     n = len(metrics)
     nrows = int(np.ceil(n / ncols))
 
-    fig, axes = plt.subplots(
+    fig, axes = subplots(
         nrows=nrows,
         ncols=ncols,
         figsize=(6 * ncols, 3.2 * nrows),
-        facecolor=BG,   # 👈 CLAVE copy/paste
+        facecolor=bg,   # 👈 CLAVE copy/paste
     )
 
     axes = np.array(axes).flatten()
 
-    for i, metric in enumerate(metrics):
-        ax = axes[i]
-        ax.set_facecolor(BG)
+    # todas las métricas clasificadas en una sola pasada
+    quantiles, labels = _resolve_scheme(scheme, p_low, p_high)
+    bands, cuts = classify_bands(df, metrics, lower_is_better, quantiles, labels)
 
-        df_use = df[[player_col, metric]].dropna()
-        aux_df, p1, p2 = _build_aux_df(
-            df_use, metric, player_col,
-            lower_is_better, p_low, p_high
+    for i, metric in enumerate(metrics):
+        _draw_metric(
+            axes[i], df, metric, player_col, players, colors,
+            lower_is_better, bands[metric], cuts[metric], font,
+            point_size=point_size,
+            title_size=title_size,
+            show_labels=show_player_label,
+            renderer=renderer,
+            bg=bg,
         )
 
-        _plot_bees(ax, aux_df, DEFAULT_PALETTE, size=point_size)
+    for j in range(len(metrics), len(axes)):
+        fig.delaxes(axes[j])
 
-        # percentiles
-        if metric in lower_is_better:
-            ax.axvline(p1, color="green", linestyle="--", lw=1, alpha=0.6)
-            ax.axvline(p2, color="red", linestyle="--", lw=1, alpha=0.6)
-            ax.invert_xaxis()
-        else:
-            ax.axvline(p1, color="red", linestyle="--", lw=1, alpha=0.6)
-            ax.axvline(p2, color="green", linestyle="--", lw=1, alpha=0.6)
-
-        _highlight_players(
-            ax,
-            aux_df,
-            players=players,
-            colors=colors,
-            font=font,
-        )
+    fig.tight_layout()
+    return fig
 
-        # ✅ TÍTULO REAL (escala con el subplot)
-        ax.text(
-            0.0, 1.08,
-            metric,
-            transform=ax.transAxes,
-            ha="left",
-            va="bottom",
-            color=FG,
-            fontproperties=font,
-            fontsize=title_size,   # 👈 ESTE VALOR AHORA SÍ SE NOTA
-        )
+# =========================================================
+# BEES – GRID PRESET (filas x columnas fijas)
+# =========================================================
+def beeswarm_grid_preset(
+    df: pd.DataFrame,
+    metrics: Sequence[str],
+    nrows: int = 4,
+    ncols: int = 3,
+    player_col: str = "Jugador",
+    player: Optional[Union[List[str], str]] = None,
+    colors: Optional[List[str]] = None,
+    lower_is_better: Optional[Set[str]] = None,
+    p_low: float = 0.33,
+    p_high: float = 0.67,
+    font: Optional[FontProperties] = None,
+    point_size: float = 5,
+    title_size: int = 18,
+    show_player_label: bool = True,
+    label_y_offset: float = 0.30,
+    curve_rad: float = 0.30,
+    scheme: Optional[str] = None,
+    renderer: Optional[str] = None,
+    render_target: str = "preview",
+):
+    lower_is_better = lower_is_better or set()
+    metrics = _numeric_metrics(df, metrics)[: nrows * ncols]
+    players = _as_players(player)
+    bg = target_bg(render_target)
 
-        ax.set_yticks([])
-        ax.set_xlabel("")
-        ax.set_ylabel("")
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["bottom"].set_color(FG)
-        ax.spines["left"].set_color(FG)
-        ax.tick_params(axis="x", colors=FG)
-        ax.set_ylim(-0.5, 1.2)
+    fig, axes = subplots(
+        nrows=nrows,
+        ncols=ncols,
+        figsize=(6 * ncols, 3.2 * nrows),
+        facecolor=bg,
+    )
+    axes = np.array(axes).flatten()
+
+    quantiles, labels = _resolve_scheme(scheme, p_low, p_high)
+    bands, cuts = classify_bands(df, metrics, lower_is_better, quantiles, labels)
+
+    offsets = tuple(label_y_offset + 0.25 * k for k in range(4))
+    for i, metric in enumerate(metrics):
+        _draw_metric(
+            axes[i], df, metric, player_col, players, colors,
+            lower_is_better, bands[metric], cuts[metric], font,
+            point_size=point_size,
+            title_size=title_size,
+            show_labels=show_player_label,
+            label_y_offsets=offsets,
+            curve_rad=curve_rad,
+            renderer=renderer,
+            bg=bg,
+        )
 
     for j in range(len(metrics), len(axes)):
         fig.delaxes(axes[j])
@@ -302,59 +538,32 @@ def beeswarm_single(
     font: Optional[FontProperties] = None,
     point_size: float = 6,
     title_size: int = 20,   # 🔧 título individual (más grande)
+    show_player_label: bool = True,
+    label_y_offset: float = 0.30,
+    curve_rad: float = 0.30,
+    scheme: Optional[str] = None,
+    renderer: Optional[str] = None,
+    render_target: str = "preview",
 ):
     lower_is_better = lower_is_better or set()
-
-    fig, ax = plt.subplots(figsize=(8, 3.2), facecolor=BG)
-    ax.set_facecolor(BG)
-
-    df_use = df[[player_col, metric]].dropna()
-    aux_df, p1, p2 = _build_aux_df(
-        df_use, metric, player_col,
-        lower_is_better, p_low, p_high
+    bg = target_bg(render_target)
+
+    fig, ax = subplots(figsize=(8, 3.2), facecolor=bg)
+
+    quantiles, labels = _resolve_scheme(scheme, p_low, p_high)
+    bands, cuts = classify_bands(df, [metric], lower_is_better, quantiles, labels)
+
+    _draw_metric(
+        ax, df, metric, player_col, _as_players(player), colors,
+        lower_is_better, bands[metric], cuts[metric], font,
+        point_size=point_size,
+        title_size=title_size,
+        show_labels=show_player_label,
+        label_y_offsets=tuple(label_y_offset + 0.25 * k for k in range(4)),
+        curve_rad=curve_rad,
+        renderer=renderer,
+        bg=bg,
     )
 
-    _plot_bees(ax, aux_df, DEFAULT_PALETTE, size=point_size)
-
-    if metric in lower_is_better:
-        ax.axvline(p1, color="green", linestyle="--", lw=1, alpha=0.6)
-        ax.axvline(p2, color="red", linestyle="--", lw=1, alpha=0.6)
-        ax.invert_xaxis()
-    else:
-        ax.axvline(p1, color="red", linestyle="--", lw=1, alpha=0.6)
-        ax.axvline(p2, color="green", linestyle="--", lw=1, alpha=0.6)
-
-    if player:
-        players = [player] if isinstance(player, str) else list(player)
-        _highlight_players(
-            ax,
-            aux_df,
-            players=players,
-            colors=colors,
-            font=font,
-        )
-
-    # ✅ TÍTULO INDIVIDUAL REAL
-    ax.text(
-        0.0, 1.08,
-        metric,
-        transform=ax.transAxes,
-        ha="left",
-        va="bottom",
-        color=FG,
-        fontproperties=font,
-        fontsize=title_size,
-    )
-
-    ax.set_yticks([])
-    ax.set_xlabel("")
-    ax.set_ylabel("")
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-    ax.spines["bottom"].set_color(FG)
-    ax.spines["left"].set_color(FG)
-    ax.tick_params(axis="x", colors=FG)
-    ax.set_ylim(-0.5, 1.2)
-
     fig.tight_layout()
-    return fig
\ No newline at end of file
+    return fig
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from typing import Sequence, Optional, Dict, Set
+import io
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Sequence, Set
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
+from matplotlib.transforms import Bbox
 from mplsoccer import Radar, grid
+from PIL import Image
 
+from src.figures import detach
+from src.player_index import player_index, player_label
+from src.stats import population_stats
 from src.theme import (
     BG_DARK,
     FG_LIGHT,
@@ -13,6 +25,7 @@ from src.theme import (
     ACCENT_ORANGE,
     fonts,
     apply_mpl_theme,
+    target_bg,
 )
 
 # =========================================================
@@ -21,18 +34,19 @@ from src.theme import (
 def prepare_radar_values(
     df: pd.DataFrame,
     metrics: Sequence[str],
-    player_col: str,
-    players: Sequence[str],
+    player_col: str = "Jugador",
+    players: Sequence[str] = (),
     lower_is_better: Set[str] | None = None,
     q_low: float = 0.10,
     q_high: float = 0.90,
+    pick: str = "first",
 ):
     """
     Calcula:
     - params válidos
     - rangos (low / high)
     - media / mediana
-    - valores por jugador
+    - valores por jugador (pick: qué fila usar si tiene varias, ver src/player_index.py)
     """
     lower_is_better = lower_is_better or set()
 
@@ -44,25 +58,356 @@ def prepare_radar_values(
     if not params:
         raise ValueError("❌ No hay métricas numéricas válidas para radar.")
 
-    low = df[params].quantile(q_low).tolist()
-    high = df[params].quantile(q_high).tolist()
-    mean_vals = df[params].mean().tolist()
-    median_vals = df[params].median().tolist()
+    # rangos / referencias desde la población ya ordenada (src/stats.py)
+    stats = population_stats(df)
+    low = stats.quantiles(params, q_low)
+    high = stats.quantiles(params, q_high)
+    mean_vals = stats.means(params)
+    median_vals = stats.medians(params)
 
-    player_vals: Dict[str, list[float]] = {}
-    for p in players:
-        row = df[df[player_col].astype(str).str.strip() == str(p).strip()]
-        if row.empty:
-            player_vals[p] = [np.nan] * len(params)
-        else:
-            player_vals[p] = row[params].iloc[0].astype(float).tolist()
+    # una fila por jugador desde el índice del frame (src/player_index.py) → un solo gather
+    pos = player_index(df, player_col).positions(list(players), pick=pick)
+    found = pos >= 0
+    vals = np.full((len(pos), len(params)), np.nan)
+    if found.any():
+        vals[found] = df[params].iloc[pos[found]].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    player_vals: Dict[str, list[float]] = {p: vals[i].tolist() for i, p in enumerate(players)}
 
     return params, low, high, mean_vals, median_vals, player_vals
 
 
+# =========================================================
+# RADAR – FONDO (se arma una vez por set de métricas / rangos)
+# =========================================================
+DEFAULT_COLORS = [INLAB_BLUE, ACCENT_ORANGE, "#7AC3FF", "#FFD580"]
+
+# 🔧 AJUSTES
+RADAR_FIGHEIGHT = 14     # alto de la figura (pulgadas); textos / puntos / líneas escalan con él
+_BASE_FIGHEIGHT = 14     # los tamaños 🎛️ de abajo están pensados para este alto
+
+# dos niveles de resolución: pantalla (liviano, se cachea) / descarga (completa, solo al exportar)
+# 100 dpi × 14" ≈ 1400 px de alto: sobra para la columna de Streamlit y codifica ~4× más rápido que 200
+RADAR_PREVIEW_DPI = int(os.environ.get("INLAB_RADAR_PREVIEW_DPI", 100))
+RADAR_EXPORT_DPI = int(os.environ.get("INLAB_RADAR_EXPORT_DPI", 300))
+
+
+class RadarTemplate:
+    """
+    Figura con todo lo que NO depende de los jugadores: tema, Radar de
+    mplsoccer, grid, fondo, anillos y etiquetas de métricas.
+
+    render_target="export" arma la figura ya transparente: sin el
+    Rectangle de fondo y con el lienzo en "none" (PNG de descarga tal cual).
+    figheight cambia el tamaño en pulgadas sin cambiar el look (todo escala
+    junto); la resolución final la pone el dpi del export.
+
+    draw_players() dibuja polígonos + valores + títulos encima;
+    stamp() hace lo mismo pero los borra al salir, así la misma figura
+    sirve para exportar muchas combinaciones (graficar_radares).
+    """
+
+    def __init__(
+        self,
+        params: Sequence[str],
+        low: Sequence[float],
+        high: Sequence[float],
+        lower_is_better: Sequence[str] | None = None,
+        show_max_labels: bool = False,
+        font_thin: Optional[FontProperties] = None,
+        font_bold: Optional[FontProperties] = None,
+        render_target: str = "preview",
+        figheight: float = RADAR_FIGHEIGHT,
+    ):
+        bg = target_bg(render_target)
+        k = self.scale = figheight / _BASE_FIGHEIGHT
+        apply_mpl_theme()
+        f = fonts()
+        self.font_thin = font_thin or f.get("regular")
+        self.font_light = f.get("light", self.font_thin)
+        self.font_bold = font_bold or f.get("semibold")
+
+        # =========================================================
+        # RADAR BASE
+        # =========================================================
+        radar = Radar(
+            list(params),
+            list(low),
+            list(high),
+            lower_is_better=list(lower_is_better or []),
+            round_int=[False] * len(params),
+            num_rings=4,
+            ring_width=1,
+            center_circle_radius=1,
+        )
+
+        fig, axs = grid(
+            figheight=figheight,
+            grid_height=0.82,      # 🎛️ AJUSTE: tamaño del radar
+            title_height=0.08,     # 🎛️ AJUSTE: espacio títulos
+            endnote_height=0.03,
+            title_space=0.01,
+            endnote_space=0.01,
+            axis=False,
+            grid_key="radar",
+        )
+        # mplsoccer la arma con plt.figure: sale de pyplot ya (src/figures.py)
+        fig = detach(fig)
+
+        # =========================================================
+        # FONDO SÓLIDO (preview + copiar imagen; en export no existe)
+        # =========================================================
+        fig.set_facecolor(bg)
+        fig.patch.set_alpha(0 if render_target == "export" else 1)
+
+        self.background = None
+        if render_target == "preview":
+            self.background = fig.add_artist(
+                plt.Rectangle(
+                    (0, 0),
+                    1,
+                    1,
+                    transform=fig.transFigure,
+                    color=BG_DARK,
+                    zorder=-100,
+                )
+            )
+
+        radar.setup_axis(ax=axs["radar"], facecolor="None")
+
+        radar.draw_circles(
+            ax=axs["radar"],
+            facecolor="#2a2a2a",
+            edgecolor="#555555",
+            lw=1.2 * k,
+        )
+
+        # máximos (high) en el borde, opcional
+        if show_max_labels:
+            angles = np.linspace(0, 2 * np.pi, len(params), endpoint=False)
+            r_max = radar.ring_width * radar.num_rings + 0.15
+            for angle, h in zip(angles, high):
+                axs["radar"].text(
+                    r_max * np.cos(angle),
+                    r_max * np.sin(angle),
+                    f"{h:.0f}",
+                    fontsize=12 * k,
+                    ha="center",
+                    va="center",
+                    color=FG_LIGHT,
+                    fontproperties=self.font_thin,
+                )
+
+        # =========================================================
+        # ETIQUETAS DE MÉTRICAS (↑ 20%)
+        # =========================================================
+        radar.draw_param_labels(
+            ax=axs["radar"],
+            fontsize=24 * k,          # 🎛️ AJUSTE: tamaño nombres métricas
+            color=FG_LIGHT,
+            fontproperties=self.font_thin,
+        )
+
+        self.radar = radar
+        self.fig = fig
+        self.axs = axs
+
+    def draw_players(
+        self,
+        names: Sequence[str],
+        values: Sequence[Sequence[float]],
+        colors: Optional[Sequence[str]] = None,
+        title_left: str = "",
+        title_right: str = "",
+    ):
+        assert len(names) == len(values), "names y values deben tener misma longitud"
+
+        ax = self.axs["radar"]
+        k = self.scale
+
+        # =========================================================
+        # COLORES
+        # =========================================================
+        colores = list(colors) if colors else list(DEFAULT_COLORS)
+
+        if len(colores) < len(names):
+            colores = (colores * (len(names) // max(len(colores), 1) + 1))[:len(names)]
+
+        # =========================================================
+        # DIBUJAR JUGADORES
+        # =========================================================
+        for name, vals, color in zip(names, values, colores):
+
+            _, _, vertices = self.radar.draw_radar(
+                values=list(vals),
+                ax=ax,
+                kwargs_radar=dict(facecolor=color, alpha=0.45),
+                kwargs_rings=dict(facecolor="None"),
+            )
+
+            for (x, y), v in zip(vertices, vals):
+                r = np.sqrt(x**2 + y**2)
+                ang = np.arctan2(y, x)
+
+                xt = (r + 0.35) * np.cos(ang)   # 🎛️ AJUSTE: distancia label
+                yt = (r + 0.35) * np.sin(ang)
+
+                ax.scatter(
+                    x,
+                    y,
+                    s=70 * k**2,                # 🎛️ AJUSTE: tamaño punto
+                    c=BG_DARK,
+                    edgecolors=color,
+                    linewidths=1.5 * k,
+                    zorder=3,
+                )
+
+                ax.text(
+                    xt,
+                    yt,
+                    f"{float(v):.2f}" if np.isfinite(v) else "NA",
+                    fontsize=11 * k,            # 🎛️ AJUSTE: tamaño valor (+20%)
+                    color=FG_LIGHT,
+                    ha="center",
+                    va="center",
+                    fontproperties=self.font_light,
+                    bbox=dict(
+                        facecolor=color,
+                        alpha=0.90,
+                        edgecolor="none",
+                        boxstyle="round,pad=0.28",
+                    ),
+                )
+
+        # =========================================================
+        # TÍTULOS (↑ 20%)
+        # =========================================================
+        if len(names) == 1:
+            self.axs["title"].text(
+                0.5,
+                0.6,
+                names[0],
+                fontsize=32 * k,         # 🎛️ AJUSTE: tamaño título
+                fontproperties=self.font_bold,
+                ha="center",
+                va="center",
+                color=colores[0],
+            )
+
+        elif len(names) >= 2:
+            self.axs["title"].text(
+                0.02,
+                0.6,
+                title_left or names[0],
+                fontsize=28 * k,         # 🎛️ AJUSTE
+                fontproperties=self.font_bold,
+                ha="left",
+                va="center",
+                color=colores[0],
+            )
+
+            self.axs["title"].text(
+                0.98,
+                0.6,
+                title_right or names[1],
+                fontsize=28 * k,         # 🎛️ AJUSTE
+                fontproperties=self.font_bold,
+                ha="right",
+                va="center",
+                color=colores[1],
+            )
+
+    @contextmanager
+    def stamp(self, names, values, colors=None, title_left: str = "", title_right: str = ""):
+        """
+        Jugadores encima del fondo mientras dura el with (después se borran).
+        Devuelve los artistas agregados (RadarBackground los dibuja sueltos).
+        """
+        axes = (self.axs["radar"], self.axs["title"])
+        before = [set(map(id, ax.get_children())) for ax in axes]
+        self.draw_players(names, values, colors, title_left, title_right)
+        nuevos = [a for ax, ids in zip(axes, before) for a in ax.get_children() if id(a) not in ids]
+        try:
+            yield nuevos
+        finally:
+            for artist in nuevos:
+                artist.remove()
+
+
+# =========================================================
+# RADAR – DIBUJO (desde valores ya calculados)
+# =========================================================
+def plot_radar(
+    params: Sequence[str],
+    low: Sequence[float],
+    high: Sequence[float],
+    names: Sequence[str],
+    values: Sequence[Sequence[float]],
+    colors: Optional[Sequence[str]] = None,
+    lower_is_better: Sequence[str] | None = None,
+    show_max_labels: bool = False,
+    font_thin: Optional[FontProperties] = None,
+    font_bold: Optional[FontProperties] = None,
+    title_left: str = "",
+    title_right: str = "",
+    render_target: str = "preview",
+    figheight: float = RADAR_FIGHEIGHT,
+):
+    """
+    Dibuja el radar InLab a partir de params / rangos / valores.
+    (graficar_radar calcula todo eso desde el df y llama acá)
+    """
+    template = RadarTemplate(
+        params,
+        low,
+        high,
+        lower_is_better=lower_is_better,
+        show_max_labels=show_max_labels,
+        font_thin=font_thin,
+        font_bold=font_bold,
+        render_target=render_target,
+        figheight=figheight,
+    )
+    template.draw_players(names, values, colors, title_left, title_right)
+    return template.fig
+
+
 # =========================================================
 # RADAR – InLab v2.0
 # =========================================================
+def _radar_series(
+    jugadores, colores_jugadores, referencia, color_referencia,
+    player_vals, mean_vals, median_vals,
+):
+    """Jugadores (+ referencia) → names / values / colores para draw_players."""
+    # (nombre, temporada[, equipo]) → "Nombre (temporada)" en los títulos
+    names = [player_label(j) for j in jugadores]
+    values = [player_vals[j] for j in jugadores]
+
+    # =========================================================
+    # COLORES
+    # =========================================================
+    colores = list(colores_jugadores) if colores_jugadores else list(DEFAULT_COLORS)
+
+    # =========================================================
+    # REFERENCIA (media / mediana)
+    # =========================================================
+    if referencia in ("media", "mediana"):
+        # la referencia va después del último jugador
+        colores = (colores * (len(names) // len(colores) + 1))[:len(names)]
+
+        if referencia == "media":
+            names.append("Media")
+            values.append(mean_vals)
+            colores.append(color_referencia or "#aaaaaa")
+        else:
+            names.append("Mediana")
+            values.append(median_vals)
+            colores.append(color_referencia or "#888888")
+
+    return names, values, colores
+
+
 def graficar_radar(
     df: pd.DataFrame,
     jugadores: Sequence[str],
@@ -76,20 +421,19 @@ def graficar_radar(
     q_high: float = 0.90,
     guardar: bool = False,
     filename: str = "radar.png",
+    render_target: str = "preview",   # "preview" | "export" (transparente, src/theme.py)
+    figheight: float = RADAR_FIGHEIGHT,
+    pick: str = "first",
 ):
     """
     Radar InLab v2.0
     - Tema dark
     - Tipografía Inter
-    - Fondo sólido (copy & export)
+    - Fondo sólido (preview / copy) o transparente (render_target="export")
     - Referencia media / mediana
+    - jugadores: nombre o (nombre, temporada[, equipo]); con el nombre solo,
+      pick elige la fila si hay varias (src/player_index.py)
     """
-
-    # =========================================================
-    # THEME
-    # =========================================================
-    apply_mpl_theme()
-    f = fonts()
     lower_is_better = lower_is_better or set()
 
     params, low, high, mean_vals, median_vals, player_vals = prepare_radar_values(
@@ -100,194 +444,265 @@ def graficar_radar(
         lower_is_better=lower_is_better,
         q_low=q_low,
         q_high=q_high,
+        pick=pick,
     )
 
-    names = list(jugadores)
-    values = [player_vals[j] for j in jugadores]
-
-    # =========================================================
-    # REFERENCIA (media / mediana)
-    # =========================================================
-    if referencia == "media":
-        names.append("Media")
-        values.append(mean_vals)
-        color_ref = color_referencia or "#aaaaaa"
-
-    elif referencia == "mediana":
-        names.append("Mediana")
-        values.append(median_vals)
-        color_ref = color_referencia or "#888888"
-
-    # =========================================================
-    # COLORES
-    # =========================================================
-    if colores_jugadores is None:
-        colores = [INLAB_BLUE, ACCENT_ORANGE, "#7AC3FF", "#FFD580"]
-    else:
-        colores = list(colores_jugadores)
-
-    if referencia in ("media", "mediana"):
-        colores.append(color_ref)
-
-    if len(colores) < len(names):
-        colores = (colores * 3)[:len(names)]
+    names, values, colores = _radar_series(
+        jugadores, colores_jugadores, referencia, color_referencia,
+        player_vals, mean_vals, median_vals,
+    )
 
-    # =========================================================
-    # RADAR BASE
-    # =========================================================
-    radar = Radar(
+    fig = plot_radar(
         params,
         low,
         high,
+        names,
+        values,
+        colors=colores,
         lower_is_better=list(lower_is_better),
-        round_int=[False] * len(params),
-        num_rings=4,
-        ring_width=1,
-        center_circle_radius=1,
-    )
-
-    fig, axs = grid(
-        figheight=14,
-        grid_height=0.82,      # 🎛️ AJUSTE: tamaño del radar
-        title_height=0.08,     # 🎛️ AJUSTE: espacio títulos
-        endnote_height=0.03,
-        title_space=0.01,
-        endnote_space=0.01,
-        axis=False,
-        grid_key="radar",
+        render_target=render_target,
+        figheight=figheight,
     )
 
     # =========================================================
-    # FONDO SÓLIDO (preview + copiar imagen)
+    # EXPORT
     # =========================================================
-    fig.set_facecolor(BG_DARK)
-    fig.patch.set_alpha(1)
-
-    fig.add_artist(
-        plt.Rectangle(
-            (0, 0),
-            1,
-            1,
-            transform=fig.transFigure,
-            color=BG_DARK,
-            zorder=-100,
+    if guardar:
+        fig.canvas.draw()
+        fig.savefig(
+            filename,
+            dpi=300,
+            transparent=True,        # PNG limpio
+            bbox_inches="tight",
+            pad_inches=0.8,
         )
-    )
 
-    radar.setup_axis(ax=axs["radar"], facecolor="None")
+    return fig
+
+
+# =========================================================
+# RADAR – LOTE (muchas combinaciones, mismas métricas)
+# =========================================================
+def _lote(df, combinaciones, metricas, player_col, lower_is_better, q_low, q_high, pick):
+    """Rangos + (names, values, colores) de cada combinación, con UN prepare_radar_values."""
+    todos = list(dict.fromkeys(j for c in combinaciones for j in c.get("jugadores", [])))
 
-    radar.draw_circles(
-        ax=axs["radar"],
-        facecolor="#2a2a2a",
-        edgecolor="#555555",
-        lw=1.2,
+    params, low, high, mean_vals, median_vals, player_vals = prepare_radar_values(
+        df=df,
+        metrics=metricas,
+        player_col=player_col,
+        players=todos,
+        lower_is_better=lower_is_better,
+        q_low=q_low,
+        q_high=q_high,
+        pick=pick,
     )
 
-    # =========================================================
-    # ETIQUETAS DE MÉTRICAS (↑ 20%)
-    # =========================================================
-    radar.draw_param_labels(
-        ax=axs["radar"],
-        fontsize=24,              # 🎛️ AJUSTE: tamaño nombres métricas
-        color=FG_LIGHT,
-        fontproperties=f["regular"],
+    series = [
+        _radar_series(
+            c.get("jugadores", []), c.get("colores_jugadores"),
+            c.get("referencia"), c.get("color_referencia"),
+            player_vals, mean_vals, median_vals,
+        )
+        for c in combinaciones
+    ]
+    return params, low, high, series
+
+
+def graficar_radares(
+    df: pd.DataFrame,
+    combinaciones: Sequence[dict],
+    metricas: Sequence[str],
+    export: Callable,
+    player_col: str = "Jugador",
+    lower_is_better: Set[str] | None = None,
+    q_low: float = 0.10,
+    q_high: float = 0.90,
+    render_target: str = "preview",
+    figheight: float = RADAR_FIGHEIGHT,
+    pick: str = "first",
+) -> Iterator[tuple[int, object]]:
+    """
+    Radares de "Primero vs resto" / "Todas las combinaciones" de una pasada.
+
+    combinaciones: dicts con los kwargs de graficar_radar que cambian por
+    radar (jugadores, colores_jugadores, referencia, color_referencia).
+    export(fig) → lo que necesites (PNG bytes…); se llama con cada radar
+    dibujado y se devuelve (índice, export(fig)) a medida que salen.
+
+    Rangos, valores de todos los jugadores y el fondo (tema, anillos,
+    etiquetas) se calculan UNA vez; por combinación solo se dibujan los
+    polígonos. La figura no está en pyplot (RadarTemplate): se libera
+    aunque el generador no se consuma entero.
+    """
+    lower_is_better = lower_is_better or set()
+    params, low, high, series = _lote(df, combinaciones, metricas, player_col, lower_is_better, q_low, q_high, pick)
+
+    template = RadarTemplate(
+        params, low, high, lower_is_better=list(lower_is_better),
+        render_target=render_target, figheight=figheight,
     )
+    for i, (names, values, colores) in enumerate(series):
+        with template.stamp(names, values, colores):
+            out = export(template.fig)
+        yield i, out
 
-    # =========================================================
-    # DIBUJAR JUGADORES
-    # =========================================================
-    for name, vals, color in zip(names, values, colores):
 
-        _, _, vertices = radar.draw_radar(
-            values=vals,
-            ax=axs["radar"],
-            kwargs_radar=dict(facecolor=color, alpha=0.45),
-            kwargs_rings=dict(facecolor="None"),
-        )
+# =========================================================
+# RADAR – FONDO PRE-RENDERIZADO (blitting)
+# =========================================================
+# 🔧 AJUSTES
+RADAR_BG_ENTRIES = 3     # fondos en memoria; c/u ≈ 2 × ancho × alto × 4 bytes (~13 MB a 100 dpi, ~55 MB a 200)
 
-        for (x, y), v in zip(vertices, vals):
-            r = np.sqrt(x**2 + y**2)
-            ang = np.arctan2(y, x)
-
-            xt = (r + 0.35) * np.cos(ang)   # 🎛️ AJUSTE: distancia label
-            yt = (r + 0.35) * np.sin(ang)
-
-            axs["radar"].scatter(
-                x,
-                y,
-                s=70,                       # 🎛️ AJUSTE: tamaño punto
-                c=BG_DARK,
-                edgecolors=color,
-                linewidths=1.5,
-                zorder=3,
-            )
+_bg_cache: OrderedDict[tuple, "RadarBackground"] = OrderedDict()
+_bg_lock = threading.Lock()
 
-            axs["radar"].text(
-                xt,
-                yt,
-                f"{v:.2f}",
-                fontsize=11,                # 🎛️ AJUSTE: tamaño valor (+20%)
-                color=FG_LIGHT,
-                ha="center",
-                va="center",
-                fontproperties=f["light"],
-                bbox=dict(
-                    facecolor=color,
-                    alpha=0.90,
-                    edgecolor="none",
-                    boxstyle="round,pad=0.28",
-                ),
-            )
 
-    # =========================================================
-    # TÍTULOS (↑ 20%)
-    # =========================================================
-    if len(names) == 1:
-        axs["title"].text(
-            0.5,
-            0.6,
-            names[0],
-            fontsize=32,             # 🎛️ AJUSTE: tamaño título
-            fontproperties=f["semibold"],
-            ha="center",
-            va="center",
-            color=colores[0],
-        )
+class RadarBackground:
+    """
+    Un RadarTemplate rasterizado UNA vez a un dpi (preview opaco o export transparente).
 
-    elif len(names) >= 2:
-        axs["title"].text(
-            0.02,
-            0.6,
-            names[0],
-            fontsize=28,             # 🎛️ AJUSTE
-            fontproperties=f["semibold"],
-            ha="left",
-            va="center",
-            color=colores[0],
-        )
+    png() restaura ese raster (restore_region), dibuja encima solo los
+    artistas de los jugadores (draw_artist), recorta al tight bbox y
+    codifica: la figura base (anillos, etiquetas, fondo) no se vuelve a
+    dibujar al cambiar de jugadores con las mismas métricas.
 
-        axs["title"].text(
-            0.98,
-            0.6,
-            names[1],
-            fontsize=28,             # 🎛️ AJUSTE
-            fontproperties=f["semibold"],
-            ha="right",
-            va="center",
-            color=colores[1],
-        )
+    La figura no está en pyplot (RadarTemplate): vive en la caché de fondos
+    y se comparte entre sesiones (un lock por fondo mientras se dibuja).
+    """
 
-    # =========================================================
-    # EXPORT
-    # =========================================================
-    if guardar:
+    def __init__(self, template: RadarTemplate, dpi: int, pad_inches: float = 0.1):
+        fig = template.fig     # ya fuera de pyplot, con lienzo Agg propio (copy_from_bbox / restore_region)
+        fig.set_dpi(dpi)
         fig.canvas.draw()
-        fig.savefig(
-            filename,
-            dpi=300,
-            transparent=True,        # PNG limpio
-            bbox_inches="tight",
-            pad_inches=0.8,
-        )
+        self.template = template
+        self.dpi = dpi
+        self.pad_inches = pad_inches
+        self.transparent = template.background is None
+        self._pad_rgba = np.round(np.array(to_rgba(fig.get_facecolor())) * 255).astype(np.uint8)
+        self._raster = fig.canvas.copy_from_bbox(fig.bbox)
+        self._tight = fig.get_tightbbox(fig.canvas.get_renderer())
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        w, h = self.template.fig.canvas.get_width_height()
+        return 2 * w * h * 4   # lienzo Agg + copia del fondo
+
+    def png(self, names, values, colors=None, title_left: str = "", title_right: str = "") -> bytes:
+        fig = self.template.fig
+        canvas = fig.canvas
+        with self._lock:
+            canvas.restore_region(self._raster)
+            renderer = canvas.get_renderer()
+            with self.template.stamp(names, values, colors, title_left, title_right) as nuevos:
+                boxes = [self._tight]
+                for artist in sorted(nuevos, key=lambda a: a.get_zorder()):
+                    fig.draw_artist(artist)
+                    bb = artist.get_tightbbox(renderer)
+                    if bb is not None and np.isfinite(bb.bounds).all() and bb.width and bb.height:
+                        boxes.append(bb.transformed(fig.dpi_scale_trans.inverted()))
+
+            # tight bbox en px (origen abajo a la izquierda) → recorte del buffer
+            bbox = Bbox.union(boxes).padded(self.pad_inches)
+            rgba = np.asarray(canvas.buffer_rgba())
+            h, w = rgba.shape[:2]
+            # mismo tamaño que savefig(bbox_inches="tight"): Agg trunca ancho / alto
+            x0 = int(round(bbox.x0 * self.dpi))
+            y0 = h - int(round(bbox.y1 * self.dpi))
+            x1, y1 = x0 + int(bbox.width * self.dpi), y0 + int(bbox.height * self.dpi)
+
+            # el pad puede salir del lienzo (el fondo ocupa toda la figura): se completa con el fondo
+            out = np.empty((y1 - y0, x1 - x0, 4), dtype=np.uint8)
+            out[:] = self._pad_rgba
+            cx0, cx1, cy0, cy1 = max(x0, 0), min(x1, w), max(y0, 0), min(y1, h)
+            out[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0] = rgba[cy0:cy1, cx0:cx1]
+
+        # el encode (lo más caro) fuera del lock; opaco → RGB (mismo PNG visible, ~40% menos encode)
+        img = Image.fromarray(out)
+        if not self.transparent:
+            img = img.convert("RGB")
+        buf = io.BytesIO()
+        img.save(buf, format="png", dpi=(self.dpi, self.dpi))
+        return buf.getvalue()
+
+
+def radar_background(
+    params: Sequence[str],
+    low: Sequence[float],
+    high: Sequence[float],
+    lower_is_better: Sequence[str] | None = None,
+    dpi: int = RADAR_PREVIEW_DPI,
+    render_target: str = "preview",
+    pad_inches: float = 0.1,
+    figheight: float = RADAR_FIGHEIGHT,
+) -> RadarBackground:
+    """Fondo cacheado por (métricas, rangos, tema, tamaño, dpi, destino)."""
+    key = (
+        tuple(params),
+        tuple(round(float(v), 9) for v in low),
+        tuple(round(float(v), 9) for v in high),
+        tuple(sorted(lower_is_better or ())),
+        (BG_DARK, FG_LIGHT),
+        float(figheight),
+        int(dpi),
+        render_target,
+        float(pad_inches),
+    )
+    with _bg_lock:
+        hit = _bg_cache.get(key)
+        if hit is not None:
+            _bg_cache.move_to_end(key)
+            return hit
+
+    bg = RadarBackground(
+        RadarTemplate(
+            params, low, high, lower_is_better=list(lower_is_better or []),
+            render_target=render_target, figheight=figheight,
+        ),
+        dpi=dpi,
+        pad_inches=pad_inches,
+    )
+    with _bg_lock:
+        bg = _bg_cache.setdefault(key, bg)
+        _bg_cache.move_to_end(key)
+        while len(_bg_cache) > RADAR_BG_ENTRIES:
+            _bg_cache.popitem(last=False)
+    return bg
+
+
+def radar_background_stats() -> dict:
+    """Fondos guardados y memoria que ocupan (para el panel de memoria)."""
+    with _bg_lock:
+        fondos = list(_bg_cache.values())
+    return {"fondos": len(fondos), "mb": sum(bg.nbytes for bg in fondos) / 1024**2}
 
-    return fig
\ No newline at end of file
+
+def radares_png(
+    df: pd.DataFrame,
+    combinaciones: Sequence[dict],
+    metricas: Sequence[str],
+    dpi: int = RADAR_PREVIEW_DPI,
+    render_target: str = "preview",
+    pad_inches: float = 0.1,
+    figheight: float = RADAR_FIGHEIGHT,
+    player_col: str = "Jugador",
+    lower_is_better: Set[str] | None = None,
+    q_low: float = 0.10,
+    q_high: float = 0.90,
+    pick: str = "first",
+) -> Iterator[tuple[int, bytes]]:
+    """
+    Como graficar_radares, pero directo a PNG sobre el fondo cacheado
+    (radar_background): con las mismas métricas y filtro, cambiar de
+    jugadores solo dibuja los polígonos y codifica.
+    """
+    lower_is_better = lower_is_better or set()
+    params, low, high, series = _lote(df, combinaciones, metricas, player_col, lower_is_better, q_low, q_high, pick)
+
+    bg = radar_background(
+        params, low, high, lower_is_better=list(lower_is_better),
+        dpi=dpi, render_target=render_target, pad_inches=pad_inches, figheight=figheight,
+    )
+    for i, (names, values, colores) in enumerate(series):
+        yield i, bg.png(names, values, colores)
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from typing import Optional, Sequence, List, Dict
-import unicodedata
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
 
+from src.figures import subplots
+from src.stats import population_stats
+from src.text_index import norm_index, norm_text
+from src.topk import top_k_positions
+from src.theme import BG_DARK, FG_LIGHT, target_bg
+
 # =========================================================
 # ESTILO
 # =========================================================
-BG = "#191919"
-FG = "white"
+BG = BG_DARK
+FG = FG_LIGHT
 
 
 # =========================================================
@@ -20,38 +25,43 @@ FG = "white"
 # =========================================================
 def _norm(s) -> str:
     """Normaliza strings para matching robusto."""
-    if s is None:
-        return ""
-    if isinstance(s, str):
-        s2 = (
-            unicodedata.normalize("NFKD", s)
-            .encode("ascii", "ignore")
-            .decode("utf-8")
-        )
-        return s2.strip().lower()
-    return str(s).strip().lower()
+    return norm_text(s)
 
 
-def _apply_contains(df: pd.DataFrame, col: str, values: Optional[Sequence[str]]):
+def _contains_mask(df: pd.DataFrame, col: str, values: Optional[Sequence[str]]):
+    """Filas cuyo col (normalizado) contiene alguno de values. None = no filtra."""
     if not values or col not in df.columns:
-        return df
+        return None
     vals = [_norm(v) for v in values if str(v).strip() != ""]
     if not vals:
-        return df
-    return df[df[col].astype(str).apply(lambda x: any(v in _norm(x) for v in vals))]
+        return None
+    # matching sobre los valores únicos ya normalizados (src/text_index.py)
+    return norm_index(df).column(col).contains(vals)
+
+
+def _range_mask(df: pd.DataFrame, col: str, min_v=None, max_v=None):
+    """min_v <= col <= max_v (col se pasa a numérico). None = no filtra."""
+    if col not in df.columns or (min_v is None and max_v is None):
+        return None
+    s = df[col]
+    if not pd.api.types.is_numeric_dtype(s):
+        s = pd.to_numeric(s, errors="coerce")
+    mask = np.ones(len(df), dtype=bool)
+    if min_v is not None:
+        mask &= (s >= min_v).to_numpy()
+    if max_v is not None:
+        mask &= (s <= max_v).to_numpy()
+    return mask
+
+
+def _apply_contains(df: pd.DataFrame, col: str, values: Optional[Sequence[str]]):
+    mask = _contains_mask(df, col, values)
+    return df if mask is None else df[mask]
 
 
 def _apply_range(df: pd.DataFrame, col: str, min_v=None, max_v=None):
-    if col not in df.columns:
-        return df
-    s = pd.to_numeric(df[col], errors="coerce")
-    out = df.copy()
-    out[col] = s
-    if min_v is not None:
-        out = out[out[col] >= min_v]
-    if max_v is not None:
-        out = out[out[col] <= max_v]
-    return out
+    mask = _range_mask(df, col, min_v, max_v)
+    return df if mask is None else df[mask]
 
 
 def _safe_numeric(df: pd.DataFrame, col: str) -> pd.Series:
@@ -93,6 +103,7 @@ def plot_scatter_v2(
     posiciones=None,
     ref_type: str = "Mediana",
     font: Optional[FontProperties] = None,
+    render_target: str = "preview",   # "export" = lienzo transparente (src/theme.py)
 ) -> tuple[plt.Figure, pd.DataFrame]:
     """
     Scatter InLab v2.0
@@ -100,33 +111,45 @@ def plot_scatter_v2(
     - Multi jugadores destacados
     - Equipo destacado
     - Media / Mediana
+    - render_target="export": mismo gráfico sobre lienzo transparente
+    - jugadores NO filtra (como siempre): se acepta por compatibilidad, los
+      jugadores se marcan con jugadores_destacados
     """
 
-    df_f = df.copy()
-    df_f.columns = df_f.columns.str.strip()
+    if any(c != c.strip() for c in df.columns.astype(str)):
+        df = df.copy(deep=False)
+        df.columns = df.columns.str.strip()
 
     # -----------------------------
-    # FILTROS
+    # FILTROS (todo como máscara sobre df: una sola copia al final)
     # -----------------------------
-    df_f = _apply_contains(df_f, "Temporada", temporadas)
-    df_f = _apply_contains(df_f, "País", paises)
-    df_f = _apply_contains(df_f, "Liga", ligas)
-    df_f = _apply_contains(df_f, "Equipo", equipos)
-    df_f = _apply_contains(df_f, "Pie", pies)
-    df_f = _apply_contains(df_f, "Posición específica", posiciones)
-
-    df_f = _apply_range(df_f, "Minutos jugados", min_minutos, max_minutos)
-    df_f = _apply_range(df_f, "Edad", min_edad, max_edad)
-    df_f = _apply_range(df_f, "Altura", min_altura, max_altura)
-
-    df_f[x_col] = _safe_numeric(df_f, x_col)
-    df_f[y_col] = _safe_numeric(df_f, y_col)
-    df_f = df_f.dropna(subset=[x_col, y_col, label_col]).copy()
+    x = _safe_numeric(df, x_col).to_numpy(dtype=np.float64, na_value=np.nan)
+    y = _safe_numeric(df, y_col).to_numpy(dtype=np.float64, na_value=np.nan)
+
+    keep = ~np.isnan(x) & ~np.isnan(y) & df[label_col].notna().to_numpy()
+    for m in (
+        _contains_mask(df, "Temporada", temporadas),
+        _contains_mask(df, "País", paises),
+        _contains_mask(df, "Liga", ligas),
+        _contains_mask(df, "Equipo", equipos),
+        _contains_mask(df, "Pie", pies),
+        _contains_mask(df, "Posición específica", posiciones),
+        _range_mask(df, "Minutos jugados", min_minutos, max_minutos),
+        _range_mask(df, "Edad", min_edad, max_edad),
+        _range_mask(df, "Altura", min_altura, max_altura),
+    ):
+        if m is not None:
+            keep &= m
+
+    df_f = df[keep]
+    x, y = x[keep], y[keep]
+    if not (pd.api.types.is_numeric_dtype(df_f[x_col]) and pd.api.types.is_numeric_dtype(df_f[y_col])):
+        df_f = df_f.assign(**{x_col: x, y_col: y})
 
     if df_f.empty:
-        fig, ax = plt.subplots(figsize=(10, 6))
-        fig.patch.set_facecolor(BG)
-        ax.set_facecolor(BG)
+        fig, ax = subplots(figsize=(10, 6))
+        fig.patch.set_facecolor(target_bg(render_target))
+        ax.set_facecolor(target_bg(render_target))
         ax.text(0.5, 0.5, "No hay datos para graficar",
                 ha="center", va="center", fontsize=14, color=FG)
         ax.axis("off")
@@ -135,29 +158,27 @@ def plot_scatter_v2(
     # -----------------------------
     # REFERENCIA
     # -----------------------------
+    # si no se cayó ninguna fila, la población es df → estadísticas cacheadas
+    stats = population_stats(df if len(df_f) == len(df) else df_f)
     if str(ref_type).lower().startswith("med"):
-        ref_x = df_f[x_col].median()
-        ref_y = df_f[y_col].median()
+        ref_x, ref_y = stats.medians([x_col, y_col])
         ref_label = "Mediana"
     else:
-        ref_x = df_f[x_col].mean()
-        ref_y = df_f[y_col].mean()
+        ref_x, ref_y = stats.means([x_col, y_col])
         ref_label = "Media"
 
     # -----------------------------
-    # TOP EXTREMOS
+    # NOMBRES NORMALIZADOS (una vez por dataset, src/text_index.py)
+    # -----------------------------
+    idx = norm_index(df)
+    labels_norm = idx.column(label_col).norm_values(keep)
+
+    # -----------------------------
+    # TOP EXTREMOS (por nombre: se marcan todas las filas de ese jugador)
     # -----------------------------
     top_n = min(top_n, len(df_f))
-    destacados_top = (
-        pd.concat([
-            df_f.sort_values(y_col, ascending=False).head(top_n),
-            df_f.sort_values(x_col, ascending=False).head(top_n),
-        ])[label_col]
-        .astype(str)
-        .unique()
-        .tolist()
-    )
-    destacados_top_norm = {_norm(j) for j in destacados_top}
+    top_pos = np.concatenate([top_k_positions(y, top_n), top_k_positions(x, top_n)])
+    is_top = np.isin(labels_norm, labels_norm[top_pos])
 
     # -----------------------------
     # DESTACADOS MANUALES
@@ -166,29 +187,33 @@ def plot_scatter_v2(
     if jugador_destacado:
         jugadores_destacados.append(jugador_destacado)
 
-    seen = set()
-    jugadores_clean = []
-    for j in jugadores_destacados:
-        nj = _norm(j)
-        if nj and nj not in seen:
-            seen.add(nj)
-            jugadores_clean.append(j)
-
-    jugadores_norm = {_norm(j) for j in jugadores_clean}
+    jugadores_norm = {_norm(j) for j in jugadores_destacados} - {""}
     colores_jugadores = colores_jugadores or {}
     colores_norm = {_norm(k): v for k, v in colores_jugadores.items()}
 
+    is_player = np.isin(labels_norm, list(jugadores_norm))
+
     equipo_norm = _norm(equipo_resaltado) if equipo_resaltado else ""
+    if equipo_norm and team_col in df.columns:
+        is_team = idx.column(team_col).contains([equipo_norm])[keep]
+    else:
+        is_team = np.zeros(len(df_f), dtype=bool)
+
+    # prioridad: jugador > equipo > top
+    is_team &= ~is_player
+    is_top &= ~(is_player | is_team)
 
     # =========================================================
     # FIGURA
     # =========================================================
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = subplots(figsize=(12, 8))
 
-    # 🔑 FONDO TOTAL DEL LIENZO (copy/paste)
-    fig.patch.set_facecolor(BG)
-    fig.patch.set_alpha(1.0)
-    ax.set_facecolor(BG)
+    # 🔑 FONDO TOTAL DEL LIENZO (copy/paste; en export queda transparente)
+    bg = target_bg(render_target)
+    fig.patch.set_facecolor(bg)
+    if render_target == "preview":
+        fig.patch.set_alpha(1.0)
+    ax.set_facecolor(bg)
 
     # 🔑 ELIMINAR MÁRGENES BLANCOS DEL CANVAS
     fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
@@ -231,8 +256,8 @@ def plot_scatter_v2(
     # BASE SCATTER
     # -----------------------------
     ax.scatter(
-        df_f[x_col],
-        df_f[y_col],
+        x,
+        y,
         s=26,
         c=color_resto,
         alpha=0.75,
@@ -241,47 +266,36 @@ def plot_scatter_v2(
     )
 
     # -----------------------------
-    # DESTACADOS
+    # DESTACADOS (un scatter por categoría + etiquetas solo de esas filas)
     # -----------------------------
-    for _, r in df_f.iterrows():
-        jugador = str(r[label_col]).strip()
-        jn = _norm(jugador)
-        equipo = str(r[team_col]) if team_col in df_f.columns else ""
-
-        is_player = jn in jugadores_norm
-        is_team = equipo_norm and equipo_norm in _norm(equipo)
-        is_top = jn in destacados_top_norm
+    face = np.empty(len(df_f), dtype=object)
+    face[is_player] = [colores_norm.get(jn, color_destacado) for jn in labels_norm[is_player]]
+    face[is_team] = color_equipo
+    face[is_top] = color_top
 
-        if not (is_player or is_team or is_top):
+    for sel, sz, z in ((is_player, 70, 5), (is_team, 60, 4), (is_top, 50, 3)):
+        if not sel.any():
             continue
-
-        if is_player:
-            fc = colores_norm.get(jn, color_destacado)
-            sz, z = 70, 5
-        elif is_team:
-            fc = color_equipo
-            sz, z = 60, 4
-        else:
-            fc = color_top
-            sz, z = 50, 3
-
         ax.scatter(
-            r[x_col],
-            r[y_col],
+            x[sel],
+            y[sel],
             s=sz,
-            c=fc,
+            c=list(face[sel]),
             edgecolors="black",
             linewidths=0.8,
             zorder=z,
         )
 
+    labels = df_f[label_col].to_numpy()
+    for i in np.flatnonzero(is_player | is_team | is_top):
+        fc = face[i]
         ax.annotate(
-            jugador,
-            (r[x_col], r[y_col]),
+            str(labels[i]).strip(),
+            (x[i], y[i]),
             textcoords="offset points",
             xytext=(14, 10),
             fontsize=10,          # ⬅️ tamaño etiquetas
-            fontweight="bold" if is_player else "normal",
+            fontweight="bold" if is_player[i] else "normal",
             fontproperties=font,
             color="black",
             bbox=dict(
@@ -290,7 +304,7 @@ def plot_scatter_v2(
                 ec=fc,
                 alpha=0.95,
             ),
-            zorder=z + 1,
+            zorder=(5 if is_player[i] else 4 if is_team[i] else 3) + 1,
         )
 
     # -----------------------------
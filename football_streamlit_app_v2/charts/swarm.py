@@ -0,0 +1,215 @@
+"""
+Motor de swarm (beeswarm real) para poblaciones grandes.
+
+seaborn.swarmplot prueba candidatos contra todos los vecinos uno por uno
+(cuadrático): por eso bees solo lo usaba hasta 150 puntos. Acá:
+
+1. Los puntos se pasan a unidades de "diámetros" (px / diámetro en px):
+   el layout no depende del dpi, así preview (200) y export (300) comparten
+   el mismo resultado cacheado.
+2. Barrido ordenado por valor: los únicos vecinos posibles de un punto son
+   los ya colocados a menos de un diámetro en x (ventana deslizante).
+3. Cada vecino prohíbe un intervalo en y; se unen los intervalos (NumPy)
+   y se toma el hueco libre más cercano al centro.
+4. Si el enjambre no entra en SWARM_KNEE del ancho de la categoría, se
+   achica el marcador (y se rehace el layout) hasta que entre: la densidad
+   se ve como puntos más chicos, no como puntos encimados.
+5. Solo si ni con SWARM_MIN_SCALE entra, lo que pasa de SWARM_KNEE se
+   comprime suavemente (tanh) hacia el borde. Ahí (y solo ahí) las columnas
+   más altas se solapan (seaborn las apila todas en el borde).
+
+El layout se calcula al dibujar (como seaborn), con las transformaciones
+finales del eje (después de tight_layout), y se cachea por valores + escala.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.collections import PathCollection
+
+# 🔧 AJUSTES
+SWARM_GAP = 1.05            # separación mínima entre centros (en diámetros)
+SWARM_KNEE = 0.75           # fracción del semiancho que se respeta tal cual; el resto se comprime
+SWARM_MIN_SCALE = 0.4       # mínimo al que se achica el marcador para que el swarm entre
+SWARM_FIT_STEPS = 3         # layouts como máximo para encontrar ese tamaño
+SWARM_CACHE_ENTRIES = 256   # layouts guardados (uno por métrica / población / escala)
+
+_PACKING = 0.6              # altura del swarm ≈ _PACKING · pico de puntos por diámetro (medido)
+
+_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# =========================================================
+# LAYOUT
+# =========================================================
+def swarm_offsets(x: np.ndarray, gap: float = SWARM_GAP) -> np.ndarray:
+    """
+    x en unidades de diámetro → desplazamiento perpendicular de cada punto
+    (mismas unidades, centrado en 0), sin solapes. No acota la altura:
+    encajarlo en el ancho de la categoría lo hace swarm_scatter.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    order = np.argsort(x, kind="stable")
+    xs = x[order]
+    ys = np.zeros(n)
+
+    d2 = gap * gap
+    lo = 0
+    flip = False
+    for i in range(1, n):
+        xi = xs[i]
+        while xs[lo] <= xi - gap:
+            lo += 1
+        if lo == i:
+            continue
+
+        # intervalos prohibidos por los vecinos de la ventana
+        h = np.sqrt(np.maximum(d2 - (xi - xs[lo:i]) ** 2, 0.0))
+        yj = ys[lo:i]
+        starts = yj - h
+        ends = yj + h
+
+        if not ((starts < 0.0) & (ends > 0.0)).any():
+            continue  # el centro está libre
+
+        # unión de intervalos → grupos disjuntos
+        srt = np.argsort(starts)
+        s, e = starts[srt], ends[srt]
+        emax = np.maximum.accumulate(e)
+        new = np.empty(len(s), dtype=bool)
+        new[0] = True
+        new[1:] = s[1:] > emax[:-1]
+        idx = np.flatnonzero(new)
+        g_start = s[idx]
+        g_end = np.maximum.reduceat(e, idx)
+
+        # el grupo que contiene al 0: sus bordes son los huecos más cercanos
+        k = np.searchsorted(g_start, 0.0, side="left") - 1
+        a, b = g_start[k], g_end[k]
+        if -a < b or (-a == b and flip):
+            ys[i] = a
+        else:
+            ys[i] = b
+        flip = not flip
+
+    out = np.empty(n)
+    out[order] = ys
+    return out
+
+
+def _layout_key(x: np.ndarray, gap: float) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.round(x, 3).tobytes())
+    h.update(repr(gap).encode())
+    return h.hexdigest()
+
+
+def cached_swarm_offsets(x: np.ndarray, gap: float = SWARM_GAP) -> np.ndarray:
+    """swarm_offsets con caché LRU (mismos valores + misma escala → mismo layout)."""
+    key = _layout_key(np.asarray(x, dtype=np.float64), gap)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+            return hit
+
+    ys = swarm_offsets(x, gap)
+    with _cache_lock:
+        _cache[key] = ys
+        while len(_cache) > SWARM_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return ys
+
+
+def clear_swarm_cache() -> None:
+    """Vacía los layouts guardados (benchmarks / tests de tiempos en frío)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _soft_clip(y: np.ndarray, half: float, knee: float = SWARM_KNEE) -> np.ndarray:
+    """Lineal hasta knee·half; de ahí al borde con tanh (nunca pasa de half)."""
+    k = knee * half
+    mag = np.abs(y)
+    over = mag > k
+    if not over.any():
+        return y
+    room = half - k
+    out = y.copy()
+    out[over] = np.sign(y[over]) * (k + room * np.tanh((mag[over] - k) / room))
+    return out
+
+
+# =========================================================
+# ARTISTA
+# =========================================================
+def swarm_scatter(
+    ax,
+    values: np.ndarray,
+    colors,
+    size: float,
+    center: float = 0.0,
+    width: float = 0.8,
+    alpha: float = 1.0,
+):
+    """
+    Scatter horizontal en forma de swarm alrededor de y=center.
+    colors: array RGBA por punto. size: diámetro del marcador en puntos
+    (máximo: si el swarm no entra en el ancho se achica, ver módulo).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    points = ax.scatter(values, np.full(n, center), c=colors, s=size ** 2, alpha=alpha, linewidths=0)
+    if n < 2:
+        return points
+
+    half = width / 2
+
+    def draw(self, renderer):
+        fig = self.axes.figure
+        diam_px = size * fig.dpi / 72.0
+
+        # valores → px → diámetros (solo importa la escala horizontal; se
+        # descuenta el origen para que mover el eje no invalide la caché)
+        px = self.axes.transData.transform(np.c_[values, np.full(n, center)])
+        x_px = px[:, 0] - px[:, 0].min()
+        room_px = SWARM_KNEE * abs(
+            self.axes.transData.transform((0.0, center + half))[1]
+            - self.axes.transData.transform((0.0, center))[1]
+        )
+
+        # si no entra, achicar el marcador: la altura de una columna crece
+        # ~ con el diámetro², así que se corrige con la raíz del exceso. El
+        # primer tamaño sale de la densidad (pico de puntos por diámetro),
+        # para no pagar un layout a tamaño completo que después se descarta
+        peak = np.bincount((x_px // diam_px).astype(np.int64)).max()
+        ext_px = _PACKING * peak * diam_px
+        scale = float(np.clip(np.sqrt(room_px / ext_px), SWARM_MIN_SCALE, 1.0))
+        for step in range(SWARM_FIT_STEPS):
+            d_px = diam_px * scale
+            ys = cached_swarm_offsets(x_px / d_px)
+            ext_px = np.abs(ys).max() * d_px
+            if ext_px <= room_px or scale <= SWARM_MIN_SCALE or step == SWARM_FIT_STEPS - 1:
+                break
+            scale = max(scale * 0.97 * np.sqrt(room_px / ext_px), SWARM_MIN_SCALE)
+        self.set_sizes([(size * scale) ** 2])
+
+        # diámetros → unidades de datos en y (misma conversión que seaborn)
+        y0 = self.axes.transData.inverted().transform(px)[:, 1]
+        y_px = px[:, 1] + ys * d_px
+        y_data = self.axes.transData.inverted().transform(np.c_[px[:, 0], y_px])[:, 1] - y0
+
+        # solo si ni al mínimo entra: lo que sobra se comprime hacia el borde
+        y_data = _soft_clip(y_data, half)
+
+        self.set_offsets(np.c_[values, center + y_data])
+        PathCollection.draw(self, renderer)
+
+    points.draw = types.MethodType(draw, points)
+    return points
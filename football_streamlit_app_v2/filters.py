@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 
 # --------------------------------------------------
 # Helpers
@@ -8,6 +9,56 @@ def _sorted_unique(series):
     return sorted([x for x in series.dropna().unique().tolist()])
 
 
+# nombres crudos (Wyscout) y renombrados por src/data.RENAME_MAP
+MINUTOS_COLS = ("Minutos jugados", "minutos_jugados")
+POSICION_COLS = ("Posición específica", "posicion")
+
+
+def _first_col(df: pd.DataFrame, candidates):
+    return next((c for c in candidates if c in df.columns), None)
+
+
+# --------------------------------------------------
+# Máscaras (sin copiar el DataFrame)
+# --------------------------------------------------
+# Los filtros se expresan como máscaras booleanas sobre el df base y se
+# combinan con AND; recién al final se materializa df[mask] (costo ∝ resultado).
+
+def isin_mask(df: pd.DataFrame, col: str, values):
+    """Máscara de df[col].isin(values), o None si el filtro no aplica."""
+    if not values or col not in df.columns:
+        return None
+    return df[col].isin(values).to_numpy()
+
+
+def range_mask(df: pd.DataFrame, col: str, min_v=None, max_v=None):
+    """Máscara min_v <= df[col] <= max_v (extremos opcionales), o None."""
+    if col not in df.columns or (min_v is None and max_v is None):
+        return None
+    s = df[col]
+    m = np.ones(len(df), dtype=bool)
+    if min_v is not None:
+        m &= (s >= min_v).to_numpy()
+    if max_v is not None:
+        m &= (s <= max_v).to_numpy()
+    return m
+
+
+def combine_masks(*masks):
+    """AND de las máscaras no-None. None si ninguna aplica (= todas las filas)."""
+    out = None
+    for m in masks:
+        if m is None:
+            continue
+        out = m if out is None else (out & m)
+    return out
+
+
+def masked(df: pd.DataFrame, mask):
+    """Materializa el resultado (única copia del pipeline)."""
+    return df if mask is None else df[mask]
+
+
 # --------------------------------------------------
 # UI de filtros globales
 # --------------------------------------------------
@@ -77,9 +128,10 @@ def global_filters_ui(df: pd.DataFrame):
             )
 
     with c6:
-        if "Minutos jugados" in df.columns:
-            mn = int(df["Minutos jugados"].min())
-            mx = int(df["Minutos jugados"].max())
+        col_min = _first_col(df, MINUTOS_COLS)
+        if col_min is not None:
+            mn = int(df[col_min].min())
+            mx = int(df[col_min].max())
             f["Minutos"] = st.slider(
                 "Minutos jugados",
                 mn,
@@ -98,29 +150,37 @@ def global_filters_ui(df: pd.DataFrame):
                 key="f_pie",
             )
 
+    col_pos = _first_col(df, POSICION_COLS)
+    if col_pos is not None:
+        f["posicion_contains"] = st.text_input(
+            "Posición contiene (texto)",
+            value=f.get("posicion_contains", ""),
+            key="f_posicion_txt",
+        )
+
 
 # --------------------------------------------------
 # Aplicar filtros
 # --------------------------------------------------
 def apply_global_filters(df: pd.DataFrame) -> pd.DataFrame:
     f = st.session_state.get("global_filters", {})
-    out = df.copy()
 
-    def _isin(col):
-        nonlocal out
-        vals = f.get(col, [])
-        if vals and col in out.columns:
-            out = out[out[col].isin(vals)]
+    masks = [isin_mask(df, c, f.get(c, [])) for c in ["Temporada", "País", "Liga", "Equipo", "Pie"]]
 
-    for c in ["Temporada", "País", "Liga", "Equipo", "Pie"]:
-        _isin(c)
+    if "Edad" in f:
+        masks.append(range_mask(df, "Edad", *f["Edad"]))
 
-    if "Edad" in f and "Edad" in out.columns:
-        mn, mx = f["Edad"]
-        out = out[(out["Edad"] >= mn) & (out["Edad"] <= mx)]
+    col_min = _first_col(df, MINUTOS_COLS)
+    if col_min is not None:
+        if "Minutos" in f:
+            masks.append(range_mask(df, col_min, *f["Minutos"]))
+        if f.get("min_minutos") is not None:
+            masks.append(range_mask(df, col_min, min_v=f["min_minutos"]))
 
-    if "Minutos" in f and "Minutos jugados" in out.columns:
-        mn, mx = f["Minutos"]
-        out = out[(out["Minutos jugados"] >= mn) & (out["Minutos jugados"] <= mx)]
+    col_pos = _first_col(df, POSICION_COLS)
+    if col_pos is not None and f.get("posicion_contains"):
+        masks.append(
+            df[col_pos].astype(str).str.contains(f["posicion_contains"], case=False, na=False).to_numpy()
+        )
 
-    return out
\ No newline at end of file
+    return masked(df, combine_masks(*masks))
\ No newline at end of file
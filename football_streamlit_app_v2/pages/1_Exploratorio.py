@@ -1,11 +1,8 @@
 # pages/1_Exploratorio.py
 import streamlit as st
 import pandas as pd
-import numpy as np
-import io
-import zipfile
 import warnings
-import matplotlib.pyplot as plt
+from functools import partial
 from pathlib import Path
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -27,9 +24,11 @@ st.set_page_config(
 # =========================================================
 from src.theme import inject_streamlit_theme, BG_DARK
 from ui.header import render_header
+from ui.memory import render_memory_panel
 
 inject_streamlit_theme()
 render_header(title="InLab Sports", subtitle="Exploratorio de datos", beta=True)
+render_memory_panel()
 
 # =========================================================
 # IMPORTS DE DOMINIO
@@ -38,7 +37,25 @@ from config.positions import BASE_POSITIONS
 from config.roles import ROLES
 from charts.bees import beeswarm_grid, beeswarm_single
 from charts.scatter import plot_scatter_v2
-from charts.radar import graficar_radar
+from charts.radar import (
+    RADAR_EXPORT_DPI,
+    RADAR_PREVIEW_DPI,
+    graficar_radar,
+    graficar_radares,
+    radares_png,
+)
+from filters import range_mask, combine_masks, masked
+from src.filter_index import get_filter_index
+from src.export_utils import TempZip, stream_zip
+from src.parallel_render import RenderJob, render_many
+from src.player_index import player_index, player_label
+from src.render_cache import (
+    LazyRender,
+    data_fingerprint,
+    get_render_cache,
+    png_bytes,
+    render_key,
+)
 
 # =========================================================
 # HELPERS FIG (FONDO PARA COPY/PASTE)
@@ -63,11 +80,187 @@ def set_fig_bg(fig, color=BG_DARK):
     except Exception:
         pass
 
-def show_fig(fig):
-    if fig is None:
-        return
+PREVIEW_DPI = 200
+
+
+def png_preview(fig) -> bytes:
+    """PNG para mostrar en pantalla (mismo look que st.pyplot)."""
+    set_fig_bg(fig, BG_DARK)
+    return png_bytes(fig, dpi=PREVIEW_DPI)
+
+
+def png_export(fig) -> bytes:
+    """PNG de descarga (300 dpi): la figura ya viene transparente (render_target="export")."""
+    return png_bytes(fig, dpi=300)
+
+
+def radar_png_preview(fig) -> bytes:
+    """PNG de pantalla del radar: resolución liviana (RADAR_PREVIEW_DPI), el detalle queda para el export."""
     set_fig_bg(fig, BG_DARK)
-    st.pyplot(fig)
+    return png_bytes(fig, dpi=RADAR_PREVIEW_DPI)
+
+
+def radar_png_export(fig) -> bytes:
+    """PNG de descarga del radar (armado con render_target="export": sin Rectangle de fondo)."""
+    return png_bytes(fig, dpi=RADAR_EXPORT_DPI, pad_inches=0.05)
+
+
+def show_png(png):
+    if png is None:
+        return
+    st.image(png, width="stretch")
+
+
+def radar_pngs(specs: dict, variante: str, exportador, store: bool = True):
+    """
+    (nombre, png) de cada radar de specs {nombre: (key, kwargs)}. Lo que ya
+    está en la caché sale de ahí; el resto se estampa sobre UNA figura base
+    (charts.radar.graficar_radares: rangos, anillos y etiquetas una vez).
+    Los previews van sobre el fondo ya rasterizado (charts.radar.radares_png):
+    cambiar de jugadores con las mismas métricas no redibuja el radar vacío.
+    """
+    cache = get_render_cache()
+    faltan = []
+    for nombre, (key, _) in specs.items():
+        png = cache.get(f"{key}:{variante}")
+        if png is None:
+            faltan.append(nombre)
+        else:
+            yield nombre, png
+    if not faltan:
+        return
+
+    src = ss.radar_src
+    combos = [specs[n][1] for n in faltan]
+    if variante == "preview":
+        lote = radares_png(src["df"], combos, src["metricas"], dpi=RADAR_PREVIEW_DPI)
+    else:
+        lote = graficar_radares(src["df"], combos, src["metricas"], export=exportador, render_target=variante)
+    for i, png in lote:
+        nombre = faltan[i]
+        if store:
+            cache.put(f"{specs[nombre][0]}:{variante}", png)
+        yield nombre, png
+
+
+def caption_repetidos(jugadores):
+    """Avisa qué jugadores tienen varias filas (temporadas / equipos) en el filtro."""
+    if not jugadores or "Jugador" not in ss.df_filtrado.columns:
+        return
+    repetidos = player_index(ss.df_filtrado).ambiguous(jugadores)
+    if repetidos:
+        detalle = ", ".join(f"{j} ({n})" for j, n in repetidos.items())
+        st.caption(f"ℹ️ Con varias filas en el filtro: {detalle}. Se usa la primera; filtrá por temporada para elegir otra.")
+
+
+def elegir_temporadas(jugadores, key: str) -> list:
+    """
+    Jugadores con varias filas en el filtro: un selectbox por jugador para
+    elegir la temporada (y equipo si hace falta). Devuelve las claves de
+    src/player_index.py: (nombre, temporada[, equipo]) o el nombre solo.
+    """
+    if not jugadores or "Jugador" not in ss.df_filtrado.columns:
+        return list(jugadores)
+    idx = player_index(ss.df_filtrado)
+    claves = []
+    for j in jugadores:
+        opciones = idx.options(j)
+        if len(opciones) > 1:
+            claves.append(st.selectbox(
+                f"Temporada – {j}",
+                opciones,
+                format_func=lambda o: " · ".join(str(v) for v in o[1:]),
+                key=f"{key}_{j}",
+            ))
+        else:
+            claves.append(j)
+    # sin columna de temporada no hay qué elegir: queda el aviso
+    caption_repetidos([j for j, c in zip(jugadores, claves) if c == j])
+    return claves
+
+
+def lazy_imgs(key, render_fn, export=png_export) -> dict:
+    """
+    {"preview": bytes ya codificados, "export": LazyRender}.
+    El export (300 dpi) NO se codifica acá: recién cuando se prepara la descarga.
+    render_fn recibe render_target ("preview" / "export"): cada variante se
+    arma con su fondo en vez de retocar la figura al exportar.
+    """
+    lazy = LazyRender(key, render_fn, {"preview": png_preview, "export": export}, targeted=True)
+    return {"preview": lazy.get("preview"), "export": lazy}
+
+
+def export_ready(section: str, firma) -> bool:
+    """
+    True si ya se pidió la exportación de estos gráficos (firma = sus claves).
+    Mientras no, muestra el botón y no se codifica nada en los reruns.
+    """
+    if ss.export_ready.get(section) == firma:
+        return True
+    if st.button("📦 Preparar exportación", key=f"prep_export_{section}"):
+        ss.export_ready[section] = firma
+        return True
+    return False
+
+
+def export_zip(section: str, firma, items, total: int) -> TempZip:
+    """
+    ZIP en disco de la sección (se arma una vez por firma). items es un
+    generador (nombre, png) que se consume de a uno: nunca hay más de un
+    PNG de export en memoria, sea cual sea el tamaño del paquete.
+    """
+    actual = ss.export_zips.get(section)
+    if actual is not None and actual[0] == firma:
+        return actual[1]
+    ss.export_zips.pop(section, None)  # suelta (y borra) el ZIP anterior
+
+    progreso = st.progress(0.0, text="Armando exportación…")
+    tz = stream_zip(
+        items,
+        on_item=lambda n, _: progreso.progress(n / max(total, 1), text=f"Armando exportación… {n}/{total}"),
+    )
+    progreso.empty()
+    ss.export_zips[section] = (firma, tz)
+    return tz
+
+
+def zip_download(section: str, firma, items, total: int, file_name: str) -> None:
+    """
+    ZIP de la sección bajo demanda: hasta que no se toca "Armar ZIP" no se
+    escribe ni se lee nada (items es un generador, no corre si no se pide).
+    Los bytes solo se leen mientras el botón de descarga está a la vista y
+    el archivo se suelta apenas se descarga.
+    """
+    actual = ss.export_zips.get(section)
+    if actual is None or actual[0] != firma:
+        if not st.button("🗜️ Armar ZIP con todo", key=f"armar_zip_{section}"):
+            return
+        export_zip(section, firma, items, total)
+
+    st.download_button(
+        "🗜️ Descargar TODO (ZIP)",
+        data=ss.export_zips[section][1].read(),
+        file_name=file_name,
+        mime="application/zip",
+        key=f"download_zip_{section}",
+        on_click=lambda: ss.export_zips.pop(section, None),
+    )
+
+
+def export_picker(section: str, opciones: dict):
+    """
+    opciones: {etiqueta: (filename, fn → png)}. Un selectbox y UN botón:
+    solo se codifica la imagen elegida (sale de la caché si ya estaba).
+    """
+    elegido = st.selectbox("Imagen a descargar", list(opciones), key=f"pick_export_{section}")
+    filename, get_png = opciones[elegido]
+    st.download_button(
+        label=f"⬇️ Descargar – {elegido}",
+        data=get_png(),
+        file_name=filename,
+        mime="image/png",
+        key=f"dl_pick_{section}",
+    )
 
 # =========================================================
 # SESSION STATE – INIT
@@ -75,10 +268,14 @@ def show_fig(fig):
 ss = st.session_state
 ss.setdefault("df_filtrado", None)
 
-ss.setdefault("bees_figs", {})
+# los gráficos se guardan como PNG (src/render_cache.py), no como figuras
+ss.setdefault("bees_imgs", {})
 ss.setdefault("bees_last_ui", {})      # para export individual por métrica
-ss.setdefault("scatter_params", {"fig": None, "color_equipo": "#ff0000"})
-ss.setdefault("radar_figs", {})
+ss.setdefault("scatter_params", {"img": None, "color_equipo": "#ff0000"})
+ss.setdefault("radar_imgs", {})
+ss.setdefault("radar_src", None)      # df + métricas del último lote (export en lote)
+ss.setdefault("export_ready", {})  # sección → firma de lo que ya se preparó para descargar
+ss.setdefault("export_zips", {})   # sección → (firma, TempZip en disco); se suelta al descargar
 ss.setdefault("radar_last_ui", {})     # para export
 
 # =========================================================
@@ -88,82 +285,53 @@ if "df" not in ss or ss["df"] is None:
     st.warning("⚠️ Primero cargá una base de datos en la página principal.")
     st.stop()
 
-df = ss["df"].copy()
-df.columns = df.columns.str.strip()
-
-# =========================================================
-# HELPERS
-# =========================================================
-def parse_positions(cell):
-    if pd.isna(cell):
-        return set()
-    return {p.strip() for p in str(cell).split(",") if p.strip()}
-
-def filter_by_positions(df_in, positions):
-    if not positions:
-        return df_in
-    return df_in[
-        df_in["Posición específica"].apply(lambda x: bool(parse_positions(x) & set(positions)))
-    ]
-
-def filter_by_roles(df_in, roles):
-    if not roles:
-        return df_in
-    pos = set()
-    for r in roles:
-        pos.update(ROLES.get(r, []))
-    return df_in[
-        df_in["Posición específica"].apply(lambda x: bool(parse_positions(x) & pos))
-    ]
+# Solo lectura: sin .copy() por rerun. Los nombres de columna ya vienen
+# normalizados desde la carga (src/ingest.py); solo se corrige si no.
+df = ss["df"]
+if any(str(c) != str(c).strip() for c in df.columns):
+    df = ss["df"] = df.rename(columns=lambda c: str(c).strip())
 
 # =========================================================
 # 🎛️ FILTROS GLOBALES (CASCADA EN VIVO)
 # =========================================================
 st.markdown("## 🎛️ Filtros globales")
 
-df_base = df.copy()
-
 c1, c2, c3, c4 = st.columns(4)
 
+# índice por dataset: opciones + selección por bitmaps (sin refiltrar el df)
+fidx = get_filter_index(ss.get("df_key") or f"id-{id(df)}", df)
+
 with c1:
-    temporadas_opts = sorted(df_base["Temporada"].dropna().unique().tolist()) if "Temporada" in df_base.columns else []
     temporadas_sel = st.multiselect(
         "Temporada",
-        temporadas_opts,
+        fidx.options("Temporada"),
         key="f_temporada",
     )
 
-df_tmp = df_base.copy()
-if temporadas_sel and "Temporada" in df_tmp.columns:
-    df_tmp = df_tmp[df_tmp["Temporada"].isin(temporadas_sel)]
+b_cascada = fidx.select("Temporada", temporadas_sel)
 
 with c2:
-    paises_opts = sorted(df_tmp["País"].dropna().unique().tolist()) if "País" in df_tmp.columns else []
     paises_sel = st.multiselect(
         "País (competición)",
-        paises_opts,
+        fidx.options("País", b_cascada),
         key="f_pais",
     )
 
-if paises_sel and "País" in df_tmp.columns:
-    df_tmp = df_tmp[df_tmp["País"].isin(paises_sel)]
+b_cascada = fidx.intersect(b_cascada, fidx.select("País", paises_sel))
 
 with c3:
-    ligas_opts = sorted(df_tmp["Liga"].dropna().unique().tolist()) if "Liga" in df_tmp.columns else []
     ligas_sel = st.multiselect(
         "Liga",
-        ligas_opts,
+        fidx.options("Liga", b_cascada),
         key="f_liga",
     )
 
-if ligas_sel and "Liga" in df_tmp.columns:
-    df_tmp = df_tmp[df_tmp["Liga"].isin(ligas_sel)]
+b_cascada = fidx.intersect(b_cascada, fidx.select("Liga", ligas_sel))
 
 with c4:
-    equipos_opts = sorted(df_tmp["Equipo"].dropna().unique().tolist()) if "Equipo" in df_tmp.columns else []
     equipos_sel = st.multiselect(
         "Equipo",
-        equipos_opts,
+        fidx.options("Equipo", b_cascada),
         key="f_equipo",
     )
 
@@ -176,33 +344,33 @@ c5, c6, c7 = st.columns(3)
 
 with c5:
     edades = None
-    if "Edad" in df_base.columns and df_base["Edad"].notna().any():
+    if "Edad" in df.columns and df["Edad"].notna().any():
         edades = st.slider(
             "Edad",
-            int(df_base["Edad"].min()),
-            int(df_base["Edad"].max()),
-            (int(df_base["Edad"].min()), int(df_base["Edad"].max())),
+            int(df["Edad"].min()),
+            int(df["Edad"].max()),
+            (int(df["Edad"].min()), int(df["Edad"].max())),
             key="f_edad",
         )
 
 with c6:
     minutos = None
-    if "Minutos jugados" in df_base.columns and df_base["Minutos jugados"].notna().any():
+    if "Minutos jugados" in df.columns and df["Minutos jugados"].notna().any():
         minutos = st.slider(
             "Minutos jugados (mínimo)",
-            int(df_base["Minutos jugados"].min()),
-            int(df_base["Minutos jugados"].max()),
-            int(df_base["Minutos jugados"].min()),
+            int(df["Minutos jugados"].min()),
+            int(df["Minutos jugados"].max()),
+            int(df["Minutos jugados"].min()),
             step=50,
             key="f_minutos",
         )
 
 with c7:
     pies_sel = []
-    if "Pie" in df_base.columns:
+    if "Pie" in df.columns:
         pies_sel = st.multiselect(
             "Pie hábil",
-            sorted(df_base["Pie"].dropna().unique().tolist()),
+            fidx.options("Pie"),
             key="f_pie",
         )
 
@@ -226,38 +394,25 @@ else:
     posiciones_sel = []
 
 # =========================================================
-# APLICAR FILTROS
+# APLICAR FILTROS (máscaras combinadas → una sola selección)
 # =========================================================
 if st.button("✅ Aplicar filtros", type="primary", key="btn_apply_filters"):
-    df_f = df_base.copy()
-
-    # cascada
-    if temporadas_sel and "Temporada" in df_f.columns:
-        df_f = df_f[df_f["Temporada"].isin(temporadas_sel)]
-    if paises_sel and "País" in df_f.columns:
-        df_f = df_f[df_f["País"].isin(paises_sel)]
-    if ligas_sel and "Liga" in df_f.columns:
-        df_f = df_f[df_f["Liga"].isin(ligas_sel)]
-    if equipos_sel and "Equipo" in df_f.columns:
-        df_f = df_f[df_f["Equipo"].isin(equipos_sel)]
-
-    # edad / minutos
-    if edades and "Edad" in df_f.columns:
-        df_f = df_f[(df_f["Edad"] >= edades[0]) & (df_f["Edad"] <= edades[1])]
-    if minutos is not None and "Minutos jugados" in df_f.columns:
-        df_f = df_f[df_f["Minutos jugados"] >= minutos]
-
-    # pie
-    if pies_sel and "Pie" in df_f.columns:
-        df_f = df_f[df_f["Pie"].isin(pies_sel)]
-
-    # posición / rol
-    if modo_pos == "Posición":
-        df_f = filter_by_positions(df_f, posiciones_sel)
-    else:
-        df_f = filter_by_roles(df_f, roles_sel)
+    # cascada + pie + posición/rol: intersección de bitmaps del índice
+    b_sel = fidx.intersect(
+        b_cascada,
+        fidx.select("Equipo", equipos_sel),
+        fidx.select("Pie", pies_sel),
+        fidx.select_positions(posiciones_sel) if modo_pos == "Posición" else fidx.select_roles(roles_sel),
+    )
 
-    ss.df_filtrado = df_f
+    mask = combine_masks(
+        fidx.to_mask(b_sel),
+        # edad / minutos
+        range_mask(df, "Edad", *edades) if edades else None,
+        range_mask(df, "Minutos jugados", min_v=minutos) if minutos is not None else None,
+    )
+
+    ss.df_filtrado = masked(df, mask)
 
 # =========================================================
 # RESULTADOS
@@ -298,6 +453,7 @@ with st.expander("🐝 Bees", expanded=True):
         max_selections=4,
         key="bees_players",
     )
+    caption_repetidos(jugadores)
 
     colores = []
     if jugadores:
@@ -332,7 +488,7 @@ with st.expander("🐝 Bees", expanded=True):
         if not metricas:
             st.warning("Seleccioná al menos una métrica.")
         else:
-            ss.bees_figs = {}
+            ss.bees_imgs = {}
             ss.bees_last_ui = {
                 "metricas": metricas,
                 "jugadores": jugadores,
@@ -341,35 +497,95 @@ with st.expander("🐝 Bees", expanded=True):
                 "modo_export": modo_export,
             }
 
+            # mismos datos + mismos parámetros → PNG desde la caché de renders
+            bees_fp = data_fingerprint(df_filtrado, list(metricas) + ["Jugador"])
+
             with st.spinner("Generando Bees…"):
                 if modo_viz == "Comparativo":
-                    fig = beeswarm_grid(
-                        df=df_filtrado,
-                        metrics=metricas,
-                        player=jugadores if jugadores else None,
-                        colors=colores if colores else None,
+                    player = jugadores if jugadores else None
+                    cols = colores if colores else None
+                    ss.bees_imgs["comparativo"] = lazy_imgs(
+                        render_key("bees_grid", bees_fp, metrics=metricas, player=player, colors=cols),
+                        partial(beeswarm_grid, df=df_filtrado, metrics=metricas, player=player, colors=cols),
                     )
-                    ss.bees_figs["comparativo"] = fig
                 else:
                     for idx, jugador in enumerate(jugadores):
-                        fig = beeswarm_grid(
-                            df=df_filtrado,
-                            metrics=metricas,
-                            player=[jugador],
-                            colors=[colores[idx]] if idx < len(colores) else None,
+                        cols = [colores[idx]] if idx < len(colores) else None
+                        ss.bees_imgs[jugador] = lazy_imgs(
+                            render_key("bees_grid", bees_fp, metrics=metricas, player=[jugador], colors=cols),
+                            # partial (no lambda): se evalúa recién al exportar, con los valores de ahora
+                            partial(beeswarm_grid, df=df_filtrado, metrics=metricas, player=[jugador], colors=cols),
                         )
-                        ss.bees_figs[jugador] = fig
 
     # ✅ Mostrar SIEMPRE desde session_state
-    if ss.bees_figs:
+    if ss.bees_imgs:
         st.markdown("### 📊 Bees generados")
-        for nombre, fig in ss.bees_figs.items():
-            show_fig(fig)
+        for nombre, imgs in ss.bees_imgs.items():
+            show_png(imgs["preview"])
 
 # =========================================================
 # ⬇️ EXPORTACIÓN BEES (NO REGENERA / NO DESAPARECE)
 # =========================================================
-if ss.bees_figs:
+def bees_single_job(df_metrica, huella, metrica, player, colors, filename, label) -> RenderJob:
+    """Export de una métrica suelta como trabajo del pool (solo viajan las columnas que usa)."""
+    key = render_key(
+        "bees_single",
+        huella,
+        metric=metrica,
+        player=player,
+        colors=colors,
+    )
+    return RenderJob(
+        key,
+        beeswarm_single,
+        {"df": df_metrica, "metric": metrica, "player": player, "colors": colors,
+         "render_target": "export"},
+        savefig={"dpi": 300},  # = png_export
+        meta=(filename, label),
+    )
+
+
+def bees_individual_jobs(df_src, metricas, jugadores, colores, modo_viz) -> list:
+    """
+    Trabajos del export "Individual por métrica". Recorte de columnas y
+    huella una vez por métrica (se comparten entre jugadores). Solo se
+    arma cuando ya se pidió la exportación (export_ready).
+    """
+    por_metrica = {
+        m: (df_src[[m, "Jugador"]], data_fingerprint(df_src, [m, "Jugador"]))
+        for m in metricas
+    }
+    jobs = []
+    if modo_viz == "Comparativo":
+        for metrica in metricas:
+            jobs.append(bees_single_job(
+                *por_metrica[metrica],
+                metrica,
+                player=jugadores if jugadores else None,
+                colors=colores if colores else None,
+                filename=f"bees_comparativo_{metrica}.png".replace(" ", "_").replace("/", "-"),
+                label=f"Comparativo – {metrica}",
+            ))
+    else:
+        for idx, jugador in enumerate(jugadores):
+            for metrica in metricas:
+                jobs.append(bees_single_job(
+                    *por_metrica[metrica],
+                    metrica,
+                    player=jugador,
+                    colors=[colores[idx]] if idx < len(colores) else None,
+                    filename=f"bees_{jugador}_{metrica}.png".replace(" ", "_").replace("/", "-"),
+                    label=f"{jugador} – {metrica}",
+                ))
+    return jobs
+
+
+def bees_job_png(job: RenderJob) -> bytes:
+    """PNG de un solo trabajo (en este proceso, queda en la caché)."""
+    return next(render_many([job], workers=1))[1]
+
+
+if ss.bees_imgs:
     st.markdown("### ⬇️ Exportar Bees")
 
     bees_ui = ss.bees_last_ui or {}
@@ -380,105 +596,52 @@ if ss.bees_figs:
     modo_viz_ui = st.session_state.get("bees_viz_mode", "Comparativo")
 
     if modo_export_ui == "Grilla":
-        zip_buf = io.BytesIO()
-        with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for nombre, fig in ss.bees_figs.items():
-                img_buf = io.BytesIO()
-                fig.savefig(img_buf, format="png", dpi=300, transparent=True, bbox_inches="tight")
-                img_buf.seek(0)
-
-                filename = f"bees_{nombre}.png".replace(" ", "_")
-                zipf.writestr(filename, img_buf.read())
-
-                st.download_button(
-                    label=f"⬇️ Descargar – {nombre}",
-                    data=img_buf.getvalue(),
-                    file_name=filename,
-                    mime="image/png",
-                    key=f"download_bees_{nombre}",
-                )
-
-        zip_buf.seek(0)
-        st.download_button(
-            "🗜️ Descargar TODO (ZIP)",
-            data=zip_buf,
-            file_name="bees_grilla.zip",
-            mime="application/zip",
-            key="download_bees_zip_grilla",
-        )
+        firma = tuple(imgs["export"].key for imgs in ss.bees_imgs.values())
+        if export_ready("bees_grilla", firma):
+            opciones = {
+                nombre: (f"bees_{nombre}.png".replace(" ", "_"), imgs["export"])
+                for nombre, imgs in ss.bees_imgs.items()
+            }
+            export_picker("bees_grilla", {k: (fn, partial(lazy.get, "export")) for k, (fn, lazy) in opciones.items()})
+            zip_download(
+                "bees_grilla",
+                firma,
+                ((fn, lazy.get("export", store=False)) for fn, lazy in opciones.values()),
+                total=len(opciones),
+                file_name="bees_grilla.zip",
+            )
 
     else:
-        zip_buf = io.BytesIO()
-        with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zipf:
-
-            if modo_viz_ui == "Comparativo":
-                for metrica in metricas_ui:
-                    fig_ind = beeswarm_single(
-                        df=df_filtrado,
-                        metric=metrica,
-                        player=jugadores_ui if jugadores_ui else None,
-                        colors=colores_ui if colores_ui else None,
-                    )
-
-                    img_buf = io.BytesIO()
-                    fig_ind.savefig(img_buf, format="png", dpi=300, transparent=True, bbox_inches="tight")
-                    img_buf.seek(0)
-
-                    filename = f"bees_comparativo_{metrica}.png".replace(" ", "_").replace("/", "-")
-                    zipf.writestr(filename, img_buf.read())
-
-                    st.download_button(
-                        label=f"⬇️ Comparativo – {metrica}",
-                        data=img_buf.getvalue(),
-                        file_name=filename,
-                        mime="image/png",
-                        key=f"dl_comp_{metrica}",
-                    )
-
-                    plt.close(fig_ind)
-
-            else:
-                for idx, jugador in enumerate(jugadores_ui):
-                    for metrica in metricas_ui:
-                        fig_ind = beeswarm_single(
-                            df=df_filtrado,
-                            metric=metrica,
-                            player=jugador,
-                            colors=[colores_ui[idx]] if idx < len(colores_ui) else None,
-                        )
-
-                        img_buf = io.BytesIO()
-                        fig_ind.savefig(img_buf, format="png", dpi=300, transparent=True, bbox_inches="tight")
-                        img_buf.seek(0)
-
-                        filename = f"bees_{jugador}_{metrica}.png".replace(" ", "_").replace("/", "-")
-                        zipf.writestr(filename, img_buf.read())
-
-                        st.download_button(
-                            label=f"⬇️ {jugador} – {metrica}",
-                            data=img_buf.getvalue(),
-                            file_name=filename,
-                            mime="image/png",
-                            key=f"dl_{jugador}_{metrica}",
-                        )
-
-                        plt.close(fig_ind)
-
-        zip_buf.seek(0)
-        st.download_button(
-            "🗜️ Descargar TODO (ZIP)",
-            data=zip_buf,
-            file_name="bees_individuales.zip",
-            mime="application/zip",
-            key="download_bees_zip_ind",
+        # firma barata (una huella sobre las métricas elegidas + la UI del último
+        # gráfico): los trabajos y sus recortes recién se arman al exportar
+        firma = render_key(
+            "bees_individual",
+            data_fingerprint(df_filtrado, list(metricas_ui) + ["Jugador"]),
+            ui=bees_ui,
+            modo_viz=modo_viz_ui,
         )
+        if export_ready("bees_individual", firma):
+            jobs = bees_individual_jobs(df_filtrado, metricas_ui, jugadores_ui, colores_ui, modo_viz_ui)
+            # figuras independientes → pool de procesos (src/parallel_render.py),
+            # cada PNG va directo al ZIP en disco sin quedar en la caché
+            export_picker(
+                "bees_individual",
+                {job.meta[1]: (job.meta[0], partial(bees_job_png, job)) for job in jobs},
+            )
+            zip_download(
+                "bees_individual",
+                firma,
+                ((job.meta[0], png) for job, png in render_many(jobs, store=False)),
+                total=len(jobs),
+                file_name="bees_individuales.zip",
+            )
 
 # =========================================================
 # 📡 SCATTER
 # =========================================================
 with st.expander("📡 Scatter", expanded=True):
 
-    numeric_cols = [c for c in df_filtrado.columns if np.issubdtype(df_filtrado[c].dtype, np.number)]
+    numeric_cols = [c for c in df_filtrado.columns if pd.api.types.is_numeric_dtype(df_filtrado[c])]
     if len(numeric_cols) < 2:
         st.info("Necesito al menos 2 métricas numéricas para el scatter.")
         st.stop()
@@ -555,8 +718,7 @@ with st.expander("📡 Scatter", expanded=True):
     # -------------------------------------------------
     if st.button("📡 Graficar Scatter", type="primary", key="run_scatter_btn"):
 
-        fig_scatter, _ = plot_scatter_v2(
-            df=df_filtrado,
+        scatter_kwargs = dict(
             x_col=x_col,
             y_col=y_col,
             label_col="Jugador",
@@ -569,26 +731,25 @@ with st.expander("📡 Scatter", expanded=True):
             top_n=top_n,   # 🔥 PASAMOS EL SLIDER
         )
 
-        ss.scatter_params["fig"] = fig_scatter
+        ss.scatter_params["img"] = lazy_imgs(
+            render_key(
+                "scatter",
+                data_fingerprint(df_filtrado, [x_col, y_col, "Jugador", "Equipo"]),
+                **scatter_kwargs,
+            ),
+            lambda render_target, df=df_filtrado, kw=scatter_kwargs: plot_scatter_v2(
+                df=df, render_target=render_target, **kw
+            )[0],
+        )
 
     # -------------------------------------------------
     # RENDER
     # -------------------------------------------------
-    fig_scatter = ss.scatter_params.get("fig")
-    if fig_scatter is not None:
+    scatter_img = ss.scatter_params.get("img")
+    if scatter_img is not None:
 
         st.markdown("### 📊 Scatter generado")
-        show_fig(fig_scatter)
-
-        buf = io.BytesIO()
-        fig_scatter.savefig(
-            buf,
-            format="png",
-            dpi=300,
-            transparent=True,
-            bbox_inches="tight",
-        )
-        buf.seek(0)
+        show_png(scatter_img["preview"])
 
         filename = (
             f"scatter_{x_col}_vs_{y_col}_top{top_n}.png"
@@ -596,17 +757,18 @@ with st.expander("📡 Scatter", expanded=True):
             .replace("/", "-")
         )
 
-        st.download_button(
-            "⬇️ Descargar PNG",
-            data=buf,
-            file_name=filename,
-            mime="image/png",
-            key="dl_scatter_png",
-        )
+        if export_ready("scatter", scatter_img["export"].key):
+            st.download_button(
+                "⬇️ Descargar PNG",
+                data=scatter_img["export"].get("export"),
+                file_name=filename,
+                mime="image/png",
+                key="dl_scatter_png",
+            )
 
 # =========================================================
 # 🕸 RADAR (MÉTRICAS EN FORM, COLORES REACTIVOS, CÁLCULO SOLO BOTÓN)
-# + EXPORT PNG TRANSPARENTE (apaga el Rectangle de fondo de radar.py)
+# + EXPORT PNG TRANSPARENTE (render_target="export" de charts/radar.py)
 # =========================================================
 with st.expander("🕸 Radar", expanded=True):
 
@@ -615,10 +777,8 @@ with st.expander("🕸 Radar", expanded=True):
     ss = st.session_state  # alias cómodo
 
     # --- init state ---
-    if "radar_figs" not in ss:
-        ss.radar_figs = {}
-    if "radar_last_inputs" not in ss:
-        ss.radar_last_inputs = None
+    if "radar_imgs" not in ss:
+        ss.radar_imgs = {}
     if "radar_go" not in ss:
         ss.radar_go = False
     if "radar_metrics_applied" not in ss:
@@ -649,6 +809,8 @@ with st.expander("🕸 Radar", expanded=True):
         max_selections=4,
         key="radar_players",
     )
+    # varias temporadas del mismo jugador → se elige cuál (claves nombre + temporada)
+    claves_radar = elegir_temporadas(jugadores_radar, key="radar_season")
 
     ref_ui = st.radio(
         "Referencia",
@@ -698,8 +860,24 @@ with st.expander("🕸 Radar", expanded=True):
         ss.radar_go = True
 
     # -----------------------------
-    # 4) CÁLCULO (solo si botón + inputs cambiaron)
+    # 4) CÁLCULO (solo con el botón; repetidos salen de la caché de renders)
     # -----------------------------
+    def radar_spec(jugadores, colores, referencia=None, color_referencia=None):
+        """kwargs de graficar_radar + su clave en la caché de renders."""
+        radar_kwargs = dict(
+            jugadores=list(jugadores),
+            metricas=list(metricas_aplicadas),
+            referencia=referencia,
+            colores_jugadores=list(colores),
+            color_referencia=color_referencia,
+        )
+        key = render_key(
+            "radar",
+            data_fingerprint(df_filtrado, list(metricas_aplicadas) + ["Jugador", "Temporada", "Equipo"]),
+            **radar_kwargs,
+        )
+        return key, radar_kwargs
+
     if ss.radar_go:
 
         if not metricas_aplicadas:
@@ -707,79 +885,61 @@ with st.expander("🕸 Radar", expanded=True):
         elif not jugadores_radar and ref_ui == "Ninguna":
             st.warning("Seleccioná jugadores o una referencia.")
         else:
-            radar_inputs = {
-                "metricas": tuple(metricas_aplicadas),
-                "jugadores": tuple(jugadores_radar),
-                "colores": tuple(colores_radar),
-                "ref": ref_map[ref_ui],
-                "color_ref": color_ref,
-                "modo": modo_export,
-                "n_rows": int(len(df_filtrado)),
-            }
-
-            if radar_inputs != ss.radar_last_inputs:
-                ss.radar_last_inputs = radar_inputs
-                ss.radar_figs = {}
+            specs = {}
+
+            # nombres de archivo / radar con la temporada elegida (player_label)
+            if modo_export == "Visualización simple":
+                specs["radar_general"] = radar_spec(
+                    claves_radar,
+                    colores_radar,
+                    referencia=ref_map[ref_ui],
+                    color_referencia=color_ref,
+                )
 
-                with st.spinner("Generando Radares…"):
+            elif modo_export == "Jugadores individuales":
+                for j, c in zip(claves_radar, colores_radar):
+                    specs[player_label(j)] = radar_spec([j], [c])
+
+            elif modo_export == "Jugador vs referencia":
+                for j, c in zip(claves_radar, colores_radar):
+                    specs[f"{player_label(j)}_vs_ref"] = radar_spec(
+                        [j],
+                        [c],
+                        referencia=ref_map[ref_ui],
+                        color_referencia=color_ref,
+                    )
 
-                    if modo_export == "Visualización simple":
-                        fig = graficar_radar(
-                            df=df_filtrado,
-                            jugadores=jugadores_radar,
-                            metricas=metricas_aplicadas,
-                            referencia=ref_map[ref_ui],
-                            colores_jugadores=colores_radar,
-                            color_referencia=color_ref,
-                        )
-                        ss.radar_figs["radar_general"] = fig
-
-                    elif modo_export == "Jugadores individuales":
-                        for j, c in zip(jugadores_radar, colores_radar):
-                            fig = graficar_radar(
-                                df=df_filtrado,
-                                jugadores=[j],
-                                metricas=metricas_aplicadas,
-                                colores_jugadores=[c],
-                            )
-                            ss.radar_figs[j] = fig
-
-                    elif modo_export == "Jugador vs referencia":
-                        for j, c in zip(jugadores_radar, colores_radar):
-                            fig = graficar_radar(
-                                df=df_filtrado,
-                                jugadores=[j],
-                                metricas=metricas_aplicadas,
-                                referencia=ref_map[ref_ui],
-                                colores_jugadores=[c],
-                                color_referencia=color_ref,
-                            )
-                            ss.radar_figs[f"{j}_vs_ref"] = fig
-
-                    elif modo_export == "Primero vs resto":
-                        base_j = jugadores_radar[0]
-                        base_c = colores_radar[0]
-                        for j, c in zip(jugadores_radar[1:], colores_radar[1:]):
-                            fig = graficar_radar(
-                                df=df_filtrado,
-                                jugadores=[base_j, j],
-                                metricas=metricas_aplicadas,
-                                colores_jugadores=[base_c, c],
-                            )
-                            ss.radar_figs[f"{base_j}_vs_{j}"] = fig
-
-                    elif modo_export == "Todas las combinaciones":
-                        for i in range(len(jugadores_radar)):
-                            for k in range(i + 1, len(jugadores_radar)):
-                                j1, j2 = jugadores_radar[i], jugadores_radar[k]
-                                c1_, c2_ = colores_radar[i], colores_radar[k]
-                                fig = graficar_radar(
-                                    df=df_filtrado,
-                                    jugadores=[j1, j2],
-                                    metricas=metricas_aplicadas,
-                                    colores_jugadores=[c1_, c2_],
-                                )
-                                ss.radar_figs[f"{j1}_vs_{j2}"] = fig
+            elif modo_export == "Primero vs resto":
+                base_j = claves_radar[0]
+                base_c = colores_radar[0]
+                for j, c in zip(claves_radar[1:], colores_radar[1:]):
+                    specs[f"{player_label(base_j)}_vs_{player_label(j)}"] = radar_spec([base_j, j], [base_c, c])
+
+            elif modo_export == "Todas las combinaciones":
+                for i in range(len(claves_radar)):
+                    for k in range(i + 1, len(claves_radar)):
+                        j1, j2 = claves_radar[i], claves_radar[k]
+                        c1_, c2_ = colores_radar[i], colores_radar[k]
+                        specs[f"{player_label(j1)}_vs_{player_label(j2)}"] = radar_spec([j1, j2], [c1_, c2_])
+
+            # todos comparten métricas → un solo fondo para todo el lote
+            ss.radar_src = {"df": df_filtrado, "metricas": list(metricas_aplicadas)}
+            with st.spinner("Generando Radares…"):
+                previews = dict(radar_pngs(specs, "preview", radar_png_preview))
+
+            ss.radar_imgs = {
+                nombre: {
+                    "preview": previews[nombre],
+                    "export": LazyRender(
+                        key,
+                        partial(graficar_radar, df=df_filtrado, **kw),
+                        {"preview": radar_png_preview, "export": radar_png_export},
+                        targeted=True,
+                    ),
+                    "spec": (key, kw),
+                }
+                for nombre, (key, kw) in specs.items()
+            }
 
         # IMPORTANTÍSIMO: apagar flag para no recalcular en reruns
         ss.radar_go = False
@@ -787,90 +947,26 @@ with st.expander("🕸 Radar", expanded=True):
 # -----------------------------
 # 5) RENDER + EXPORT (NO REGENERA)
 # -----------------------------
-if st.session_state.radar_figs:
+if st.session_state.radar_imgs:
     st.markdown("### 📊 Radares generados")
-    for nombre, fig in st.session_state.radar_figs.items():
-        show_fig(fig)
+    for nombre, imgs in st.session_state.radar_imgs.items():
+        show_png(imgs["preview"])
 
     st.markdown("### ⬇️ Exportar Radar")
-    for nombre, fig in st.session_state.radar_figs.items():
-
-        # ===== FIX TRANSPARENCIA REAL (oculta el Rectangle BG del radar.py) =====
-        from matplotlib.patches import Rectangle
-        from matplotlib.colors import to_rgba
-
-        bg_rgba = to_rgba(BG_DARK)
-
-        # Guardamos estado original para restaurar después
-        _orig = {
-            "fig_facecolor": fig.get_facecolor(),
-            "fig_alpha": fig.patch.get_alpha(),
+    firma = tuple(imgs["export"].key for imgs in st.session_state.radar_imgs.values())
+    if export_ready("radar", firma):
+        opciones = {
+            nombre: (f"radar_{nombre}.png".replace(" ", "_").replace("/", "-"), imgs["export"])
+            for nombre, imgs in st.session_state.radar_imgs.items()
         }
-
-        hidden_rects = []
-        try:
-            # 1) hacemos patch del figure transparente
-            fig.patch.set_facecolor("none")
-            fig.patch.set_alpha(0.0)
-
-            # 2) ocultamos el rectángulo de fondo (0,0)-(1,1) en coords de figura
-            for r in fig.findobj(Rectangle):
-                try:
-                    x, y = r.get_xy()
-                    w, h = r.get_width(), r.get_height()
-                    fc = r.get_facecolor()
-
-                    is_full_fig = (abs(x) < 1e-9 and abs(y) < 1e-9 and abs(w - 1) < 1e-9 and abs(h - 1) < 1e-9)
-                    is_bg_color = (fc is not None and tuple(fc) == tuple(bg_rgba))
-                    is_bg_z = (r.get_zorder() <= -50)
-
-                    if is_full_fig and is_bg_color and is_bg_z:
-                        hidden_rects.append((r, r.get_visible()))
-                        r.set_visible(False)
-                except Exception:
-                    pass
-
-            # 3) axes transparentes (por si alguno mete facecolor)
-            for ax in getattr(fig, "axes", []):
-                try:
-                    ax.set_facecolor("none")
-                    if hasattr(ax, "patch") and ax.patch is not None:
-                        ax.patch.set_alpha(0.0)
-                except Exception:
-                    pass
-
-            buf = io.BytesIO()
-            fig.savefig(
-                buf,
-                format="png",
-                dpi=300,
-                transparent=True,
-                facecolor="none",
-                edgecolor="none",
-                bbox_inches="tight",
-                pad_inches=0.05,
+        export_picker("radar", {k: (fn, partial(lazy.get, "export")) for k, (fn, lazy) in opciones.items()})
+
+        if len(opciones) > 1:
+            specs = {nombre: imgs["spec"] for nombre, imgs in st.session_state.radar_imgs.items()}
+            zip_download(
+                "radar",
+                firma,
+                ((opciones[nombre][0], png) for nombre, png in radar_pngs(specs, "export", radar_png_export, store=False)),
+                total=len(opciones),
+                file_name="radares.zip",
             )
-            buf.seek(0)
-
-        finally:
-            # Restaurar para que el preview siga perfecto
-            try:
-                fig.patch.set_facecolor(_orig["fig_facecolor"])
-                fig.patch.set_alpha(_orig["fig_alpha"])
-            except Exception:
-                pass
-
-            for r, was_visible in hidden_rects:
-                try:
-                    r.set_visible(was_visible)
-                except Exception:
-                    pass
-        # ======================================================================
-
-        st.download_button(
-            label=f"⬇️ Descargar – {nombre}",
-            data=buf,
-            file_name=(f"radar_{nombre}.png".replace(" ", "_").replace("/", "-")),
-            mime="image/png",
-            key=f"dl_radar_{nombre}",
-        )
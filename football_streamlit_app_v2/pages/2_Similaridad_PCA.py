@@ -1,16 +1,29 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 
 from src.state import init_state
-from src.data import uploader_ui
+from src.data import RENAME_MAP, uploader_ui
+from src.dataset_store import renamed_view
+from src.figures import subplots
+from filters import combine_masks, masked, range_mask
 from src.pca_similarity import run_pca_similarity
+from src.render_cache import cached_render, data_fingerprint, png_bytes, render_key
+from src.topk import top_k_frame
+from ui.memory import render_memory_panel
 
 init_state()
+render_memory_panel()
 
 st.title("🔎 Jugadores Similares (PCA)")
 
-# Asegurar dataset cargado (si entran directo a esta página)
-if st.session_state.df_raw is None:
+# Asegurar dataset cargado: primero la base de app.py (mismo frame compartido,
+# vista renombrada sin copia); si entran directo a esta página, uploader
+if st.session_state.get("df") is not None:
+    # la vista se arma una vez por dataset (df_key que guardó app.py), no en cada rerun
+    base_key = st.session_state.get("df_key")
+    if st.session_state.df_raw is None or st.session_state.get("df_raw_key") != base_key:
+        st.session_state.df_raw = renamed_view(st.session_state["df"], RENAME_MAP)
+        st.session_state.df_raw_key = base_key
+elif st.session_state.df_raw is None:
     df = uploader_ui()
     if df is not None:
         st.session_state.df_raw = df
@@ -43,12 +56,14 @@ min_minutos = st.slider("Minutos jugados mínimos", 0, int(df["minutos_jugados"]
 texto_posicion = st.text_input("Contiene en posición (ej: CB|LCB|RCB)", value="")
 
 if st.button("Aplicar filtro (posición/minutos)", type="primary"):
-    df_pos = df.copy()
-    if "minutos_jugados" in df_pos.columns:
-        df_pos = df_pos[df_pos["minutos_jugados"] >= min_minutos]
-    if texto_posicion and "posicion" in df_pos.columns:
-        df_pos = df_pos[df_pos["posicion"].astype(str).str.contains(texto_posicion, case=False, na=False)]
-    df_pos = df_pos.dropna(subset=kpis)
+    # máscaras sobre el frame compartido: solo se materializa el resultado
+    mask = combine_masks(
+        range_mask(df, "minutos_jugados", min_v=min_minutos),
+        df["posicion"].astype(str).str.contains(texto_posicion, case=False, na=False).to_numpy()
+        if texto_posicion and "posicion" in df.columns else None,
+        df[kpis].notna().all(axis=1).to_numpy(),
+    )
+    df_pos = masked(df, mask)
     st.session_state.df_pos = df_pos
     st.success(f"Base filtrada: {df_pos.shape[0]} filas")
 
@@ -79,14 +94,28 @@ if df_sim is None or df_modelado is None:
 
 st.subheader("3) Visualización PCA")
 # Scatter simple (luego lo llevamos a tu estética)
-fig, ax = plt.subplots()
-ax.scatter(df_modelado["PCA1"], df_modelado["PCA2"], alpha=0.35)
-ref = df_modelado[(df_modelado["Jugador"] == jugador) & (df_modelado["Temporada"] == temporada)]
-if not ref.empty:
-    ax.scatter(ref["PCA1"], ref["PCA2"], s=80)
-ax.set_xlabel("PCA1")
-ax.set_ylabel("PCA2")
-st.pyplot(fig, use_container_width=True)
+def _pca_scatter():
+    fig, ax = subplots()
+    ax.scatter(df_modelado["PCA1"], df_modelado["PCA2"], alpha=0.35)
+    ref = df_modelado[(df_modelado["Jugador"] == jugador) & (df_modelado["Temporada"] == temporada)]
+    if not ref.empty:
+        ax.scatter(ref["PCA1"], ref["PCA2"], s=80)
+    ax.set_xlabel("PCA1")
+    ax.set_ylabel("PCA2")
+    return fig
+
+# se renderiza una vez por modelo (los reruns salen de la caché de renders)
+pca_img = cached_render(
+    render_key(
+        "pca_scatter",
+        data_fingerprint(df_modelado, ["PCA1", "PCA2", "Jugador", "Temporada"]),
+        jugador=jugador,
+        temporada=temporada,
+    ),
+    _pca_scatter,
+    {"preview": lambda fig: png_bytes(fig, dpi=200)},
+)
+st.image(pca_img["preview"], width="stretch")
 
 st.subheader("4) Filtros adicionales sobre resultados")
 cols = st.columns(4)
@@ -111,4 +140,8 @@ if st.button("Aplicar filtros adicionales"):
 st.subheader("5) Tabla final")
 n = st.slider("Cantidad de jugadores a mostrar", 5, 200, 20, step=5)
 cols_show = [c for c in ["Jugador","País","Edad","Liga","Equipo","Temporada","Pie","posicion","minutos_jugados","distancia"] if c in st.session_state.similares.columns]
-st.dataframe(st.session_state.similares[cols_show].head(n), use_container_width=True)
+# los n más cercanos sin ordenar toda la tabla (src/topk.py)
+st.dataframe(
+    top_k_frame(st.session_state.similares, "distancia", n, lower_is_better=True)[cols_show],
+    use_container_width=True,
+)
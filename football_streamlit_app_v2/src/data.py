@@ -1,28 +1,19 @@
 import streamlit as st
 import pandas as pd
 
+from src.dataset_store import open_dataset, renamed_view
+
 RENAME_MAP = {
     "Minutos jugados": "minutos_jugados",
     "Posición específica": "posicion",
     "País de nacimiento": "Nacionalidad",
 }
 
-@st.cache_data(show_spinner=False)
 def read_dataset(uploaded_file) -> pd.DataFrame:
-    name = uploaded_file.name.lower()
-    if name.endswith(".xlsx"):
-        xls = pd.ExcelFile(uploaded_file)
-        df = xls.parse(xls.sheet_names[0])
-    elif name.endswith(".parquet"):
-        df = pd.read_parquet(uploaded_file)
-    elif name.endswith(".csv"):
-        df = pd.read_csv(uploaded_file)
-    else:
-        raise ValueError("Formato no compatible. Usá .xlsx, .parquet o .csv")
-
-    df = df.copy()
-    df.rename(columns={k: v for k, v in RENAME_MAP.items() if k in df.columns}, inplace=True)
-    return df
+    # el df es compartido entre sesiones (src/dataset_store.py): se renombra
+    # sobre una vista, sin tocar el original ni copiar los datos
+    df, _, _ = open_dataset(uploaded_file, slot="df_raw")
+    return renamed_view(df, RENAME_MAP)
 
 def uploader_ui():
     uploaded = st.file_uploader("Subí dataset (.xlsx / .parquet / .csv)", type=["xlsx", "parquet", "csv"])
@@ -0,0 +1,158 @@
+# src/dataset_store.py
+"""
+Registro de datasets compartido por todas las sesiones del proceso.
+
+- Un dataset por clave de contenido (src.ingest.dataset_key): si diez
+  sesiones suben la misma base, hay UNA copia en RAM y diez referencias
+- Cada sesión guarda un "lease" en st.session_state; cuando la sesión
+  muere (o carga otro archivo) el lease se libera solo (weakref.finalize)
+- Sin leases vivos el dataset sale del registro y la memoria se libera
+- Opcional (INLAB_DATASET_MMAP=1): el frame se arma mapeando el archivo
+  Arrow de la caché en disco en vez de leerlo
+
+Los frames del registro son COMPARTIDOS: tratarlos como solo lectura
+(filtrar / seleccionar está bien; asignar columnas o renombrar in-place no).
+Para renombrar usá renamed_view.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from typing import Callable, Mapping, Optional
+
+import pandas as pd
+import streamlit as st
+
+from src.ingest import CSV_CHUNK_ROWS, dataset_key, load_dataset, read_report
+
+# 🔧 AJUSTES
+USE_MMAP = os.environ.get("INLAB_DATASET_MMAP", "0") == "1"
+
+
+class _Lease:
+    """Referencia de una sesión a un dataset (se libera al recolectarse)."""
+
+    __slots__ = ("key", "__weakref__")
+
+    def __init__(self, key: str):
+        self.key = key
+
+
+class DatasetStore:
+    """Registro key → DataFrame con conteo de referencias por lease."""
+
+    def __init__(self):
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._refs: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            return self._frames.get(key)
+
+    def put(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Registra el frame. Si otra sesión ganó la carrera, devuelve el suyo."""
+        with self._lock:
+            return self._frames.setdefault(key, df)
+
+    def acquire(self, key: str) -> _Lease:
+        lease = _Lease(key)
+        with self._lock:
+            self._refs[key] = self._refs.get(key, 0) + 1
+        weakref.finalize(lease, self._release, key)
+        return lease
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            n = self._refs.get(key, 0) - 1
+            if n > 0:
+                self._refs[key] = n
+                return
+            self._refs.pop(key, None)
+            self._frames.pop(key, None)
+
+    def refs(self, key: str) -> int:
+        with self._lock:
+            return self._refs.get(key, 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "datasets": len(self._frames),
+                "leases": sum(self._refs.values()),
+                "mb": float(sum(df.memory_usage(deep=True).sum() for df in self._frames.values()) / 1024**2),
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_dataset_store() -> DatasetStore:
+    """Instancia única por proceso."""
+    return DatasetStore()
+
+
+# =========================================================
+# SESIÓN
+# =========================================================
+def hold(key: str, slot: str = "df") -> int:
+    """
+    Registra que la sesión actual usa el dataset key en el slot dado
+    (un slot = una variable de sesión: "df" de app.py, "df_raw" del PCA…).
+    Devuelve cuántas sesiones lo están usando.
+    """
+    store = get_dataset_store()
+    lease_key = f"_dataset_lease_{slot}"
+
+    old = st.session_state.get(lease_key)
+    if old is None or old.key != key:
+        # reemplazar el lease viejo lo libera (finalize)
+        st.session_state[lease_key] = store.acquire(key)
+    return store.refs(key)
+
+
+def renamed_view(df: pd.DataFrame, mapping: Mapping[str, str]) -> pd.DataFrame:
+    """Mismos datos, otros nombres de columna (copia superficial, sin duplicar memoria)."""
+    out = df.copy(deep=False)
+    out.columns = [mapping.get(c, c) for c in df.columns]
+    return out
+
+
+# =========================================================
+# API
+# =========================================================
+def open_dataset(
+    uploaded_file,
+    slot: str = "df",
+    on_chunk: Optional[Callable[[pd.DataFrame, float, int], None]] = None,
+    chunksize: int = CSV_CHUNK_ROWS,
+    compact: bool = False,
+) -> tuple[pd.DataFrame, str, dict]:
+    """
+    Como src.ingest.load_dataset, pero pasando por el registro compartido.
+
+    info agrega {"compartido": ya estaba en memoria, "sesiones": leases vivos}.
+    """
+    store = get_dataset_store()
+    key = dataset_key(uploaded_file.getvalue(), compact)
+
+    # el lease va primero: nadie puede desalojar el dataset mientras se carga
+    sesiones = hold(key, slot)
+
+    df = store.get(key)
+    if df is not None:
+        info = {
+            "desde_cache": True,
+            "compactado": compact,
+            "reporte": read_report(key) if compact else None,
+            "compartido": True,
+        }
+    else:
+        df, key, info = load_dataset(
+            uploaded_file, on_chunk=on_chunk, chunksize=chunksize, compact=compact, key=key,
+            memory_map=USE_MMAP,
+        )
+        df = store.put(key, df)
+        info["compartido"] = False
+
+    info["sesiones"] = sesiones
+    return df, key, info
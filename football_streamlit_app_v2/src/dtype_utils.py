@@ -0,0 +1,93 @@
+# src/dtype_utils.py
+"""
+Compactación de tipos post-carga.
+
+- Texto de baja cardinalidad (Temporada, Liga, País, Equipo, Pie, Posición…) → category
+- KPIs float64 → float32 cuando la diferencia es despreciable (rtol)
+- Enteros → el entero más chico que los contiene (int8/int16/int32)
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# 🔧 AJUSTES
+CATEGORY_MAX_RATIO = 0.5   # únicos / filas por debajo de esto → category
+FLOAT32_RTOL = 1e-6        # error relativo máximo aceptado al pasar a float32
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    return float(df.memory_usage(deep=True).sum() / 1024**2)
+
+
+def _float32_is_safe(s: pd.Series, rtol: float) -> bool:
+    v = s.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = np.isfinite(v)
+    if not finite.any():
+        return True
+    if np.abs(v[finite]).max() > np.finfo(np.float32).max:
+        return False
+    with np.errstate(over="ignore", invalid="ignore"):
+        v32 = v.astype(np.float32).astype(np.float64)
+    return bool(np.allclose(v[finite], v32[finite], rtol=rtol, atol=0.0))
+
+
+def compact_dtypes(
+    df: pd.DataFrame,
+    max_cat_ratio: float = CATEGORY_MAX_RATIO,
+    rtol: float = FLOAT32_RTOL,
+    exclude: Iterable[str] = (),
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Devuelve (df_compacto, reporte).
+
+    reporte = {"mb_antes", "mb_despues", "categoricas", "float32", "enteros"}
+    """
+    exclude = set(exclude)
+    report = {
+        "mb_antes": memory_mb(df),
+        "categoricas": [],
+        "float32": [],
+        "enteros": [],
+    }
+
+    n = max(len(df), 1)
+    out = {}
+
+    # por posición: tolera nombres de columna repetidos
+    for i, col in enumerate(df.columns):
+        s = df.iloc[:, i]
+        if col in exclude:
+            out[i] = s
+            continue
+
+        if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            if s.nunique(dropna=True) / n <= max_cat_ratio:
+                out[i] = s.astype("category")
+                report["categoricas"].append(col)
+                continue
+
+        elif pd.api.types.is_bool_dtype(s):
+            pass
+
+        elif pd.api.types.is_integer_dtype(s):
+            down = pd.to_numeric(s, downcast="integer")
+            if down.dtype != s.dtype:
+                out[i] = down
+                report["enteros"].append(col)
+                continue
+
+        elif pd.api.types.is_float_dtype(s) and s.dtype != np.float32:
+            if _float32_is_safe(s, rtol):
+                out[i] = s.astype(np.float32)
+                report["float32"].append(col)
+                continue
+
+        out[i] = s
+
+    compact = pd.DataFrame(out, index=df.index)
+    compact.columns = df.columns
+    report["mb_despues"] = memory_mb(compact)
+    return compact, report
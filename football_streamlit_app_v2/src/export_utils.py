@@ -1,5 +1,9 @@
 import io
-from typing import Optional
+import os
+import tempfile
+import weakref
+import zipfile
+from typing import Callable, Iterable, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 
@@ -13,3 +17,58 @@ def fig_to_svg_text(fig) -> str:
     buf = io.StringIO()
     fig.savefig(buf, format="svg", transparent=True, bbox_inches="tight", pad_inches=0.4)
     return buf.getvalue()
+
+
+# =========================================================
+# ZIP EN STREAMING (exports masivos)
+# =========================================================
+# Cada imagen se escribe al archivo apenas está lista y se suelta: el pico
+# de memoria es UNA figura/PNG, no el paquete entero. ZIP_STORED porque el
+# PNG ya viene comprimido (deflate no achica nada y cuesta CPU).
+
+class TempZip:
+    """ZIP en un archivo temporal; se borra solo cuando el objeto se libera."""
+
+    def __init__(self, path: str, names: List[str]):
+        self.path = path
+        self.names = names
+        weakref.finalize(self, _remove_file, path)
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def stream_zip(
+    items: Iterable[Tuple[str, bytes]],
+    on_item: Optional[Callable[[int, str], None]] = None,
+) -> TempZip:
+    """
+    items: iterable (idealmente un generador) de (nombre, bytes).
+    on_item(n, nombre) se llama después de escribir cada entrada (progreso).
+    """
+    tmp = tempfile.NamedTemporaryFile(prefix="inlab_export_", suffix=".zip", delete=False)
+    names: List[str] = []
+    try:
+        with tmp, zipfile.ZipFile(tmp, "w", zipfile.ZIP_STORED) as zipf:
+            for name, data in items:
+                zipf.writestr(name, data)
+                names.append(name)
+                del data
+                if on_item is not None:
+                    on_item(len(names), name)
+    except BaseException:
+        _remove_file(tmp.name)
+        raise
+    return TempZip(tmp.name, names)
@@ -0,0 +1,136 @@
+# src/figures.py
+"""
+Ciclo de vida de las figuras matplotlib.
+
+Regla de la app: en session_state NO viven figuras, solo bytes (PNG de
+src/render_cache.py). Las figuras se construyen, se exportan y se sueltan.
+Este módulo hace que eso se cumpla siempre:
+
+- new_figure() / subplots(): figuras de render con su propio lienzo Agg,
+  FUERA del registro de pyplot (como RadarBackground). Nada las retiene:
+  si el render falla a mitad de camino, la figura se libera con el
+  garbage collector en vez de quedar colgada hasta reiniciar el proceso
+- detach(): lo mismo para figuras que arma una librería vía pyplot
+  (mplsoccer.grid): se sacan del registro apenas se crean
+- sin pyplot no hace falta un lock global: cada sesión (un thread de
+  Streamlit) dibuja y codifica sus figuras en paralelo con las demás
+- memory_stats(): figuras que quedaron en pyplot (debería ser 0), renders,
+  cachés y RSS del proceso + lo que ocupa la sesión actual (ui/memory.py)
+"""
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+
+import matplotlib.pyplot as plt
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+# =========================================================
+# FIGURAS DE RENDER (sin pyplot)
+# =========================================================
+def new_figure(**kwargs) -> Figure:
+    """Como plt.figure(**kwargs), pero sin pasar por el registro de pyplot."""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def subplots(nrows: int = 1, ncols: int = 1, *, squeeze: bool = True, subplot_kw=None, gridspec_kw=None, **fig_kw):
+    """Como plt.subplots(...), sin pyplot: devuelve (fig, ax / array de ejes)."""
+    fig = new_figure(**fig_kw)
+    axes = fig.subplots(nrows, ncols, squeeze=squeeze, subplot_kw=subplot_kw, gridspec_kw=gridspec_kw)
+    return fig, axes
+
+
+def detach(fig: Figure) -> Figure:
+    """Saca de pyplot una figura que armó otra librería (queda con lienzo Agg propio)."""
+    plt.close(fig)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+class FigureManager:
+    """Contador de renders del proceso (uno por proceso)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()   # solo para los contadores
+        self.scopes = 0
+        self.failed = 0
+
+    @contextmanager
+    def scope(self):
+        """Un render (cuenta los que fallan). No serializa: no hay estado de pyplot que cuidar."""
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.scopes += 1
+
+    def open_figures(self) -> int:
+        return len(plt.get_fignums())
+
+    def stats(self) -> dict:
+        return {
+            "figuras_abiertas": self.open_figures(),
+            "renders": self.scopes,
+            "renders_fallidos": self.failed,
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_manager() -> FigureManager:
+    """Instancia única por proceso."""
+    return FigureManager()
+
+
+# =========================================================
+# MÉTRICAS DE MEMORIA
+# =========================================================
+def _rss_mb() -> float:
+    """Memoria residente del proceso (Linux: /proc; si no, el pico de getrusage)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _nbytes(value, depth: int = 0) -> int:
+    """Bytes de imágenes guardadas en un valor de session_state (dicts/listas anidadas)."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if depth >= 3:
+        return 0
+    if isinstance(value, dict):
+        return sum(_nbytes(v, depth + 1) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v, depth + 1) for v in value)
+    return 0
+
+
+def memory_stats() -> dict:
+    """Foto de la memoria: proceso, cachés compartidas y sesión actual."""
+    from charts.radar import radar_background_stats
+    from src.dataset_store import get_dataset_store
+    from src.render_cache import get_render_cache
+
+    out = {"rss_mb": _rss_mb()}
+    out.update(get_figure_manager().stats())
+    out["render_cache_mb"] = get_render_cache().stats()["mb"]
+    out["datasets_mb"] = get_dataset_store().stats()["mb"]
+    out["radar_fondos_mb"] = radar_background_stats()["mb"]
+    out["sesion_imgs_mb"] = sum(_nbytes(v) for v in st.session_state.to_dict().values()) / 1024**2
+    return out
@@ -0,0 +1,181 @@
+# src/filter_index.py
+"""
+Índice de filtros categóricos (se construye UNA vez por dataset).
+
+Por columna guarda:
+- codes: código entero por fila (orden = valores ordenados, -1 = nulo)
+- bitmaps: para columnas de baja cardinalidad, un bitmap empaquetado
+  (np.packbits) por valor → selección / intersección = OR / AND de bytes
+
+Además, "Posición específica" ("CB, LCB, ...") se parsea una sola vez a
+una máscara de bits sobre config.positions.BASE_POSITIONS; los ROLES de
+config/roles.py se compilan a máscaras y el filtro es un AND bit a bit.
+
+Así las opciones de cada nivel de la cascada (Temporada → País → Liga →
+Equipo) y la selección final salen de operaciones sobre arrays, sin
+volver a filtrar ni recorrer el DataFrame.
+"""
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config.positions import BASE_POSITIONS
+from config.roles import ROLES
+
+# 🔧 AJUSTES
+INDEX_COLUMNS = ("Temporada", "País", "Liga", "Equipo", "Pie")
+POSITION_COL = "Posición específica"
+BITMAP_MAX_VALUES = 64   # por encima de esto la columna usa solo codes
+
+
+# =========================================================
+# POSICIONES → BITS
+# =========================================================
+POSITION_BITS = {p: 1 << i for i, p in enumerate(BASE_POSITIONS)}
+
+
+def positions_to_bits(positions) -> int:
+    """{"CB", "LB"} → máscara entera (posiciones desconocidas se ignoran)."""
+    bits = 0
+    for p in positions:
+        bits |= POSITION_BITS.get(str(p).strip(), 0)
+    return bits
+
+
+ROLE_BITS = {role: positions_to_bits(pos) for role, pos in ROLES.items()}
+
+
+def parse_position_bits(s: pd.Series) -> np.ndarray:
+    """
+    Columna "CB, LCB" → uint32 por fila. Se parsea cada combinación
+    distinta una sola vez (hay pocas) y se expande con los codes.
+    """
+    codes, uniques = pd.factorize(s, sort=False)
+    lut = np.zeros(len(uniques) + 1, dtype=np.uint32)   # último = nulo (-1)
+    for i, cell in enumerate(pd.Index(uniques).tolist()):
+        lut[i] = positions_to_bits(str(cell).split(","))
+    return lut[codes]
+
+
+
+class _Column:
+    __slots__ = ("values", "lookup", "codes", "bitmaps")
+
+    def __init__(self, s: pd.Series, n: int):
+        codes, uniques = pd.factorize(s, sort=False)
+        uniques = list(pd.Index(uniques).tolist())
+
+        # orden "humano" (igual que sorted(unique()) del filtro original)
+        order = sorted(range(len(uniques)), key=lambda i: uniques[i])
+        rank = np.empty(len(uniques), dtype=np.int32)
+        rank[order] = np.arange(len(uniques), dtype=np.int32)
+
+        self.values = [uniques[i] for i in order]
+        self.lookup = {v: i for i, v in enumerate(self.values)}
+        self.codes = np.where(codes >= 0, rank[codes] if len(rank) else codes, -1).astype(np.int32)
+
+        self.bitmaps = None
+        if len(self.values) <= BITMAP_MAX_VALUES:
+            self.bitmaps = np.stack([
+                np.packbits(self.codes == k) for k in range(len(self.values))
+            ]) if self.values else np.zeros((0, (n + 7) // 8), dtype=np.uint8)
+
+
+class FilterIndex:
+    """Índice de un DataFrame base. Los "bitmaps" son arrays uint8 empaquetados."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        columns: Sequence[str] = INDEX_COLUMNS,
+        position_col: str = POSITION_COL,
+    ):
+        self.n = len(df)
+        self.columns = {c: _Column(df[c], self.n) for c in columns if c in df.columns}
+        self.position_bits = (
+            parse_position_bits(df[position_col]) if position_col in df.columns else None
+        )
+
+    # -----------------------------
+    # conversiones
+    # -----------------------------
+    def to_mask(self, bitmap: Optional[np.ndarray]):
+        """Bitmap → máscara booleana (None = todas las filas)."""
+        if bitmap is None:
+            return None
+        return np.unpackbits(bitmap, count=self.n).astype(bool)
+
+    def from_mask(self, mask: Optional[np.ndarray]):
+        if mask is None:
+            return None
+        return np.packbits(np.asarray(mask, dtype=bool))
+
+    @staticmethod
+    def intersect(*bitmaps):
+        """AND de los bitmaps no-None (None si ninguno aplica)."""
+        out = None
+        for b in bitmaps:
+            if b is None:
+                continue
+            out = b if out is None else (out & b)
+        return out
+
+    # -----------------------------
+    # consultas
+    # -----------------------------
+    def select(self, col: str, values) -> Optional[np.ndarray]:
+        """Bitmap de col ∈ values (None si no hay selección o no existe la columna)."""
+        if not values or col not in self.columns:
+            return None
+        c = self.columns[col]
+        ks = [c.lookup[v] for v in values if v in c.lookup]
+
+        if c.bitmaps is not None:
+            if not ks:
+                return np.zeros(c.bitmaps.shape[1], dtype=np.uint8)
+            return np.bitwise_or.reduce(c.bitmaps[ks], axis=0)
+
+        lut = np.zeros(len(c.values) + 1, dtype=bool)   # último = nulo (-1)
+        lut[ks] = True
+        return np.packbits(lut[c.codes])
+
+    def options(self, col: str, bitmap: Optional[np.ndarray] = None) -> list:
+        """Valores ordenados de col presentes en las filas del bitmap."""
+        if col not in self.columns:
+            return []
+        c = self.columns[col]
+        if bitmap is None:
+            return list(c.values)
+
+        if c.bitmaps is not None:
+            present = (c.bitmaps & bitmap).any(axis=1)
+        else:
+            codes = c.codes[self.to_mask(bitmap)]
+            codes = codes[codes >= 0]
+            present = np.bincount(codes, minlength=len(c.values)) > 0
+
+        return [v for v, ok in zip(c.values, present) if ok]
+
+    def select_positions(self, positions) -> Optional[np.ndarray]:
+        """Bitmap de filas con alguna de las posiciones (AND bit a bit, vectorizado)."""
+        if not positions or self.position_bits is None:
+            return None
+        return np.packbits((self.position_bits & positions_to_bits(positions)) != 0)
+
+    def select_roles(self, roles) -> Optional[np.ndarray]:
+        if not roles or self.position_bits is None:
+            return None
+        bits = 0
+        for r in roles:
+            bits |= ROLE_BITS.get(r, 0)
+        return np.packbits((self.position_bits & bits) != 0)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_filter_index(df_key: str, _df: pd.DataFrame) -> FilterIndex:
+    """Índice compartido por dataset (clave = hash de contenido de src/ingest.py)."""
+    return FilterIndex(_df)
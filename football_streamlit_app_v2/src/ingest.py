@@ -0,0 +1,338 @@
+# src/ingest.py
+"""
+Capa única de ingesta de datasets.
+
+- Hashea los bytes subidos (mismo archivo = misma clave, aunque cambie el nombre)
+- El primer parseo se guarda como archivo Arrow (Feather v2) tipado en disco
+- Las siguientes subidas del mismo archivo se sirven desde ese archivo (ms)
+- La caché tiene tope de tamaño y desaloja los datasets menos usados (LRU)
+- Compactación de tipos opcional (src/dtype_utils.py), cacheada como variante aparte
+- Modo por bloques para CSV grandes: preview del primer bloque + progreso,
+  y el frame final se arma desde Arrow para no duplicar memoria
+
+La usa src/dataset_store.py (app.py, src/data.read_dataset) y
+src/db_utils.load_dataframe.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+# =========================================================
+# CONFIG
+# =========================================================
+BASE_PATH = Path(__file__).resolve().parent.parent
+
+CACHE_DIR = Path(os.environ.get("INLAB_CACHE_DIR", BASE_PATH / ".cache" / "datasets"))
+CACHE_MAX_BYTES = int(float(os.environ.get("INLAB_CACHE_MAX_MB", 2048)) * 1024**2)
+
+# 🔧 subir si cambia la normalización post-lectura (invalida la caché vieja)
+CACHE_VERSION = 1
+
+SUPPORTED_EXTENSIONS = (".xlsx", ".csv", ".parquet")
+
+# 🔧 lectura por bloques (CSV)
+CSV_CHUNK_ROWS = 50_000
+CSV_CHUNKED_MIN_BYTES = 20 * 1024**2   # app.py usa bloques por encima de esto
+
+_cache_lock = threading.Lock()
+
+# metadata del esquema Arrow donde viaja el reporte de compactación
+_REPORT_META = b"inlab_reporte"
+
+
+# =========================================================
+# HELPERS
+# =========================================================
+def content_hash(data: bytes) -> str:
+    """Hash estable del contenido subido (clave de la caché)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def dataset_key(data: bytes, compact: bool = False) -> str:
+    """Clave del dataset: hash del contenido + versión + variante compactada."""
+    return f"{content_hash(data)}-v{CACHE_VERSION}" + ("-c" if compact else "")
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Nombres de columna como str y sin espacios (una sola vez, al cargar)."""
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+def parse_bytes(data: bytes, name: str) -> pd.DataFrame:
+    """Parsea los bytes según la extensión del archivo."""
+    name = name.lower()
+    buf = io.BytesIO(data)
+
+    if name.endswith(".parquet"):
+        df = pd.read_parquet(buf)
+    elif name.endswith(".csv"):
+        df = pd.read_csv(buf, low_memory=False)
+    elif name.endswith(".xlsx"):
+        df = pd.read_excel(buf, engine="openpyxl")
+    else:
+        raise ValueError("Formato no soportado. Usá .xlsx, .parquet o .csv")
+
+    return normalize_columns(df)
+
+
+# =========================================================
+# CSV POR BLOQUES
+# =========================================================
+def iter_csv_chunks(data: bytes, chunksize: int = CSV_CHUNK_ROWS):
+    """Genera (bloque, fracción_leída) recorriendo el CSV de a chunksize filas."""
+    buf = io.BytesIO(data)
+    total = max(len(data), 1)
+
+    with pd.read_csv(buf, chunksize=chunksize, low_memory=False) as reader:
+        for chunk in reader:
+            yield normalize_columns(chunk), min(buf.tell() / total, 1.0)
+
+
+def _chunk_to_arrow(chunk: pd.DataFrame):
+    """
+    Bloque pandas → tabla Arrow (strings compactos, sin metadata pandas).
+    Las columnas 100% nulas del bloque quedan como tipo null para que
+    el concat final las promueva al tipo real de los otros bloques.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(chunk, preserve_index=False).replace_schema_metadata(None)
+    for i, col in enumerate(chunk.columns):
+        if chunk[col].isna().all():
+            table = table.set_column(i, str(col), pa.nulls(len(chunk)))
+    return table
+
+
+def _concat_arrow(tables):
+    import pyarrow as pa
+
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def read_csv_chunked(
+    data: bytes,
+    chunksize: int = CSV_CHUNK_ROWS,
+    on_chunk: Optional[Callable[[pd.DataFrame, float, int], None]] = None,
+):
+    """
+    Lee un CSV por bloques y devuelve una tabla Arrow con todo el dataset.
+
+    on_chunk(bloque, progreso 0-1, filas_leídas) se llama por cada bloque
+    (el primero sirve para mostrar preview/esquema apenas está listo).
+    Cada bloque pandas se pasa a Arrow y se libera enseguida.
+    """
+    tables = []
+    rows = 0
+    for chunk, progress in iter_csv_chunks(data, chunksize):
+        rows += len(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk, progress, rows)
+        tables.append(_chunk_to_arrow(chunk))
+        del chunk
+
+    if not tables:
+        return None
+
+    table = _concat_arrow(tables)
+    del tables
+    return table
+
+
+def arrow_to_pandas(table) -> pd.DataFrame:
+    """Convierte liberando los buffers Arrow columna a columna (pico ≈ frame final)."""
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+# =========================================================
+# CACHÉ EN DISCO (Arrow)
+# =========================================================
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.arrow"
+
+
+def read_cached(key: str, memory_map: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Devuelve el dataset cacheado o None. Cada lectura lo marca como reciente.
+
+    memory_map=True mapea el archivo en vez de leerlo: las columnas sin nulos
+    (enteros, códigos de category) quedan apuntando al page cache del SO,
+    compartido entre procesos, y son de solo lectura.
+    """
+    from pyarrow import feather
+
+    path = _cache_path(key)
+    if not path.exists():
+        return None
+
+    try:
+        if memory_map:
+            df = feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+        else:
+            df = feather.read_feather(path)
+    except Exception:
+        # archivo corrupto / a medio escribir → se descarta
+        path.unlink(missing_ok=True)
+        return None
+
+    try:
+        os.utime(path)  # LRU: mtime = último uso
+    except OSError:
+        pass
+    return df
+
+
+def read_report(key: str) -> Optional[dict]:
+    """Reporte de compactación guardado junto a la variante (solo lee el esquema)."""
+    import pyarrow as pa
+
+    path = _cache_path(key)
+    try:
+        with pa.memory_map(str(path)) as src:
+            meta = pa.ipc.open_file(src).schema.metadata or {}
+        raw = meta.get(_REPORT_META)
+        return json.loads(raw) if raw else None
+    except Exception:
+        return None
+
+
+def write_cached(key: str, df, reporte: Optional[dict] = None) -> bool:
+    """
+    Guarda el dataset (DataFrame o tabla Arrow) en la caché. Devuelve False si no se pudo
+    (p.ej. columnas con tipos mezclados que Arrow no acepta); en ese caso
+    el dataset se sigue usando, solo que sin caché.
+
+    reporte (compact_dtypes) va en la metadata del esquema: los hits de la
+    caché lo recuperan con read_report sin volver a compactar.
+    """
+    import pyarrow as pa
+    from pyarrow import feather
+
+    path = _cache_path(key)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if reporte is not None:
+            table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df)
+            meta = dict(table.schema.metadata or {})
+            meta[_REPORT_META] = json.dumps(reporte, default=float).encode()
+            df = table.replace_schema_metadata(meta)
+        # sin compresión: la lectura es casi un memcpy
+        feather.write_feather(df, tmp, compression="uncompressed")
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return False
+
+    evict_cache(keep=key)
+    return True
+
+
+def evict_cache(max_bytes: int = CACHE_MAX_BYTES, keep: Optional[str] = None) -> None:
+    """Borra los datasets menos usados hasta quedar por debajo de max_bytes."""
+    with _cache_lock:
+        if not CACHE_DIR.exists():
+            return
+
+        files = []
+        for p in CACHE_DIR.glob("*.arrow"):
+            try:
+                info = p.stat()
+            except OSError:
+                continue
+            files.append((info.st_mtime, info.st_size, p))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, p in sorted(files):
+            if total <= max_bytes:
+                break
+            if keep is not None and p.stem == keep:
+                continue
+            p.unlink(missing_ok=True)
+            total -= size
+
+
+# =========================================================
+# API
+# =========================================================
+def load_dataset(
+    uploaded_file,
+    on_chunk: Optional[Callable[[pd.DataFrame, float, int], None]] = None,
+    chunksize: int = CSV_CHUNK_ROWS,
+    compact: bool = False,
+    key: Optional[str] = None,
+    memory_map: bool = False,
+) -> tuple[pd.DataFrame, str, dict]:
+    """
+    Carga un archivo subido (st.file_uploader) pasando por la caché.
+
+    - on_chunk: si es un CSV, se lee por bloques (ver read_csv_chunked)
+    - compact: aplica src.dtype_utils.compact_dtypes (se cachea aparte)
+    - key: clave ya calculada con dataset_key (evita hashear dos veces)
+    - memory_map: el frame devuelto mapea el archivo de la caché (ver
+      read_cached); en un miss se escribe y se mapea, y si la escritura
+      falla queda el frame parseado
+
+    Devuelve (df, key, info) con info = {"desde_cache", "compactado", "reporte"}.
+    """
+    name = uploaded_file.name.lower()
+    if not name.endswith(SUPPORTED_EXTENSIONS):
+        raise ValueError("Formato no soportado. Usá .xlsx, .parquet o .csv")
+
+    data = uploaded_file.getvalue()
+    key = key or dataset_key(data, compact)
+    info = {"desde_cache": False, "compactado": compact, "reporte": None}
+
+    df = read_cached(key, memory_map=memory_map)
+    if df is not None:
+        info["desde_cache"] = True
+        info["reporte"] = read_report(key) if compact else None
+        return df, key, info
+
+    df = None
+    if compact:
+        # la variante sin compactar del mismo contenido ya está parseada: se compacta esa
+        df = read_cached(dataset_key(data, False))
+
+    if df is None and on_chunk is not None and name.endswith(".csv"):
+        try:
+            table = read_csv_chunked(data, chunksize=chunksize, on_chunk=on_chunk)
+        except Exception:
+            # tipos incompatibles entre bloques (Arrow no los une) → lectura completa
+            table = None
+
+        if table is not None:
+            if not compact:
+                mapped = _write_and_map(key, table, None, memory_map)
+                return (arrow_to_pandas(table) if mapped is None else mapped), key, info
+            df = arrow_to_pandas(table)
+
+    if df is None:
+        df = parse_bytes(data, name)
+
+    if compact:
+        from src.dtype_utils import compact_dtypes
+
+        df, info["reporte"] = compact_dtypes(df)
+
+    mapped = _write_and_map(key, df, info["reporte"], memory_map)
+    return (df if mapped is None else mapped), key, info
+
+
+def _write_and_map(key: str, df, reporte: Optional[dict], memory_map: bool) -> Optional[pd.DataFrame]:
+    """Guarda en la caché; con memory_map devuelve el frame mapeado (None = usar el propio)."""
+    if not write_cached(key, df, reporte) or not memory_map:
+        return None
+    return read_cached(key, memory_map=True)
@@ -0,0 +1,170 @@
+# src/parallel_render.py
+"""
+Render en paralelo de figuras independientes (exports de muchas métricas).
+
+- Cada trabajo = una función de módulo que devuelve una Figure + sus kwargs
+  + los kwargs de savefig del PNG final
+- Los trabajos que ya están en la caché de renders no se recalculan
+- Los que faltan se reparten en un pool de procesos (spawn, backend Agg
+  por worker) y los PNG vuelven a medida que terminan (as_completed)
+- Con 1 CPU, o si hay un solo trabajo, se hace en serie en este proceso
+- Si el pool se rompe (worker muerto), lo que falta se termina en serie
+
+Lo que viaja al worker se serializa: pasá solo las columnas que usa el
+gráfico (df[[metrica, "Jugador"]]), no el DataFrame entero.
+
+Uso:
+    jobs = [RenderJob(key, beeswarm_single, {"df": sub, "metric": m}, {"dpi": 300}) ...]
+    for job, png in render_many(jobs):
+        ...
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Iterator, Optional
+
+import streamlit as st
+
+from src.render_cache import RenderCache, get_render_cache
+
+# 🔧 AJUSTES
+RENDER_WORKERS = int(os.environ.get("INLAB_RENDER_WORKERS", os.cpu_count() or 1))
+
+
+class RenderJob:
+    """Una figura a renderizar: fn(**kwargs) → Figure → PNG con savefig(**savefig)."""
+
+    __slots__ = ("key", "fn", "kwargs", "savefig", "variant", "meta")
+
+    def __init__(
+        self,
+        key: str,
+        fn: Callable,
+        kwargs: dict,
+        savefig: Optional[dict] = None,
+        variant: str = "export",
+        meta=None,
+    ):
+        self.key = key              # render_key(...) del gráfico
+        self.fn = fn                # tiene que ser importable (función de módulo)
+        self.kwargs = kwargs
+        self.savefig = savefig or {}
+        self.variant = variant      # misma convención que cached_render ("{key}:{variant}")
+        self.meta = meta            # lo que quiera el llamador (nombre de archivo, etiqueta…)
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.key}:{self.variant}"
+
+
+# =========================================================
+# WORKER
+# =========================================================
+_spawn_lock = threading.Lock()
+
+
+@contextmanager
+def _plain_main():
+    """
+    spawn vuelve a ejecutar __main__ en cada worker nuevo, y bajo Streamlit
+    __main__ es la página: mientras se lanzan workers lo tapamos con un
+    módulo vacío (sin __file__ → multiprocessing no lo importa).
+    """
+    with _spawn_lock:
+        main = sys.modules.get("__main__")
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            yield
+        finally:
+            sys.modules["__main__"] = main
+
+
+def _init_worker():
+    import warnings
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+
+def _render_png(fn: Callable, kwargs: dict, savefig: dict) -> bytes:
+    """Corre en el worker (o en serie acá): figura → PNG → figura cerrada."""
+    import matplotlib.pyplot as plt
+
+    from src.render_cache import png_bytes
+
+    fig = fn(**kwargs)
+    try:
+        return png_bytes(fig, **savefig)
+    finally:
+        plt.close(fig)
+
+
+@st.cache_resource(show_spinner=False)
+def get_render_pool(workers: int = RENDER_WORKERS) -> ProcessPoolExecutor:
+    """Pool único por proceso (los workers quedan vivos entre exports)."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+# =========================================================
+# API
+# =========================================================
+def render_many(
+    jobs: Iterable[RenderJob],
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+    store: bool = True,
+) -> Iterator[tuple[RenderJob, bytes]]:
+    """
+    Genera (job, png) a medida que cada figura está lista.
+
+    Primero salen los que ya estaban en la caché; el resto en orden de
+    llegada (no en el orden de jobs). Todo lo nuevo queda en la caché,
+    salvo con store=False (exports que van directo a un ZIP en disco).
+    """
+    cache = cache or get_render_cache()
+    workers = RENDER_WORKERS if workers is None else workers
+
+    pending = []
+    for job in jobs:
+        png = cache.get(job.cache_key)
+        if png is not None:
+            yield job, png
+        else:
+            pending.append(job)
+
+    if workers > 1 and len(pending) > 1:
+        try:
+            pool = get_render_pool(workers)
+            # los workers se lanzan a demanda dentro de submit
+            with _plain_main():
+                futures = {pool.submit(_render_png, j.fn, j.kwargs, j.savefig): j for j in pending}
+            for fut in as_completed(futures):
+                # pop: el futuro (y su PNG) se suelta apenas se entrega
+                job = futures.pop(fut)
+                png = fut.result()
+                if store:
+                    cache.put(job.cache_key, png)
+                pending.remove(job)
+                yield job, png
+        except BrokenProcessPool:
+            # worker muerto: descartamos el pool y seguimos en serie
+            get_render_pool.clear()
+
+    for job in pending:
+        png = _render_png(job.fn, job.kwargs, job.savefig)
+        if store:
+            cache.put(job.cache_key, png)
+        yield job, png
@@ -8,7 +8,8 @@ def run_pca_similarity(df_pos: pd.DataFrame, kpis: list[str], jugador: str, temp
     """
     Devuelve:
       - df_modelado: df_pos + PCA1, PCA2, distancia
-      - df_similares: df_modelado sin el jugador objetivo, ordenado por distancia asc
+      - df_similares: df_modelado sin el jugador objetivo (sin ordenar: los N más
+        cercanos se sacan con src.topk.top_k_frame(..., "distancia", N, lower_is_better=True))
     """
     df_pos = df_pos.copy()
     df_pos = df_pos.dropna(subset=kpis)
@@ -28,5 +29,5 @@ def run_pca_similarity(df_pos: pd.DataFrame, kpis: list[str], jugador: str, temp
     dist = euclidean_distances(ref[["PCA1","PCA2"]], df_pos[["PCA1","PCA2"]])[0]
     df_pos["distancia"] = dist
 
-    df_similares = df_pos[df_pos["Jugador"] != jugador].sort_values("distancia", ascending=True)
+    df_similares = df_pos[df_pos["Jugador"] != jugador]
     return df_pos, df_similares
@@ -0,0 +1,155 @@
+# src/player_index.py
+"""
+Índice de jugadores: nombre (+ Temporada / Equipo opcionales) → posiciones
+de fila.
+
+La clave es el nombre EXACTO sin espacios de los bordes (lo que muestran
+los selectores): "José Pérez" y "JOSE PEREZ" son dos jugadores. Solo si
+no hay coincidencia exacta se busca por el nombre normalizado (sin
+acentos ni mayúsculas), para nombres tipeados a mano.
+
+Se arma UNA vez por DataFrame, sobre los codes que ya factorizó
+src/text_index.py, y queda colgado de su norm_index (misma vida que el
+frame). Después, buscar N jugadores es un gather O(N) en vez de un
+str.strip() + comparación sobre toda la columna por jugador.
+
+Un nombre puede tener varias filas (varias temporadas o equipos). La
+regla para elegir una es explícita (pick):
+- "first": la primera fila en el orden del frame (lo que se hacía antes)
+- "latest": la de Temporada más alta ("2023/24" > "2022/23")
+y ambiguous() devuelve qué nombres tienen más de una fila, para avisar
+en la UI. Para apuntar a una fila exacta se pasa (nombre, temporada) o
+(nombre, temporada, equipo) en vez del nombre solo.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.text_index import NormIndex, norm_index, norm_text
+
+PlayerKey = Union[str, tuple]
+
+
+def _merge(rows: Dict[str, np.ndarray], key: str, g: np.ndarray) -> None:
+    rows[key] = g if key not in rows else np.sort(np.concatenate([rows[key], g]))
+
+
+class PlayerIndex:
+    """nombre exacto (y normalizado, de respaldo) → posiciones (ordenadas) de sus filas."""
+
+    def __init__(self, idx: NormIndex, player_col: str, season_col: str, team_col: str):
+        df = idx.frame()
+        names = idx.column(player_col)
+        raw = df[player_col].to_numpy()
+
+        # agrupar posiciones por code (un argsort estable): un code = un valor crudo
+        order = np.argsort(names.codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(names.codes[order])) + 1
+        exact: Dict[str, np.ndarray] = {}
+        folded: Dict[str, np.ndarray] = {}
+        for g in np.split(order, bounds):
+            if len(g) == 0 or names.codes[g[0]] < 0:
+                continue
+            _merge(exact, str(raw[g[0]]).strip(), g)
+            _merge(folded, names.cats[names.codes[g[0]]], g)
+        self._rows = exact
+        self._folded = folded
+
+        self._idx = idx
+        self._season_col, self._team_col = season_col, team_col
+        self._season = idx.column(season_col) if season_col in df.columns else None
+        self._team = idx.column(team_col) if team_col in df.columns else None
+
+    def rows(self, player: PlayerKey) -> np.ndarray:
+        """Todas las filas del jugador (filtradas por temporada / equipo si vienen en la clave)."""
+        if isinstance(player, tuple):
+            name, season, team = (tuple(player) + (None, None))[:3]
+        else:
+            name, season, team = player, None, None
+
+        pos = self._rows.get(str(name).strip())
+        if pos is None:
+            pos = self._folded.get(norm_text(name))
+        if pos is None:
+            return np.empty(0, dtype=np.int64)
+        if season is not None and self._season is not None:
+            pos = pos[self._season.norm_values(pos) == norm_text(season)]
+        if team is not None and self._team is not None:
+            pos = pos[self._team.norm_values(pos) == norm_text(team)]
+        return pos
+
+    def position(self, player: PlayerKey, pick: str = "first", mask=None) -> Optional[int]:
+        """
+        Una fila del jugador (None si no está). mask: solo filas válidas
+        (p. ej. las que tienen valor en la métrica).
+        """
+        pos = self.rows(player)
+        if mask is not None and len(pos):
+            pos = pos[np.asarray(mask)[pos]]
+        if len(pos) == 0:
+            return None
+        if pick == "latest" and self._season is not None and len(pos) > 1:
+            # a igual temporada gana la primera fila
+            seasons = self._season.norm_values(pos)
+            return int(pos[np.flatnonzero(seasons == seasons.max())[0]])
+        return int(pos[0])
+
+    def positions(self, players: Sequence[PlayerKey], pick: str = "first", mask=None) -> np.ndarray:
+        """Una posición por jugador (-1 = no está)."""
+        out = np.full(len(players), -1, dtype=np.int64)
+        for i, p in enumerate(players):
+            pos = self.position(p, pick=pick, mask=mask)
+            if pos is not None:
+                out[i] = pos
+        return out
+
+    def options(self, player: str) -> List[tuple]:
+        """
+        Una clave por fila del jugador, en el orden del frame (para elegir
+        temporada en la UI): (nombre, temporada), o (nombre, temporada,
+        equipo) si la temporada se repite.
+        """
+        pos = self.rows(player)
+        if self._season is None or len(pos) == 0:
+            return []
+        df = self._idx.frame()
+        seasons = df[self._season_col].iloc[pos].tolist()
+        teams = df[self._team_col].iloc[pos].tolist() if self._team is not None else [None] * len(pos)
+        repetida = {t for t in seasons if seasons.count(t) > 1}
+        return [
+            (player, season, team) if season in repetida and team is not None else (player, season)
+            for season, team in zip(seasons, teams)
+        ]
+
+    def ambiguous(self, players: Sequence[PlayerKey]) -> Dict[str, int]:
+        """{jugador: cantidad de filas} de los que tienen más de una."""
+        out = {}
+        for p in players:
+            n = len(self.rows(p))
+            if n > 1:
+                out[p if isinstance(p, str) else p[0]] = n
+        return out
+
+
+def player_label(player: PlayerKey) -> str:
+    """Texto de la clave para títulos / archivos: "Nombre (2023/24 · Equipo)"."""
+    if not isinstance(player, tuple):
+        return str(player)
+    extra = [str(v) for v in player[1:] if v is not None]
+    return f"{player[0]} ({' · '.join(extra)})" if extra else str(player[0])
+
+
+def player_index(
+    df: pd.DataFrame,
+    player_col: str = "Jugador",
+    season_col: str = "Temporada",
+    team_col: str = "Equipo",
+) -> PlayerIndex:
+    """Índice cacheado del frame (se descarta cuando el frame se libera)."""
+    return norm_index(df).derived(
+        ("players", player_col, season_col, team_col),
+        lambda idx: PlayerIndex(idx, player_col, season_col, team_col),
+    )
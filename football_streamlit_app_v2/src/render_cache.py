@@ -0,0 +1,223 @@
+# src/render_cache.py
+"""
+Caché de renders (PNG) compartida por páginas y sesiones.
+
+- Clave = huella de los datos que usa el gráfico (solo las columnas
+  relevantes del slice filtrado) + todos los parámetros del gráfico
+- Se guardan los bytes PNG ya renderizados, no la figura matplotlib
+  (la figura se cierra apenas se exporta)
+- LRU con tope de memoria: se desalojan los renders menos usados
+- Un mismo render puede guardar varias "variantes" (preview, export…)
+  que salen de una sola construcción de la figura
+- LazyRender: se guarda CÓMO construir la figura y cada variante se
+  codifica recién cuando alguien la pide (el export de 300 dpi solo se
+  paga si se va a descargar)
+- targeted=True: el gráfico arma cada variante con su propio
+  render_target ("preview" con fondo / "export" transparente, ver
+  src/theme.py) en vez de retocar la figura del preview al exportar
+
+Uso:
+    key = render_key("bees", data_fingerprint(df, cols), metrics=..., colors=...)
+    imgs = cached_render(key, lambda: beeswarm_grid(...), {"preview": png_preview})
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Mapping, Optional
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.figures import get_figure_manager
+
+# 🔧 AJUSTES
+RENDER_CACHE_MAX_BYTES = int(float(os.environ.get("INLAB_RENDER_CACHE_MB", 256)) * 1024**2)
+
+# 🔧 subir si cambia el estilo de algún gráfico (invalida los renders viejos)
+RENDER_VERSION = 1
+
+
+# =========================================================
+# CLAVES
+# =========================================================
+def data_fingerprint(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> str:
+    """
+    Hash del contenido de las columnas que usa el gráfico (incluye el índice,
+    así dos filtros distintos con los mismos valores no colisionan).
+    """
+    cols = [c for c in (columns if columns is not None else df.columns) if c in df.columns]
+    cols = list(dict.fromkeys(cols))
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((len(df), cols)).encode())
+    if cols and len(df):
+        hashed = pd.util.hash_pandas_object(df[cols], index=True).to_numpy()
+        h.update(np.ascontiguousarray(hashed).tobytes())
+    return h.hexdigest()
+
+
+def _freeze(value):
+    """Parámetros → estructura hasheable y con repr estable."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr)) if isinstance(value, (set, frozenset)) else tuple(items)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def render_key(kind: str, fingerprint: str, **params) -> str:
+    """Clave de un render: tipo de gráfico + huella de datos + parámetros."""
+    payload = repr((RENDER_VERSION, kind, fingerprint, _freeze(params)))
+    return f"{kind}-" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# =========================================================
+# LRU CON TOPE DE MEMORIA
+# =========================================================
+class RenderCache:
+    """LRU de bytes (thread-safe: Streamlit atiende cada sesión en su thread)."""
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return  # no entra ni sola
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._items[key] = data
+            self._bytes += len(data)
+
+            while self._bytes > self.max_bytes and self._items:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "mb": self._bytes / 1024**2,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_render_cache() -> RenderCache:
+    """Instancia única por proceso (compartida entre páginas y sesiones)."""
+    return RenderCache()
+
+
+# =========================================================
+# EXPORTADORES (figura → bytes)
+# =========================================================
+def png_bytes(fig, **savefig_kwargs) -> bytes:
+    kwargs = {"format": "png", "bbox_inches": "tight"}
+    kwargs.update(savefig_kwargs)
+    buf = io.BytesIO()
+    fig.savefig(buf, **kwargs)
+    return buf.getvalue()
+
+
+# =========================================================
+# API
+# =========================================================
+def cached_render(
+    key: str,
+    render_fn: Callable[[], object],
+    variants: Mapping[str, Callable[[object], bytes]],
+    cache: Optional[RenderCache] = None,
+    store: bool = True,
+    targeted: bool = False,
+) -> dict[str, bytes]:
+    """
+    Devuelve {variante: bytes} para la clave.
+
+    Si falta alguna variante se llama render_fn() UNA vez, se exportan
+    las que faltan con su función (fig → bytes) y la figura se cierra.
+    store=False: se usa la caché si ya está, pero lo nuevo no se guarda
+    (exports masivos que van directo a disco).
+    targeted=True: una figura por variante, render_fn(render_target=variante)
+    (las variantes se llaman como los destinos: "preview" / "export").
+    """
+    cache = cache or get_render_cache()
+
+    out = {name: cache.get(f"{key}:{name}") for name in variants}
+    missing = [name for name, data in out.items() if data is None]
+    if not missing:
+        return out
+
+    groups = [[name] for name in missing] if targeted else [missing]
+
+    # los charts arman sus figuras fuera de pyplot (src/figures.py): si el render
+    # falla no queda nada colgado; el scope solo cuenta renders (sin lock)
+    with get_figure_manager().scope():
+        for names in groups:
+            fig = render_fn(render_target=names[0]) if targeted else render_fn()
+            try:
+                for name in names:
+                    data = variants[name](fig)
+                    if store:
+                        cache.put(f"{key}:{name}", data)
+                    out[name] = data
+            finally:
+                plt.close(fig)
+    return out
+
+
+class LazyRender:
+    """
+    Render diferido: clave + cómo construir la figura + exportadores.
+    Se puede guardar en session_state; get(variante) pasa por cached_render
+    (si ya está en la caché no se construye nada).
+    """
+
+    __slots__ = ("key", "render_fn", "variants", "targeted")
+
+    def __init__(
+        self,
+        key: str,
+        render_fn: Callable[..., object],
+        variants: Mapping[str, Callable[[object], bytes]],
+        targeted: bool = False,
+    ):
+        self.key = key
+        self.render_fn = render_fn
+        self.variants = dict(variants)
+        self.targeted = targeted
+
+    def get(self, name: str, cache: Optional[RenderCache] = None, store: bool = True) -> bytes:
+        return cached_render(
+            self.key, self.render_fn, {name: self.variants[name]}, cache, store, targeted=self.targeted
+        )[name]
@@ -0,0 +1,127 @@
+# src/stats.py
+"""
+Estadísticas por población filtrada (bees, radar, scatter).
+
+Por cada KPI se ordenan UNA vez los valores no nulos; después cualquier
+cuantil, mediana, media o percentil de un valor sale de ese array:
+- cuantil / mediana: índice directo + interpolación lineal (igual que pandas)
+- percentil de un valor: np.searchsorted → O(log n)
+- media: suma precalculada
+
+population_stats(df) devuelve la misma instancia mientras el DataFrame
+filtrado sea el mismo objeto (ss.df_filtrado solo cambia al aplicar
+filtros); cuando ese frame se libera, sus estadísticas también.
+"""
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class MetricStats:
+    """Valores ordenados (float64, sin nulos) de un KPI."""
+
+    __slots__ = ("sorted", "n", "_sum")
+
+    def __init__(self, s: pd.Series):
+        v = pd.to_numeric(s, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        v = v[~np.isnan(v)]
+        v.sort()
+        self.sorted = v
+        self.n = len(v)
+        self._sum = float(v.sum())
+
+    def quantile(self, q):
+        """Cuantil(es) con interpolación lineal (= Series.quantile). q escalar o lista."""
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.n == 0:
+            out = np.full(len(qs), np.nan)
+        else:
+            pos = qs * (self.n - 1)
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.minimum(lo + 1, self.n - 1)
+            frac = pos - lo
+            a = self.sorted
+            out = a[lo] + (a[hi] - a[lo]) * frac
+        return float(out[0]) if np.ndim(q) == 0 else out.tolist()
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def mean(self) -> float:
+        return self._sum / self.n if self.n else float("nan")
+
+    def percentile_rank(self, values):
+        """Fracción (0-1) de la población <= valor. Escalar o array."""
+        v = np.asarray(values, dtype=np.float64)
+        if self.n == 0:
+            out = np.full(v.shape, np.nan)
+        else:
+            out = np.searchsorted(self.sorted, v, side="right") / self.n
+            out = np.where(np.isnan(v), np.nan, out)
+        return float(out) if out.ndim == 0 else out
+
+
+class PopulationStats:
+    """Estadísticas de un DataFrame filtrado (cada KPI se ordena al primer uso)."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = weakref.ref(df)
+        self._metrics: Dict[str, MetricStats] = {}
+        self._lock = threading.Lock()
+
+    def metric(self, col: str) -> MetricStats:
+        ms = self._metrics.get(col)
+        if ms is None:
+            df = self._df()
+            if df is None:
+                raise RuntimeError("El DataFrame de estas estadísticas ya no existe.")
+            ms = MetricStats(df[col])
+            with self._lock:
+                ms = self._metrics.setdefault(col, ms)
+        return ms
+
+    def quantiles(self, cols: Iterable[str], q: float) -> list[float]:
+        return [self.metric(c).quantile(q) for c in cols]
+
+    def means(self, cols: Iterable[str]) -> list[float]:
+        return [self.metric(c).mean() for c in cols]
+
+    def medians(self, cols: Iterable[str]) -> list[float]:
+        return [self.metric(c).median() for c in cols]
+
+    def percentile_rank(self, col: str, values):
+        return self.metric(col).percentile_rank(values)
+
+
+# =========================================================
+# REGISTRO (una instancia por objeto DataFrame vivo)
+# =========================================================
+_registry: Dict[int, PopulationStats] = {}
+_registry_lock = threading.Lock()
+
+
+def population_stats(df: pd.DataFrame) -> PopulationStats:
+    """Estadísticas cacheadas del frame (se descartan cuando el frame se libera)."""
+    key = id(df)
+    with _registry_lock:
+        stats = _registry.get(key)
+        if stats is not None and stats._df() is df:
+            return stats
+
+        stats = PopulationStats(df)
+        _registry[key] = stats
+
+    weakref.finalize(df, _forget, key, stats)
+    return stats
+
+
+def _forget(key: int, stats: PopulationStats) -> None:
+    with _registry_lock:
+        if _registry.get(key) is stats:
+            del _registry[key]
+
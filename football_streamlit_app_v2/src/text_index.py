@@ -0,0 +1,132 @@
+# src/text_index.py
+"""
+Columnas de texto normalizadas (sin tildes, minúsculas, sin espacios a
+los costados) para matching robusto de nombres, equipos, ligas…
+
+Por columna se factoriza UNA vez (codes + valores únicos) y se normaliza
+solo cada valor único; después:
+- norm_values(): el texto normalizado de cada fila = únicos[codes]
+- isin(): pertenencia exacta → tabla booleana por único + gather por codes
+- contains(): "contiene alguno de" → se evalúa sobre los únicos y se
+  mapea a filas con los codes (O(únicos), no O(filas))
+
+norm_index(df) devuelve la misma instancia mientras el DataFrame sea el
+mismo objeto (ss.df_filtrado solo cambia al aplicar filtros); cuando ese
+frame se libera, su índice también.
+"""
+from __future__ import annotations
+
+import threading
+import unicodedata
+import weakref
+from functools import lru_cache
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+@lru_cache(maxsize=65536)
+def _norm_str(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("utf-8").strip().lower()
+
+
+def norm_text(s) -> str:
+    """Normaliza un valor suelto (None → "")."""
+    if s is None:
+        return ""
+    if isinstance(s, str):
+        return _norm_str(s)
+    return str(s).strip().lower()
+
+
+class NormColumn:
+    """Una columna factorizada + sus valores únicos ya normalizados."""
+
+    __slots__ = ("codes", "cats")
+
+    def __init__(self, s: pd.Series):
+        codes, uniques = pd.factorize(s, sort=False)
+        self.codes = codes.astype(np.int32, copy=False)
+        # último lugar = nulo (code -1) → ""
+        self.cats = np.array([norm_text(u) for u in pd.Index(uniques).tolist()] + [""], dtype=object)
+
+    def norm_values(self, mask=None) -> np.ndarray:
+        """Texto normalizado por fila (opcionalmente solo las filas de mask)."""
+        codes = self.codes if mask is None else self.codes[mask]
+        return self.cats[codes]
+
+    def isin(self, targets: Iterable[str]) -> np.ndarray:
+        """Filas cuyo valor normalizado está en targets (ya normalizados)."""
+        targets = set(targets)
+        lut = np.fromiter((c in targets for c in self.cats), dtype=bool, count=len(self.cats))
+        return lut[self.codes]
+
+    def contains(self, needles: Iterable[str]) -> np.ndarray:
+        """Filas cuyo valor normalizado contiene alguno de needles (ya normalizados)."""
+        needles = [n for n in needles if n]
+        lut = np.fromiter(
+            (any(n in c for n in needles) for c in self.cats), dtype=bool, count=len(self.cats)
+        )
+        return lut[self.codes]
+
+
+class NormIndex:
+    """Columnas normalizadas de un DataFrame (cada una se arma al primer uso)."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = weakref.ref(df)
+        self._cols: Dict[str, NormColumn] = {}
+        self._derived: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def frame(self) -> pd.DataFrame:
+        df = self._df()
+        if df is None:
+            raise RuntimeError("El DataFrame de este índice ya no existe.")
+        return df
+
+    def column(self, col: str) -> NormColumn:
+        nc = self._cols.get(col)
+        if nc is None:
+            nc = NormColumn(self.frame()[col])
+            with self._lock:
+                nc = self._cols.setdefault(col, nc)
+        return nc
+
+    def derived(self, key: tuple, build: Callable[["NormIndex"], object]):
+        """Estructura armada a partir de este índice (p. ej. src/player_index.py), una vez."""
+        obj = self._derived.get(key)
+        if obj is None:
+            obj = build(self)
+            with self._lock:
+                obj = self._derived.setdefault(key, obj)
+        return obj
+
+
+# =========================================================
+# REGISTRO (una instancia por objeto DataFrame vivo)
+# =========================================================
+_registry: Dict[int, NormIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def norm_index(df: pd.DataFrame) -> NormIndex:
+    """Índice normalizado cacheado del frame (se descarta cuando el frame se libera)."""
+    key = id(df)
+    with _registry_lock:
+        idx = _registry.get(key)
+        if idx is not None and idx._df() is df:
+            return idx
+
+        idx = NormIndex(df)
+        _registry[key] = idx
+
+    weakref.finalize(df, _forget, key, idx)
+    return idx
+
+
+def _forget(key: int, idx: NormIndex) -> None:
+    with _registry_lock:
+        if _registry.get(key) is idx:
+            del _registry[key]
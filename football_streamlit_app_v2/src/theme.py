@@ -103,6 +103,21 @@ def apply_mpl_theme():
     })
 
 
+# =========================================================
+# MATPLOTLIB – DESTINO DEL RENDER (preview / export)
+# =========================================================
+# "preview": lienzo con fondo sólido (pantalla + copiar imagen)
+# "export":  lienzo transparente desde que se arma la figura (PNG de descarga)
+RENDER_TARGETS = ("preview", "export")
+
+
+def target_bg(render_target: str = "preview") -> str:
+    """Color del lienzo / ejes para el destino del render."""
+    if render_target not in RENDER_TARGETS:
+        raise ValueError(f"render_target inválido: {render_target!r} (usá {RENDER_TARGETS})")
+    return "none" if render_target == "export" else BG_DARK
+
+
 # =========================================================
 # STREAMLIT – THEME + CSS (FINAL SIN NARANJA + SLIDER FIX)
 # =========================================================
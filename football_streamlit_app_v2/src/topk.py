@@ -0,0 +1,62 @@
+# src/topk.py
+"""
+Los N mejores (o peores) de una métrica sin ordenar toda la columna.
+
+np.partition (introselect, lo mismo que usa argpartition) encuentra el
+k-ésimo valor en O(n) y después se ordenan solo los k de ese lado del
+umbral (O(k log k)). Sirve para cualquier "top N en tal KPI": extremos
+del scatter, tabla de similares del PCA (menor distancia = mejor), etc.
+
+- Los NaN nunca entran en el top
+- lower_is_better: el "mejor" es el valor más chico (distancias, KPIs
+  como los lower_is_better de bees)
+- bottom=True: los peores en vez de los mejores
+- Empates: gana la fila que aparece primero (igual que un sort estable)
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def top_k_positions(
+    values,
+    k: int,
+    lower_is_better: bool = False,
+    bottom: bool = False,
+) -> np.ndarray:
+    """Posiciones (0..n-1) de los k mejores valores, del mejor al peor."""
+    v = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(v))
+    k = max(0, min(int(k), len(valid)))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # "más chico primero" en todos los casos: se da vuelta el signo si hace falta
+    smallest_first = lower_is_better != bottom
+    key = v[valid] if smallest_first else -v[valid]
+
+    if k < len(valid):
+        # umbral = k-ésimo valor; los empatados en el umbral entran por orden de fila
+        thr = np.partition(key, k - 1)[k - 1]
+        less = np.flatnonzero(key < thr)
+        tied = np.flatnonzero(key == thr)[: k - len(less)]
+        part = np.concatenate([less, tied])
+    else:
+        part = np.arange(len(valid))
+
+    pos = valid[part]
+    order = np.lexsort((pos, key[part]))   # valor, y a igual valor la fila anterior
+    return pos[order]
+
+
+def top_k_frame(
+    df: pd.DataFrame,
+    col: str,
+    k: int,
+    lower_is_better: bool = False,
+    bottom: bool = False,
+) -> pd.DataFrame:
+    """Filas de df con los k mejores valores de col, ordenadas."""
+    values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return df.iloc[top_k_positions(values, k, lower_is_better=lower_is_better, bottom=bottom)]
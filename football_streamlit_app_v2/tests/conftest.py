@@ -0,0 +1,10 @@
+# tests/conftest.py
+# Los módulos se importan como en la app (streamlit corre desde esta carpeta).
+import sys
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,60 @@
+# tests/test_bands.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from charts.bees import classify_bands
+
+
+def _df(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "g": rng.integers(0, 6, size=n).astype(float),   # enteros: muchos valores caen justo en el corte
+        "a": rng.gamma(2.0, size=n),
+        "x": rng.normal(size=n),
+    })
+    for col in df:
+        df.loc[rng.random(n) < 0.1, col] = np.nan
+    return df
+
+
+def _clasificar_original(s, invertir, p_low, p_high):
+    # la regla de antes de classify_bands, fila por fila
+    p1, p2 = s.quantile([p_low, p_high])
+
+    def clasificar(v):
+        if pd.isna(v):
+            return "gris"
+        if invertir:
+            return "verde" if v <= p1 else "amarillo" if v <= p2 else "rojo"
+        else:
+            return "rojo" if v <= p1 else "amarillo" if v <= p2 else "verde"
+
+    return s.apply(clasificar).tolist(), [p1, p2]
+
+
+@pytest.mark.parametrize("quantiles", [(0.33, 0.67), (0.2, 0.8), (0.5, 0.5)])
+@pytest.mark.parametrize("lower", [set(), {"g", "x"}])
+def test_igual_que_clasificar_original(quantiles, lower):
+    df = _df()
+    metrics = ["g", "a", "x"]
+    bands, cuts = classify_bands(df, metrics, lower, quantiles=quantiles)
+    for m in metrics:
+        want, want_cuts = _clasificar_original(df[m], m in lower, *quantiles)
+        assert list(bands[m]) == want
+        np.testing.assert_allclose(cuts[m], want_cuts)
+
+
+def test_valor_igual_al_corte_va_a_la_banda_de_abajo():
+    df = pd.DataFrame({"g": [1.0, 2.0, 3.0, 4.0, 5.0, np.nan]})
+    bands, cuts = classify_bands(df, ["g"], set(), quantiles=(0.25, 0.75))
+    assert cuts["g"] == [2.0, 4.0]
+    assert list(bands["g"]) == ["rojo", "rojo", "amarillo", "amarillo", "verde", "gris"]
+
+    bands, _ = classify_bands(df, ["g"], {"g"}, quantiles=(0.25, 0.75))
+    assert list(bands["g"]) == ["verde", "verde", "amarillo", "amarillo", "rojo", "gris"]
+
+
+def test_labels_y_cortes_tienen_que_coincidir():
+    with pytest.raises(ValueError):
+        classify_bands(_df(), ["g"], set(), quantiles=(0.5,), labels=("rojo", "amarillo", "verde"))
@@ -0,0 +1,78 @@
+# tests/test_figures.py
+import io
+import threading
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from charts.bees import beeswarm_grid
+from charts.radar import graficar_radar, graficar_radares
+from charts.scatter import plot_scatter_v2
+from src.figures import FigureManager, new_figure, subplots
+
+
+def _df(n=60):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Jugador": [f"J{i}" for i in range(n)],
+        "Equipo": ["A", "B"] * (n // 2),
+        "g": rng.gamma(2.0, size=n),
+        "a": rng.gamma(3.0, size=n),
+        "p": rng.gamma(4.0, size=n),
+    })
+
+
+def _png(fig) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=30)
+    return buf.getvalue()
+
+
+def test_charts_no_pasan_por_pyplot():
+    antes = plt.get_fignums()
+    df = _df()
+    _png(beeswarm_grid(df, ["g", "a"], player=["J1"]))
+    _png(plot_scatter_v2(df, "g", "a", "Jugador", "Equipo")[0])
+    _png(graficar_radar(df, ["J1"], ["g", "a", "p"]))
+    dict(graficar_radares(df, [{"jugadores": ["J1"]}, {"jugadores": ["J2"]}], ["g", "a", "p"], _png))
+    fig, ax = subplots()
+    new_figure()
+    assert plt.get_fignums() == antes
+
+
+def test_scope_no_serializa_y_cuenta_fallidos():
+    fm = FigureManager()
+    adentro = threading.Barrier(2, timeout=5)
+
+    def render():
+        with fm.scope():
+            adentro.wait()   # con un lock global esto no llegaría nunca
+
+    hilos = [threading.Thread(target=render) for _ in range(2)]
+    for t in hilos:
+        t.start()
+    for t in hilos:
+        t.join()
+
+    with pytest.raises(RuntimeError), fm.scope():
+        raise RuntimeError("render roto")
+    assert fm.stats()["renders"] == 3
+    assert fm.stats()["renders_fallidos"] == 1
+
+
+def test_renders_en_paralelo_dan_el_mismo_png():
+    df = _df()
+    ref = _png(beeswarm_grid(df, ["g", "a"], player=["J1"]))
+    out = []
+
+    def render():
+        out.append(_png(beeswarm_grid(df, ["g", "a"], player=["J1"])))
+
+    hilos = [threading.Thread(target=render) for _ in range(4)]
+    for t in hilos:
+        t.start()
+    for t in hilos:
+        t.join()
+    assert out == [ref] * 4
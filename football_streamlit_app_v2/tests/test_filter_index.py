@@ -0,0 +1,115 @@
+# tests/test_filter_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.filter_index as fi
+from src.filter_index import FilterIndex
+
+
+def _df(n=600, seed=0, categorical=False):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Temporada": rng.choice([2021, 2022, 2023, 2024], size=n),
+        "País": rng.choice(["Argentina", "Uruguay", "Chile", None], size=n),
+        "Liga": rng.choice([f"Liga {i}" for i in range(9)], size=n),
+        "Equipo": rng.choice([f"Equipo {i:03d}" for i in range(150)], size=n),   # > BITMAP_MAX_VALUES
+        "Pie": rng.choice(["Derecho", "Izquierdo", "Ambos"], size=n),
+    })
+    if categorical:
+        for col in ("País", "Liga", "Equipo", "Pie"):
+            # con una categoría sin filas: no tiene que aparecer en las opciones
+            df[col] = df[col].astype("category").cat.add_categories(["Sin filas"])
+    return df
+
+
+def _mask(idx, bitmap):
+    return np.ones(idx.n, dtype=bool) if bitmap is None else idx.to_mask(bitmap)
+
+
+@pytest.fixture(params=[False, True], ids=["object", "category"])
+def df(request):
+    return _df(categorical=request.param)
+
+
+@pytest.fixture(params=[64, 0], ids=["bitmaps", "codes"])
+def idx(request, df, monkeypatch):
+    monkeypatch.setattr(fi, "BITMAP_MAX_VALUES", request.param)
+    return FilterIndex(df)
+
+
+@pytest.mark.parametrize("col,values", [
+    ("Temporada", [2022, 2024]),
+    ("País", ["Uruguay"]),
+    ("País", ["Chile", "No existe"]),
+    ("Liga", ["Liga 3", "Liga 0", "Liga 8"]),
+    ("Equipo", ["Equipo 007", "Equipo 149", "Equipo 020"]),
+    ("Pie", ["No existe"]),
+])
+def test_select_igual_que_isin(df, idx, col, values):
+    assert (idx.to_mask(idx.select(col, values)) == df[col].isin(values).to_numpy()).all()
+
+
+def test_select_sin_valores_no_filtra(idx):
+    assert idx.select("Liga", []) is None
+    assert idx.select("No existe", ["x"]) is None
+
+
+@pytest.mark.parametrize("col", fi.INDEX_COLUMNS)
+def test_options_igual_que_sorted_unique(df, idx, col):
+    assert idx.options(col) == sorted(df[col].dropna().unique())
+
+    # cascada: opciones dentro de una selección previa
+    bitmap = idx.intersect(idx.select("Temporada", [2023]), idx.select("Liga", ["Liga 1", "Liga 5"]))
+    sub = df[_mask(idx, bitmap)]
+    assert idx.options(col, bitmap) == sorted(sub[col].dropna().unique())
+
+
+def test_options_sin_filas(idx):
+    assert idx.options("Equipo", idx.select("Pie", ["No existe"])) == []
+
+
+# =========================================================
+# POSICIONES / ROLES (contra el parse_positions original)
+# =========================================================
+def _parse_positions(cell):
+    if pd.isna(cell):
+        return set()
+    return {p.strip() for p in str(cell).split(",") if p.strip()}
+
+
+def _positions_original(df, positions):
+    positions = set(positions)
+    return df["Posición específica"].apply(lambda x: bool(_parse_positions(x) & positions)).to_numpy(dtype=bool)
+
+
+@pytest.fixture
+def df_pos():
+    rng = np.random.default_rng(2)
+    cells = ["CB, LCB", "GK", " RW,RWF ", "CF", "DMF, CMF, AMF", "LB,LWB", "", None, np.nan, "LAMF, LW"]
+    return pd.DataFrame({"Posición específica": rng.choice(np.array(cells, dtype=object), size=400)})
+
+
+@pytest.mark.parametrize("positions", [
+    ["CB"], ["LCB", "GK"], ["RWF"], ["AMF", "LW", "CF"], fi.BASE_POSITIONS,
+])
+def test_select_positions_igual_que_el_original(df_pos, positions):
+    idx = FilterIndex(df_pos)
+    got = idx.to_mask(idx.select_positions(positions))
+    assert (got == _positions_original(df_pos, positions)).all()
+
+
+@pytest.mark.parametrize("roles", [[r] for r in fi.ROLES] + [list(fi.ROLES)[:3], ["No existe"]])
+def test_select_roles_igual_que_el_original(df_pos, roles):
+    idx = FilterIndex(df_pos)
+    positions = set()
+    for r in roles:
+        positions.update(fi.ROLES.get(r, []))
+    got = idx.to_mask(idx.select_roles(roles))
+    assert (got == _positions_original(df_pos, positions)).all()
+
+
+def test_posiciones_sin_seleccion_o_sin_columna(df_pos):
+    assert FilterIndex(df_pos).select_positions([]) is None
+    assert FilterIndex(df_pos).select_roles([]) is None
+    assert FilterIndex(_df()).select_positions(["CB"]) is None
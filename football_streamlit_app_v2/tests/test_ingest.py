@@ -0,0 +1,69 @@
+# tests/test_ingest.py
+import io
+
+import pandas as pd
+import pytest
+
+from src import ingest
+
+
+class _Upload:
+    """Lo mínimo de st.file_uploader que usa load_dataset."""
+
+    def __init__(self, data: bytes, name: str):
+        self._data, self.name = data, name
+
+    def getvalue(self) -> bytes:
+        return self._data
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def _csv() -> bytes:
+    buf = io.StringIO()
+    pd.DataFrame({"Jugador": ["Ana", "Beto"], "Goles": [1, 2], "xG": [0.5, 1.5]}).to_csv(buf, index=False)
+    return buf.getvalue().encode()
+
+
+def test_compactado_sale_de_la_variante_cacheada(cache_dir, monkeypatch):
+    up = _Upload(_csv(), "datos.csv")
+    plano, _, info = ingest.load_dataset(up)
+    assert not info["desde_cache"]
+
+    def no_parsear(*_):
+        raise AssertionError("no debería volver a parsear los bytes")
+
+    monkeypatch.setattr(ingest, "parse_bytes", no_parsear)
+    compacto, key, info = ingest.load_dataset(up, compact=True)
+    assert key.endswith("-c") and info["compactado"]
+    assert compacto["Goles"].tolist() == plano["Goles"].tolist()
+    assert (cache_dir / f"{key}.arrow").exists()
+
+
+def test_reporte_vuelve_en_los_hits_de_cache(cache_dir):
+    up = _Upload(_csv(), "datos.csv")
+    _, key, primero = ingest.load_dataset(up, compact=True)
+    assert primero["reporte"] is not None
+
+    _, _, hit = ingest.load_dataset(up, compact=True)
+    assert hit["desde_cache"]
+    assert hit["reporte"] == primero["reporte"]
+    assert ingest.read_report(ingest.dataset_key(up.getvalue(), False)) is None
+
+
+def test_memory_map_devuelve_el_frame_mapeado(cache_dir):
+    up = _Upload(_csv(), "datos.csv")
+    df, _, _ = ingest.load_dataset(up, memory_map=True)
+    # sin nulos: la columna apunta al archivo mapeado (solo lectura)
+    assert not df["Goles"].to_numpy().flags.writeable
+    assert df["Jugador"].tolist() == ["Ana", "Beto"]
+
+
+def test_memory_map_sin_cache_usa_el_parseado(cache_dir, monkeypatch):
+    monkeypatch.setattr(ingest, "write_cached", lambda *a, **k: False)
+    df, _, _ = ingest.load_dataset(_Upload(_csv(), "datos.csv"), memory_map=True)
+    assert df["Goles"].tolist() == [1, 2]
@@ -0,0 +1,63 @@
+# tests/test_player_index.py
+import pandas as pd
+
+from charts.radar import prepare_radar_values
+from src.player_index import player_index, player_label
+
+
+def _df():
+    # mismos nombres salvo acentos / mayúsculas / espacios: son jugadores distintos
+    return pd.DataFrame({
+        "Jugador": ["JOSE PEREZ ", "José Pérez", "Ana", "Ana"],
+        "Temporada": ["2023/24", "2023/24", "2022/23", "2023/24"],
+        "Equipo": ["A", "B", "C", "C"],
+        "g": [1.0, 5.0, 3.0, 4.0],
+        "a": [1.0, 2.0, 0.0, 1.0],
+        "p": [2.0, 4.0, 6.0, 8.0],
+    })
+
+
+def test_nombre_exacto_no_mezcla_acentos_ni_mayusculas():
+    df = _df()
+    *_, player_vals = prepare_radar_values(df, ["g", "a"], players=["José Pérez"], pick="first")
+    assert player_vals["José Pérez"] == [5.0, 2.0]
+
+    idx = player_index(df)
+    assert idx.rows("José Pérez").tolist() == [1]
+    assert idx.rows("JOSE PEREZ").tolist() == [0]
+    assert idx.ambiguous(["José Pérez", "JOSE PEREZ"]) == {}
+
+
+def test_respaldo_por_nombre_normalizado():
+    # sin coincidencia exacta se busca sin acentos / mayúsculas
+    assert player_index(_df()).rows("ana ").tolist() == [2, 3]
+
+
+def test_pick_y_temporada():
+    idx = player_index(_df())
+    assert idx.position("Ana") == 2
+    assert idx.position("Ana", pick="latest") == 3
+    assert idx.position(("Ana", "2022/23")) == 2
+    assert idx.ambiguous(["Ana"]) == {"Ana": 2}
+
+
+def test_opciones_y_clave_con_temporada():
+    df = _df()
+    idx = player_index(df)
+    assert idx.options("Ana") == [("Ana", "2022/23"), ("Ana", "2023/24")]
+    assert idx.options("José Pérez") == [("José Pérez", "2023/24")]
+    assert player_label(("Ana", "2023/24")) == "Ana (2023/24)"
+
+    *_, player_vals = prepare_radar_values(df, ["g", "a"], players=[("Ana", "2023/24")])
+    assert player_vals[("Ana", "2023/24")] == [4.0, 1.0]
+
+
+def test_radar_pasa_pick_y_titulos():
+    import matplotlib.pyplot as plt
+
+    from charts.radar import graficar_radar
+
+    fig = graficar_radar(_df(), [("Ana", "2022/23")], ["g", "a", "p"])
+    textos = [t.get_text() for ax in fig.axes for t in ax.texts]
+    plt.close(fig)
+    assert "Ana (2022/23)" in textos
@@ -0,0 +1,81 @@
+# tests/test_scatter.py
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from charts.scatter import _contains_mask, _norm, plot_scatter_v2
+
+
+def test_jugadores_no_filtra():
+    """jugadores se acepta pero no filtra (semántica original de charts/scatter.py)."""
+    df = pd.DataFrame({
+        "Jugador": ["Ana", "Beto", "Carla"],
+        "Equipo": ["A", "B", "A"],
+        "x": [1.0, 2.0, 3.0],
+        "y": [3.0, 2.0, 1.0],
+    })
+    fig, df_f = plot_scatter_v2(df, "x", "y", "Jugador", "Equipo", jugadores=["Ana"])
+    plt.close(fig)
+    assert df_f["Jugador"].tolist() == ["Ana", "Beto", "Carla"]
+
+
+def test_equipos_si_filtra():
+    df = pd.DataFrame({
+        "Jugador": ["Ana", "Beto", "Carla"],
+        "Equipo": ["A", "B", "A"],
+        "x": [1.0, 2.0, 3.0],
+        "y": [3.0, 2.0, 1.0],
+    })
+    fig, df_f = plot_scatter_v2(df, "x", "y", "Jugador", "Equipo", equipos=["a"])
+    plt.close(fig)
+    assert df_f["Jugador"].tolist() == ["Ana", "Carla"]
+
+
+def _contains_original(df, col, values):
+    # el _apply_contains de antes: fila por fila sobre astype(str)
+    vals = [_norm(v) for v in values if str(v).strip() != ""]
+    return df[col].astype(str).apply(lambda x: any(v in _norm(x) for v in vals)).to_numpy()
+
+
+@pytest.fixture
+def df_texto():
+    return pd.DataFrame({
+        "Equipo": ["Atlético Nacional", "ATLETICO TUCUMÁN", " Peñarol ", "Nacional", "Unión",
+                   "atlético nacional", "Vélez", "Unión"],
+        "Temporada": [2023, 2024, 2023, 2022, 2024, 2023, 2022, 2024],
+        "Pie": pd.Categorical(["Derecho", "Izquierdo", "Derecho", "Ambos", "Derecho",
+                               "Izquierdo", "Derecho", "Ambos"]),
+    })
+
+
+@pytest.mark.parametrize("col,values", [
+    ("Equipo", ["atletico"]),
+    ("Equipo", ["NACIONAL", "peñarol"]),
+    ("Equipo", ["  union ", ""]),
+    ("Equipo", ["velez", "tucuman"]),
+    ("Temporada", ["2023"]),
+    ("Temporada", [2024, "22"]),
+    ("Pie", ["der", "AMB"]),
+])
+def test_contains_igual_que_el_original(df_texto, col, values):
+    assert (_contains_mask(df_texto, col, values) == _contains_original(df_texto, col, values)).all()
+
+
+def test_contains_nulos_ya_no_matchean_nan():
+    df = pd.DataFrame({"Equipo": ["Nacional", None, np.nan, "Banfield"]})
+    # antes astype(str) convertía los nulos en "none" / "nan" y "n" los agarraba
+    assert _contains_original(df, "Equipo", ["n"]).tolist() == [True, True, True, True]
+    assert _contains_mask(df, "Equipo", ["n"]).tolist() == [True, False, False, True]
+    # fuera de los nulos, lo mismo que antes
+    notna = df["Equipo"].notna().to_numpy()
+    for values in (["ban"], ["NA", "field"], ["x"]):
+        got = _contains_mask(df, "Equipo", values)
+        assert (got == (_contains_original(df, "Equipo", values) & notna)).all()
+        assert not got[~notna].any()
+
+
+def test_contains_sin_valores_no_filtra(df_texto):
+    assert _contains_mask(df_texto, "Equipo", None) is None
+    assert _contains_mask(df_texto, "Equipo", ["", "  "]) is None
+    assert _contains_mask(df_texto, "No existe", ["a"]) is None
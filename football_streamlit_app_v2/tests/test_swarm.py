@@ -0,0 +1,46 @@
+# tests/test_swarm.py
+import numpy as np
+import pytest
+
+from charts.swarm import SWARM_GAP, SWARM_KNEE, swarm_offsets, swarm_scatter
+from src.figures import subplots
+
+
+def _min_dist(x, y):
+    d = np.hypot(x[:, None] - x[None, :], y[:, None] - y[None, :])
+    np.fill_diagonal(d, np.inf)
+    return d.min()
+
+
+@pytest.mark.parametrize("dist", ["normal", "exponential"])
+def test_layout_sin_solapes(dist):
+    rng = np.random.default_rng(0)
+    x = getattr(rng, dist)(size=1500) * 20
+    y = swarm_offsets(x)
+    assert _min_dist(x, y) >= SWARM_GAP - 1e-9
+
+
+def _dibujar(n, height):
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=n)
+    fig, ax = subplots(figsize=(6, height), dpi=100)
+    ax.set_ylim(-0.5, 0.5)
+    points = swarm_scatter(ax, values, np.tile([0.0, 0.0, 1.0, 1.0], (n, 1)), 4.0)
+    fig.canvas.draw()
+    return ax, points
+
+
+def test_swarm_denso_achica_el_marcador_y_sigue_sin_solapes():
+    ax, points = _dibujar(800, 2.0)
+    diam_px = np.sqrt(points.get_sizes()[0]) * ax.figure.dpi / 72.0
+    assert diam_px < 4.0 * ax.figure.dpi / 72.0   # se achicó para entrar
+
+    px = ax.transData.transform(points.get_offsets())
+    assert _min_dist(px[:, 0], px[:, 1]) >= diam_px * SWARM_GAP * 0.999
+    # entra en la parte lineal: _soft_clip no tocó nada
+    assert np.abs(points.get_offsets()[:, 1]).max() <= SWARM_KNEE * 0.4 + 1e-9
+
+
+def test_swarm_que_no_entra_queda_dentro_del_ancho():
+    _, points = _dibujar(5000, 1.0)
+    assert np.abs(points.get_offsets()[:, 1]).max() < 0.4
@@ -0,0 +1,45 @@
+# tests/test_topk.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.topk import top_k_frame, top_k_positions
+
+
+def _df(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    v = rng.integers(0, 12, size=n).astype(float)   # muchos empates
+    v[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({"Jugador": [f"J{i}" for i in range(n)], "v": v})
+
+
+def _esperado(df, col, k, lower_is_better, bottom):
+    ascending = lower_is_better != bottom
+    return df.dropna(subset=[col]).sort_values(col, ascending=ascending, kind="stable").head(k)
+
+
+@pytest.mark.parametrize("lower_is_better", [False, True])
+@pytest.mark.parametrize("bottom", [False, True])
+@pytest.mark.parametrize("k", [0, 1, 5, 37, 360, 1000])
+def test_igual_que_sort_estable(k, lower_is_better, bottom):
+    df = _df()
+    got = top_k_frame(df, "v", k, lower_is_better=lower_is_better, bottom=bottom)
+    pd.testing.assert_frame_equal(got, _esperado(df, "v", k, lower_is_better, bottom))
+
+
+def test_empates_en_el_umbral_entran_por_orden_de_fila():
+    v = [3.0, 5.0, 5.0, 1.0, 5.0, 5.0]
+    assert top_k_positions(v, 3).tolist() == [1, 2, 4]
+    assert top_k_positions(v, 2, lower_is_better=True).tolist() == [3, 0]
+    assert top_k_positions(v, 3, bottom=True).tolist() == [3, 0, 1]
+
+
+def test_nan_nunca_entran():
+    v = [np.nan, 2.0, np.nan, 1.0]
+    assert top_k_positions(v, 10).tolist() == [1, 3]
+    assert top_k_positions([np.nan, np.nan], 1).tolist() == []
+
+
+def test_columna_no_numerica_se_coerciona():
+    df = pd.DataFrame({"v": ["3", "x", "10", None]})
+    assert top_k_frame(df, "v", 2).index.tolist() == [2, 0]
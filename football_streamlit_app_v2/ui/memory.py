@@ -0,0 +1,26 @@
+# ui/memory.py
+import streamlit as st
+
+from src.figures import memory_stats
+
+
+# =========================================================
+# PANEL DE MEMORIA (sidebar, opt-in: medir también cuesta)
+# =========================================================
+def render_memory_panel():
+    if not st.sidebar.toggle("🧠 Ver memoria", key="show_memory_panel"):
+        return
+
+    m = memory_stats()
+    with st.sidebar:
+        c1, c2 = st.columns(2)
+        c1.metric("Proceso (RSS)", f"{m['rss_mb']:.0f} MB")
+        c2.metric("Figuras abiertas", m["figuras_abiertas"])
+        st.caption(
+            f"Caché de renders: {m['render_cache_mb']:.1f} MB · "
+            f"Datasets: {m['datasets_mb']:.1f} MB · "
+            f"Fondos de radar: {m['radar_fondos_mb']:.0f} MB · "
+            f"Imágenes de esta sesión: {m['sesion_imgs_mb']:.1f} MB"
+        )
+        if m["renders_fallidos"]:
+            st.caption(f"⚠️ Renders fallidos: {m['renders_fallidos']} (de {m['renders']} renders)")